@@ -0,0 +1,223 @@
+# :Title: async_loop.py
+# :Description: asyncio event loop running alongside the Qt event loop with hand-off to the gui thread
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from asyncio import AbstractEventLoop, new_event_loop, run_coroutine_threadsafe
+from concurrent.futures import CancelledError, Future
+from threading import Event, Lock, Thread
+from traceback import format_exc
+from typing import Any, Callable, Coroutine
+
+from PySide6.QtCore import QObject, Qt, Signal
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+from backend.log_context.log_context import bind_fields, current_fields
+from backend.profiling.profiling import SessionProfiler
+from data.classes.singleton import Singleton
+
+
+class AsyncLoop(Singleton):
+    """
+    Owns the asyncio event loop that backend coroutines run on. The loop lives on its
+    own thread so slow coroutines can never hold up the Qt event loop.
+
+    Args:
+        Singleton (Singleton): AsyncLoop inherits from Singleton class
+    """
+
+    def __init__(self) -> None:
+        self.loop: AbstractEventLoop = None
+        """ The asyncio event loop, created on first use """
+        self.thread: Thread = None
+        """ The thread running the asyncio event loop """
+
+        self._lock = Lock()
+
+    def start(self) -> AbstractEventLoop:
+        """
+        Method to start the asyncio loop thread if it isn't running yet
+
+        Returns:
+            AbstractEventLoop: The running asyncio event loop
+        """
+        with self._lock:
+            if self.loop is None:
+                self.loop = new_event_loop()
+                self.thread = Thread(
+                    target=self.loop.run_forever, name="AsyncLoop", daemon=True
+                )
+                self.thread.start()
+                SessionProfiler.instance().register_thread(self.call_in_loop)
+        return self.loop
+
+    def call_in_loop(self, fn: Callable) -> None:
+        """
+        Method to run a plain function on the loop thread and wait for it, never call from the loop itself
+
+        Args:
+            fn (Callable): The function to run
+        """
+        done = Event()
+
+        def run() -> None:
+            try:
+                fn()
+            finally:
+                done.set()
+
+        self.loop.call_soon_threadsafe(run)
+        done.wait()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        Method to schedule a coroutine on the asyncio loop from any thread, it logs with the
+        contextual log fields of the caller
+
+        Args:
+            coro (Coroutine): The coroutine to run
+
+        Returns:
+            Future: Thread safe future resolved with the result of the coroutine
+        """
+        return run_coroutine_threadsafe(_run_with_fields(coro, current_fields()), self.start())
+
+    def stop(self) -> None:
+        """
+        Method to stop the asyncio loop and wait for its thread, called when the app quits.
+        """
+        if self.loop is None:
+            return
+        SessionProfiler.instance().unregister_thread(self.call_in_loop)
+        with self._lock:
+            loop, thread = self.loop, self.thread
+            self.loop = self.thread = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def on_reset(self) -> None:
+        """
+        Hook run when the singleton is reset, stops the loop thread.
+        """
+        self.stop()
+
+
+async def _run_with_fields(coro: Coroutine, fields: dict[str, str]) -> Any:
+    """
+    Runs a coroutine with contextual log fields bound. Every asyncio task has its own copy of the
+    context, so the fields stay with this task and the tasks it creates.
+
+    Args:
+        coro (Coroutine): The coroutine to run
+        fields (dict[str, str]): The fields of the caller
+
+    Returns:
+        Any: The result of the coroutine
+    """
+    bind_fields(**fields)
+    return await coro
+
+
+class BackendCall:
+    """
+    Awaitable for gui coroutines that runs a backend coroutine on the asyncio loop.
+    Only await it inside a GuiCoroutine, never inside a coroutine on the asyncio loop.
+    """
+
+    def __init__(self, coro: Coroutine) -> None:
+        self.future: Future = AsyncLoop.instance().submit(coro)
+        """ Future of the backend coroutine on the asyncio loop """
+
+    def cancel(self) -> bool:
+        """
+        Method to cancel the backend coroutine
+
+        Returns:
+            bool: Whether or not the cancellation was requested
+        """
+        return self.future.cancel()
+
+    def __await__(self):
+        # The GuiCoroutine driving this receives the future and sends back its result
+        return (yield self.future)
+
+
+class GuiCoroutine(QObject):
+    """
+    Drives a coroutine on the gui thread, resuming it each time an awaited BackendCall resolves
+
+    Args:
+        QObject (QObject): GuiCoroutine inherits from QObject
+    """
+
+    _running: set["GuiCoroutine"] = set()
+    """ Keeps coroutines alive while they wait on the backend """
+
+    _resume = Signal(object)
+    """ Emitted from the asyncio thread with the resolved future, queued onto the gui thread """
+
+    def __init__(self, coro: Coroutine) -> None:
+        super().__init__()
+        self.coro: Coroutine = coro
+        """ The coroutine being driven """
+
+        self._resume.connect(self._step, Qt.QueuedConnection)
+        GuiCoroutine._running.add(self)
+        self._step(None)
+
+    def _step(self, future: Future) -> None:
+        """
+        Method to run the coroutine until it awaits the next backend call or returns.
+
+        Args:
+            future (Future): The future the coroutine was waiting on, None to start it
+        """
+        try:
+            if future is None:
+                awaited = self.coro.send(None)
+            elif future.cancelled():
+                awaited = self.coro.throw(CancelledError())
+            elif future.exception() is not None:
+                awaited = self.coro.throw(future.exception())
+            else:
+                awaited = self.coro.send(future.result())
+        except StopIteration:
+            GuiCoroutine._running.discard(self)
+            return
+        except CancelledError:
+            GuiCoroutine._running.discard(self)
+            ConsoleLogger.instance().log(
+                f"Gui coroutine {self.coro.__qualname__} cancelled", ConsoleLevel.DEBUG
+            )
+            return
+        except Exception:
+            GuiCoroutine._running.discard(self)
+            ConsoleLogger.instance().log(
+                f"Gui coroutine {self.coro.__qualname__} failed\n{format_exc()}",
+                ConsoleLevel.ERROR,
+            )
+            return
+
+        if not isinstance(awaited, Future):
+            self.coro.close()
+            GuiCoroutine._running.discard(self)
+            ConsoleLogger.instance().log(
+                f"Gui coroutine {self.coro.__qualname__} awaited {awaited!r}, "
+                "only backend calls can be awaited on the gui thread",
+                ConsoleLevel.ERROR,
+            )
+            return
+        awaited.add_done_callback(self._resume.emit)
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether or not the coroutine has finished
+
+        Returns:
+            bool: True once the coroutine returned, raised or was cancelled
+        """
+        return self not in GuiCoroutine._running
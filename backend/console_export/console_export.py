@@ -0,0 +1,47 @@
+# :Title: console_export.py
+# :Description: Streams the retained console history to disk in chunks off the gui thread
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from gzip import open as gzip_open
+from pathlib import Path
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+from backend.task_runner.task_runner import TaskContext
+
+CHUNK_LINES = 5000
+""" Number of records formatted and written per chunk """
+
+
+def export_console_history(
+    context: TaskContext, path: Path, levels: set[ConsoleLevel] = None
+) -> int:
+    """
+    Task that writes the retained console history to a file, gzip compressed if the path ends in .gz
+
+    Args:
+        context (TaskContext): Context of the running task, used for progress and cancellation
+        path (Path): The file to write
+        levels (set[ConsoleLevel], optional): Levels to keep. Defaults to every level.
+
+    Returns:
+        int: Number of records written
+    """
+    records = ConsoleLogger.instance().history_snapshot()
+    if levels is not None:
+        records = [record for record in records if record[1] in levels]
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    opener = gzip_open if path.suffix == ".gz" else open
+    with opener(path, "wt", encoding="utf-8") as log_file:
+        for start in range(0, len(records), CHUNK_LINES):
+            context.check_cancelled()
+            chunk = records[start : start + CHUNK_LINES]
+            log_file.write(
+                "".join(f"{time} - {level.name} - {msg}\n" for time, level, msg in chunk)
+            )
+            context.report_progress((start + len(chunk)) / len(records))
+    return len(records)
@@ -1,11 +1,11 @@
 # :Title: console_logging.py
 # :Description: console logging for the entire project
 # :Created: 5/31/2024
-# :Last Modified: 6/1/2024
+# :Last Modified: 10/19/2026
 # :Author: Robert Greenslade
 
 # Imports
-from datetime import datetime
+from collections import deque
 from enum import Enum
 from logging import (
     CRITICAL,
@@ -17,17 +17,33 @@ from logging import (
     Formatter,
     Logger,
     LogRecord,
-    StreamHandler,
     getLogger,
 )
-from sys import stderr, stdout
+from os import environ
+from threading import Lock
+from time import localtime, strftime, time
+from typing import TextIO
 
 from colorama import Fore, Style
-from PySide6.QtCore import QObject, Qt
-from PySide6.QtGui import QTextCursor
-
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtGui import QTextCharFormat, QTextCursor
+
+from backend.log_context.log_context import FieldFilter, current_fields, format_fields, record_fields
+from backend.log_sinks.log_sinks import (
+    DropPolicy,
+    LogSink,
+    SinkConfig,
+    SinkFlusher,
+    SinkKind,
+    default_sink_configs,
+)
 from data.classes.singleton import Singleton
 
+HISTORY_LIMIT = 100_000
+""" Number of most recent console msgs retained for saving the log """
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+""" Format of the time shown at the start of every msg """
+
 
 class LevelFilter(Filter):
     """
@@ -37,8 +53,8 @@ class LevelFilter(Filter):
         Filter (logging.Filter): LevelFilter inherits from Filter
     """
 
-    def __init__(self, level):
-        self.__level = level
+    def __init__(self, levels: set[int]):
+        self.__levels = frozenset(levels)
 
     def filter(self, record: LogRecord) -> bool:
         """
@@ -50,7 +66,46 @@ class LevelFilter(Filter):
         Returns:
             bool: Whether or not to display this level on the handler
         """
-        return record.levelno == self.__level
+        return record.levelno in self.__levels
+
+
+class LevelFormatter(Formatter):
+    """
+    Formatter holding a format for every level, built once with or without colorama codes.
+    The time comes from the time_text the ConsoleLogger attaches to its records.
+    With fields the contextual fields are added, they are only resolved and formatted here.
+
+    Args:
+        Formatter (logging.Formatter): LevelFormatter inherits from Formatter
+    """
+
+    def __init__(self, color: bool, fields: bool = False):
+        super().__init__()
+        self.fields: bool = fields
+        """ Whether or not the contextual fields are shown """
+        self.formatters: dict[int, Formatter] = {}
+        """ The formatter of each logging level """
+        for levelno, ansi_color in STREAM_COLORS.items():
+            fmt = "%(time_text)s - %(levelname)s - %(message)s"
+            if fields:
+                fmt = "%(time_text)s - %(levelname)s - %(fields_text)s - %(message)s"
+            if color and ansi_color:
+                fmt = f"{ansi_color}{fmt}{Style.RESET_ALL}"
+            self.formatters[levelno] = Formatter(fmt)
+
+    def format(self, record: LogRecord) -> str:
+        """
+        The override method of formatting a record with the format of its level
+
+        Args:
+            record (LogRecord): The record to format
+
+        Returns:
+            str: The formatted line
+        """
+        if self.fields:
+            record.fields_text = format_fields(record_fields(record))
+        return self.formatters[record.levelno].format(record)
 
 
 class ConsoleLevel(Enum):
@@ -73,6 +128,122 @@ class ConsoleLevel(Enum):
     """ Enhanced error messages that could put the state of the program in jeopardy """
 
 
+CONSOLE_COLORS = {
+    ConsoleLevel.DEBUG: Qt.cyan,
+    ConsoleLevel.INFO: Qt.white,
+    ConsoleLevel.WARNING: Qt.yellow,
+    ConsoleLevel.ERROR: Qt.red,
+    ConsoleLevel.CRITICAL: Qt.red,
+}
+""" The color each level is shown in on the gui console """
+
+STREAM_COLORS = {
+    DEBUG: Fore.BLUE,
+    INFO: "",
+    WARNING: Fore.YELLOW,
+    ERROR: Fore.RED,
+    CRITICAL: Fore.RED,
+}
+""" The colorama color each logging level is printed in on color streams """
+
+
+class ConsoleBridge(QObject):
+    """
+    Collects console msgs from any thread and appends them on the gui thread in batches
+
+    Args:
+        QObject (QObject): ConsoleBridge inherits from QObject
+    """
+
+    _flush_requested = Signal()
+    """ Emitted when the first msg of a new batch arrives, always queued onto the gui thread """
+
+    def __init__(self, console: QObject) -> None:
+        super().__init__()
+        self.console: QObject = console
+        """ The console in the ui to print to """
+        self.formats: dict[ConsoleLevel, QTextCharFormat] = {}
+        """ The text format of each level, built once """
+        for level, color in CONSOLE_COLORS.items():
+            self.formats[level] = QTextCharFormat()
+            self.formats[level].setForeground(color)
+
+        self.max_pending: int = 0
+        """ Msgs that can wait for the gui before drop_policy applies, 0 for no limit """
+        self.drop_policy: DropPolicy = DropPolicy.BLOCK
+        """ Which msgs are thrown away once max_pending is reached, block never drops """
+        self.flush_interval: float = 0.0
+        """ Seconds a new batch waits on the gui thread before it is appended """
+        self.dropped: int = 0
+        """ Number of msgs thrown away """
+        self.flushes: int = 0
+        """ Number of batches appended to the console """
+        self.rendered: int = 0
+        """ Number of msgs appended to the console """
+
+        self._pending: list[tuple[str, ConsoleLevel]] = []
+        self._lock = Lock()
+        self._flush_requested.connect(self._schedule_flush, Qt.QueuedConnection)
+
+    def configure(self, config: SinkConfig) -> None:
+        """
+        Method to apply the buffer and drop settings of the console sink
+
+        Args:
+            config (SinkConfig): The console sink config
+        """
+        self.max_pending = config.buffer_size
+        self.drop_policy = config.drop_policy
+        self.flush_interval = config.flush_interval
+
+    def append(self, entries: list[tuple[str, ConsoleLevel]]) -> None:
+        """
+        Method to queue msgs for the console, safe to call from any thread
+
+        Args:
+            entries (list[tuple[str, ConsoleLevel]]): The (msg, level) pairs, each msg ending in a newline
+        """
+        with self._lock:
+            first = not self._pending
+            self._pending.extend(entries)
+            over = len(self._pending) - self.max_pending
+            if self.max_pending and over > 0 and self.drop_policy != DropPolicy.BLOCK:
+                if self.drop_policy == DropPolicy.DROP_OLDEST:
+                    del self._pending[:over]
+                else:
+                    del self._pending[-over:]
+                self.dropped += over
+        if first:
+            self._flush_requested.emit()
+
+    def _schedule_flush(self) -> None:
+        """
+        Method run on the gui thread for every new batch, appends it now or after flush_interval.
+        """
+        if self.flush_interval > 0:
+            QTimer.singleShot(int(self.flush_interval * 1000), self.flush)
+        else:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Method run on the gui thread to append every queued msg with a single cursor edit.
+        """
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+        cursor = QTextCursor(self.console.console_text.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for msg, level in batch:
+            cursor.insertText(msg, self.formats[level])
+        cursor.endEditBlock()
+        self.console.console_text.moveCursor(QTextCursor.End)
+        self.flushes += 1
+        self.rendered += len(batch)
+
+
 class ConsoleLogger(Singleton):
     """
     The Console Logger that will be used throughout the project files
@@ -82,28 +253,89 @@ class ConsoleLogger(Singleton):
     """
 
     def __init__(self) -> None:
-        if hasattr(self, "_instantiated"):
-            return
-        self._instantiated: bool = True
-        """ Whether or not the console logger has already been created """
         self.logger: Logger = None
         """ The logger that will be used to display msgs to user """
         self.levels: set[ConsoleLevel] = None
         """ The levels the user has selected to show. """
         self.console: QObject = None
         """ The console in the ui to print to """
-
+        self.bridge: ConsoleBridge = None
+        """ Delivers msgs to the console on the gui thread """
+        self.history: deque[tuple[str, ConsoleLevel, str]] = deque(maxlen=HISTORY_LIMIT)
+        """ The most recent (time, level, msg) records that were printed """
+        self.forwarder = None
+        """ In child processes, the channel that sends msgs to the parent instead of printing them """
+        self.color_mode: bool = None
+        """ Force colorama codes on (True) or off (False), None to only color terminals """
+        self.sink_configs: list[SinkConfig] = default_sink_configs()
+        """ The configured outputs, see backend.log_sinks """
+        self.sinks: list[LogSink] = []
+        """ The open outputs built from sink_configs """
+        self.flusher: SinkFlusher = None
+        """ Writes out buffered sinks after their flush interval """
+        self.console_fields: bool = False
+        """ Whether or not the gui console shows the contextual fields, sinks can also turn them on in their config """
+        self.console_filter: FieldFilter = FieldFilter()
+        """ Contextual fields a msg needs to show on the gui console, other outputs are unaffected """
+
+        self._history_lock = Lock()
+        self._time_cache: tuple[int, str] = (-1, "")
+        self._levels_by_value: dict[int, ConsoleLevel] = {level.value: level for level in ConsoleLevel}
         self.setup_logger()
         self.enable_all()
 
     def set_console(self, console: QObject) -> None:
         """
-        Setter for the self.console instance variable
+        Setter for the self.console instance variable, must be called from the gui thread
 
         Args:
             console (QObject): The console to echo the msgs to
         """
         self.console = console
+        self.bridge = ConsoleBridge(console) if console else None
+        self._configure_bridge()
+
+    def set_forwarder(self, forwarder) -> None:
+        """
+        Setter for the self.forwarder instance variable, used in child processes
+
+        Args:
+            forwarder (ChildLogChannel): Channel with send(level, msg) and flush() methods
+        """
+        self.forwarder = forwarder
+
+    def set_sink_configs(self, sink_configs: list[SinkConfig]) -> None:
+        """
+        Setter for the configured outputs, closes the old sinks and opens the new ones
+
+        Args:
+            sink_configs (list[SinkConfig]): Configs from load_sink_configs
+        """
+        self.sink_configs = list(sink_configs)
+        self.setup_logger()
+
+    def flush(self) -> None:
+        """
+        Method to push out any msgs that are still buffered.
+        """
+        if self.forwarder is not None:
+            self.forwarder.flush()
+        for sink in list(self.sinks):
+            sink.flush()
+
+    def dropped_records(self) -> dict[str, int]:
+        """
+        Method to count the msgs each sink threw away under its drop policy
+
+        Returns:
+            dict[str, int]: Dropped msgs by sink name
+        """
+        dropped = {}
+        for sink in list(self.sinks):
+            dropped[sink.config.name] = sink.dropped
+            if sink.config.kind == SinkKind.CONSOLE and self.bridge:
+                dropped[sink.config.name] += self.bridge.dropped
+        return dropped
 
     def set_debug_mode(self, debug_mode: bool) -> None:
         """
@@ -129,33 +361,130 @@ class ConsoleLogger(Singleton):
             bool: Whether or not the message printed
         """
         if level in self.levels:
-            time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            match level:
-                case ConsoleLevel.DEBUG:
-                    self.logger.debug(msg)
-                    self._show_in_console(f"{time} - DEBUG - {msg}\n", Qt.cyan)
-                case ConsoleLevel.INFO:
-                    self.logger.info(msg)
-                    self._show_in_console(f"{time} - INFO - {msg}\n", Qt.white)
-                case ConsoleLevel.WARNING:
-                    self.logger.warning(msg)
-                    self._show_in_console(f"{time} - WARNING - {msg}\n", Qt.yellow)
-                case ConsoleLevel.ERROR:
-                    self.logger.error(msg)
-                    self._show_in_console(f"{time} - ERROR - {msg}\n", Qt.red)
-                case ConsoleLevel.CRITICAL:
-                    self.logger.critical(msg)
-                    self._show_in_console(f"{time} - CRITICAL - {msg}\n", Qt.red)
+            if self.forwarder is not None:
+                self.forwarder.send(level, msg)
+                return True
+            time_text = self._now()
+            with self._history_lock:
+                self.history.append((time_text, level, msg))
+            self.logger.log(level.value, msg, extra={"time_text": time_text, "log_fields": current_fields()})
             return True
         return False
 
-    def _show_in_console(self, msg: str, color) -> None:
-        if self.console:
-            old_color = self.console.console_text.textColor()
-            self.console.console_text.moveCursor(QTextCursor.End)
-            self.console.console_text.setTextColor(color)
-            self.console.console_text.insertPlainText(msg)
-            self.console.console_text.setTextColor(old_color)
+    def history_snapshot(self) -> list[tuple[str, ConsoleLevel, str]]:
+        """
+        Method to copy the retained history, safe to call from any thread
+
+        Returns:
+            list[tuple[str, ConsoleLevel, str]]: The (time, level, msg) records, oldest first
+        """
+        with self._history_lock:
+            return list(self.history)
+
+    def show_entries(self, entries: list[tuple[str, ConsoleLevel]]) -> None:
+        """
+        Method to show already formatted msgs on the gui console only, safe to call from any thread
+
+        Args:
+            entries (list[tuple[str, ConsoleLevel]]): The (msg, level) pairs, each msg ending in a newline
+        """
+        if self.bridge and entries:
+            self.bridge.append(entries)
+
+    def set_console_fields(self, console_fields: bool) -> None:
+        """
+        Setter for showing the contextual fields on the gui console, applies to the next msg
+
+        Args:
+            console_fields (bool): Whether or not to show the fields
+        """
+        self.console_fields = console_fields
+        for sink in self.sinks:
+            if sink.config.kind == SinkKind.CONSOLE:
+                sink.writer.setFormatter(LevelFormatter(False, sink.config.fields or console_fields))
+
+    def set_console_filter(self, fields: dict[str, str]) -> None:
+        """
+        Setter for the contextual fields a msg needs to show on the gui console, applies to the next msg
+
+        Args:
+            fields (dict[str, str]): Value by field name, empty to show every msg
+        """
+        self.console_filter.fields = dict(fields)
+
+    def set_color_mode(self, color_mode: bool) -> None:
+        """
+        Setter for the color mode of the output streams
+
+        Args:
+            color_mode (bool): True to always color, False to never color, None to color only terminals
+        """
+        self.color_mode = color_mode
+        self.setup_logger()
+
+    def _show_in_console(self, msg: str, levelno: int) -> None:
+        """
+        Method the console sink hands its formatted msgs to
+
+        Args:
+            msg (str): The formatted msg ending in a newline
+            levelno (int): The logging level of the msg
+        """
+        if self.bridge:
+            self.bridge.append([(msg, self._levels_by_value[levelno])])
+
+    def _configure_bridge(self) -> None:
+        """
+        Method to apply the console sink settings to the console bridge.
+        """
+        if self.bridge is None:
+            return
+        for sink_config in self.sink_configs:
+            if sink_config.kind == SinkKind.CONSOLE:
+                self.bridge.configure(sink_config)
+
+    def _now(self) -> str:
+        """
+        Method to get the current time text, only formatted again once a new second starts
+
+        Returns:
+            str: The current time in DATE_FORMAT
+        """
+        now = int(time())
+        second, text = self._time_cache
+        if now != second:
+            text = strftime(DATE_FORMAT, localtime(now))
+            self._time_cache = (now, text)
+        return text
+
+    def _use_color(self, stream: TextIO, configured: bool = None) -> bool:
+        """
+        Method to decide if colorama codes are written to a stream
+
+        Args:
+            stream (TextIO): The output stream
+            configured (bool, optional): The color setting of the sink. Defaults to None.
+
+        Returns:
+            bool: Whether or not to color the stream
+        """
+        if self.color_mode is not None:
+            return self.color_mode
+        if configured is not None:
+            return configured
+        if "NO_COLOR" in environ:
+            return False
+        if "FORCE_COLOR" in environ:
+            return True
+        isatty = getattr(stream, "isatty", None)
+        return bool(isatty and isatty())
+
+    def on_reset(self) -> None:
+        """
+        Hook run when the singleton is reset, detaches the handlers so a fresh logger doesn't double them.
+        """
+        self._close_sinks()
+        self.set_console(None)
 
     def enable_all(self) -> None:
         """
@@ -175,65 +504,40 @@ class ConsoleLogger(Singleton):
         """
         Method to instantiate the self.logger with all requirements and functionality
         """
-        # Delete old logger if needed
+        # Detach and write out the old sinks if needed
         if self.logger:
-            del self.logger
+            self._close_sinks()
 
         # Initiating the logger
         self.logger = getLogger("Logger")
         self.logger.setLevel(DEBUG)
 
-        # Handlers
-        debug_handler = StreamHandler(stdout)
-        debug_handler.setLevel(DEBUG)
-        info_handler = StreamHandler(stdout)
-        info_handler.setLevel(INFO)
-        warning_handler = StreamHandler(stdout)
-        warning_handler.setLevel(WARNING)
-        error_handler = StreamHandler(stderr)
-        error_handler.setLevel(ERROR)
-        critical_handler = StreamHandler(stderr)
-        critical_handler.setLevel(CRITICAL)
-
-        # Formatters
-        debug_formatter = Formatter(
-            f"{Fore.BLUE}%(asctime)s - %(levelname)s - %(message)s{Style.RESET_ALL}",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        info_formatter = Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        warning_formatter = Formatter(
-            f"{Fore.YELLOW}%(asctime)s - %(levelname)s - %(message)s{Style.RESET_ALL}",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        error_formatter = Formatter(
-            f"{Fore.RED}%(asctime)s - %(levelname)s - %(message)s{Style.RESET_ALL}",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        critical_formatter = Formatter(
-            f"{Fore.RED}%(asctime)s - %(levelname)s - %(message)s{Style.RESET_ALL}",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-
-        # Set handler formatters
-        debug_handler.setFormatter(debug_formatter)
-        info_handler.setFormatter(info_formatter)
-        warning_handler.setFormatter(warning_formatter)
-        error_handler.setFormatter(error_formatter)
-        critical_handler.setFormatter(critical_formatter)
-
-        # Add filters
-        debug_handler.addFilter(LevelFilter(DEBUG))
-        info_handler.addFilter(LevelFilter(INFO))
-        warning_handler.addFilter(LevelFilter(WARNING))
-        error_handler.addFilter(LevelFilter(ERROR))
-        critical_handler.addFilter(LevelFilter(CRITICAL))
-
-        # Add Handlers
-        self.logger.addHandler(debug_handler)
-        self.logger.addHandler(info_handler)
-        self.logger.addHandler(warning_handler)
-        self.logger.addHandler(error_handler)
-        self.logger.addHandler(critical_handler)
+        # One handler per configured sink, each only passing its own levels
+        for sink_config in self.sink_configs:
+            sink = LogSink(sink_config, self._show_in_console)
+            color = False
+            fields = sink_config.fields
+            if sink_config.kind == SinkKind.STREAM:
+                color = self._use_color(sink.writer.stream, sink_config.color)
+            if sink_config.kind == SinkKind.CONSOLE:
+                fields = fields or self.console_fields
+                sink.handler.addFilter(self.console_filter)
+            sink.writer.setFormatter(LevelFormatter(color, fields))
+            sink.handler.addFilter(LevelFilter(sink_config.levels))
+            self.logger.addHandler(sink.handler)
+            self.sinks.append(sink)
+        self.flusher = SinkFlusher(self.sinks)
+        self._configure_bridge()
+
+    def _close_sinks(self) -> None:
+        """
+        Method to detach the sinks from the logger and write out what they still buffer.
+        """
+        if self.flusher is not None:
+            self.flusher.stop()
+            self.flusher = None
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        sinks, self.sinks = self.sinks, []
+        for sink in sinks:
+            sink.close()
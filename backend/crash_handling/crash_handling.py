@@ -0,0 +1,226 @@
+# :Title: crash_handling.py
+# :Description: Routes unhandled exceptions into the console logger and writes out buffered logs before a crash
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+import faulthandler
+import signal
+import sys
+import threading
+from atexit import register, unregister
+from datetime import datetime
+from os import getpid
+from pathlib import Path
+from traceback import format_exception
+from types import FrameType, TracebackType
+from typing import Callable, TextIO
+
+from PySide6.QtCore import QCoreApplication, QTimer
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+from data.classes.singleton import Singleton
+
+CRASH_DIR = (
+    Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).resolve().parents[2]
+).joinpath("crashes")
+""" Folder the crash files are written to, in the project (next to the executable of a build) whatever the
+working folder """
+EXIT_SIGNALS = [name for name in ("SIGTERM", "SIGHUP", "SIGBREAK") if hasattr(signal, name)]
+""" Signals that ask the app to close, handled by flushing the logs and quitting """
+
+
+class CrashHandler(Singleton):
+    """
+    Logs unhandled exceptions of the gui thread and any other thread at CRITICAL and flushes every sink
+    right after, so aggressive buffering never hides what led to a crash. Exit signals flush and quit,
+    fatal signals (segfaults and aborts) have faulthandler dump the stack of every thread to a crash file,
+    no python code can run at that point so only records already written survive them.
+
+    Args:
+        Singleton (Singleton): CrashHandler inherits from Singleton class
+    """
+
+    def __init__(self) -> None:
+        self.crash_path: Path = None
+        """ File faulthandler writes to on a fatal signal, removed on exit if nothing was written """
+        self.quit_app: Callable[[], None] = None
+        """ Called after an exit signal is logged, None raises SystemExit instead """
+        self.installed: bool = False
+        """ Whether or not the hooks are in place """
+        self.exit_signal: int = None
+        """ Exit signal received and not logged yet """
+
+        self._crash_file: TextIO = None
+        self._previous_hooks: tuple = None
+        self._previous_signals: dict[int, object] = {}
+
+    def install(self, quit_app: Callable[[], None] = None) -> None:
+        """
+        Method to install the exception hooks and the exit signal handlers, call from the main thread.
+        Installing again only updates quit_app.
+
+        Args:
+            quit_app (Callable[[], None], optional): Closes the app on an exit signal, like QApplication.quit.
+                Defaults to None.
+        """
+        if self.installed:
+            self.quit_app = quit_app or self.quit_app
+            return
+        self.quit_app = quit_app
+        self._previous_hooks = (sys.excepthook, threading.excepthook)
+        sys.excepthook = self._on_exception
+        threading.excepthook = self._on_thread_exception
+        for name in EXIT_SIGNALS:
+            number = getattr(signal, name)
+            self._previous_signals[number] = signal.signal(number, self._on_exit_signal)
+        register(self.uninstall)
+        self.installed = True
+
+    def open_crash_file(self, crash_dir: Path = CRASH_DIR) -> None:
+        """
+        Method to have faulthandler dump the stacks of every thread to a crash file on a fatal signal.
+        Call once the gui launches so runs that exit early never leave a file behind.
+
+        Args:
+            crash_dir (Path, optional): Folder for the crash file. Defaults to CRASH_DIR.
+        """
+        if self._crash_file is not None:
+            return
+        crash_dir = Path(crash_dir)
+        crash_dir.mkdir(parents=True, exist_ok=True)
+        self.crash_path = crash_dir.joinpath(
+            f"crash_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{getpid()}.log"
+        )
+        self._crash_file = open(self.crash_path, "w")
+        faulthandler.enable(self._crash_file, all_threads=True)
+
+    def uninstall(self) -> None:
+        """
+        Method to restore the previous hooks and remove the crash file if it stayed empty, runs at exit.
+        """
+        if not self.installed:
+            return
+        self.installed = False
+        unregister(self.uninstall)
+        # An exit signal without an app to quit ends in SystemExit, it is logged here once the stack unwound
+        if self.exit_signal is not None:
+            self._log_exit_signal()
+            self.flush_logs()
+        sys.excepthook, threading.excepthook = self._previous_hooks
+        for number, handler in self._previous_signals.items():
+            signal.signal(number, handler)
+        self._previous_signals.clear()
+
+        if self._crash_file is not None:
+            faulthandler.disable()
+            self._crash_file.close()
+            self._crash_file = None
+            if self.crash_path.stat().st_size == 0:
+                self.crash_path.unlink(missing_ok=True)
+
+    def on_reset(self) -> None:
+        """
+        Hook run when the singleton is reset, restores the previous hooks.
+        """
+        self.uninstall()
+
+    def flush_logs(self) -> None:
+        """
+        Method to write out every buffered sink and the standard streams, never raises.
+        """
+        try:
+            ConsoleLogger.instance().flush()
+        except Exception:
+            pass
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+
+    def _on_exception(
+        self, error_type: type[BaseException], error: BaseException, error_traceback: TracebackType
+    ) -> None:
+        """
+        sys.excepthook replacement for the main thread, also runs for exceptions raised in Qt slots
+
+        Args:
+            error_type (type[BaseException]): Type of the exception
+            error (BaseException): The exception
+            error_traceback (TracebackType): Its traceback
+        """
+        if issubclass(error_type, KeyboardInterrupt):
+            self._previous_hooks[0](error_type, error, error_traceback)
+            return
+        self._log_crash("Unhandled exception", error_type, error, error_traceback)
+
+    def _on_thread_exception(self, args: threading.ExceptHookArgs) -> None:
+        """
+        threading.excepthook replacement for every other thread
+
+        Args:
+            args (threading.ExceptHookArgs): The exception and the thread it ended
+        """
+        if issubclass(args.exc_type, SystemExit):
+            return
+        name = args.thread.name if args.thread else "unknown"
+        self._log_crash(f"Unhandled exception in thread {name}", args.exc_type, args.exc_value, args.exc_traceback)
+
+    def _log_crash(
+        self,
+        title: str,
+        error_type: type[BaseException],
+        error: BaseException,
+        error_traceback: TracebackType,
+    ) -> None:
+        """
+        Logs an unhandled exception at CRITICAL and flushes, falls back to the previous hook if logging fails
+
+        Args:
+            title (str): What happened
+            error_type (type[BaseException]): Type of the exception
+            error (BaseException): The exception
+            error_traceback (TracebackType): Its traceback
+        """
+        try:
+            details = "".join(format_exception(error_type, error, error_traceback)).rstrip()
+            ConsoleLogger.instance().log(f"{title}\n{details}", ConsoleLevel.CRITICAL)
+        except Exception:
+            sys.__excepthook__(error_type, error, error_traceback)
+        self.flush_logs()
+
+    def _on_exit_signal(self, number: int, frame: FrameType) -> None:
+        """
+        Handler of the exit signals. It can interrupt the main thread while that holds a logger lock,
+        so it only records the signal and leaves logging, flushing and quitting to the event loop.
+        Without an app to quit it raises SystemExit and the signal is logged at exit.
+
+        Args:
+            number (int): The signal
+            frame (FrameType): The frame that was running
+        """
+        self.exit_signal = number
+        if self.quit_app is None or QCoreApplication.instance() is None:
+            raise SystemExit(128 + number)
+        QTimer.singleShot(0, self._on_exit_requested)
+
+    def _on_exit_requested(self) -> None:
+        """
+        Logs and flushes a received exit signal from the event loop, then closes the app.
+        """
+        self._log_exit_signal()
+        self.flush_logs()
+        if self.quit_app is not None:
+            self.quit_app()
+
+    def _log_exit_signal(self) -> None:
+        """
+        Logs the received exit signal once
+        """
+        number, self.exit_signal = self.exit_signal, None
+        if number is not None:
+            ConsoleLogger.instance().log(
+                f"Received {signal.Signals(number).name}, shutting down", ConsoleLevel.WARNING
+            )
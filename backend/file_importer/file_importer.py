@@ -0,0 +1,260 @@
+# :Title: file_importer.py
+# :Description: Streams csv and binary record files into column store files in chunks off the gui thread
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from array import array
+from csv import reader
+from itertools import islice
+from math import nan
+from pathlib import Path
+from struct import Struct
+from time import perf_counter
+from typing import BinaryIO, Iterator, Sequence
+
+from backend.console_logging.console_logging import ConsoleLogger
+from backend.task_runner.task_runner import TaskContext
+from data.classes.column_store import TYPECODES, ColumnStoreWriter
+
+CHUNK_ROWS = 65_536
+""" Rows parsed and written per chunk, peak memory is about one chunk no matter the file size """
+LOG_INTERVAL = 2.0
+""" Seconds between progress msgs on the console """
+
+
+class ImportProgress:
+    """
+    Progress update an import sends through its TaskHandle.progress signal
+    """
+
+    def __init__(self, fraction: float, rows: int, bytes_read: int, total_bytes: int, eta: float) -> None:
+        self.fraction: float = fraction
+        """ Share of the file read, between 0 and 1 """
+        self.rows: int = rows
+        """ Rows imported so far """
+        self.bytes_read: int = bytes_read
+        """ Bytes of the file read so far """
+        self.total_bytes: int = total_bytes
+        """ Size of the file """
+        self.eta: float = eta
+        """ Estimated seconds left, None until it can be estimated """
+
+
+class _ProgressReporter:
+    """
+    Sends ImportProgress after every chunk and logs it with the ETA every LOG_INTERVAL seconds
+    """
+
+    def __init__(self, context: TaskContext, path: Path) -> None:
+        self.context = context
+        self.path = path
+        self.total_bytes = max(path.stat().st_size, 1)
+        self.start = perf_counter()
+        self.last_log = self.start
+
+    def update(self, bytes_read: int, rows: int) -> None:
+        now = perf_counter()
+        fraction = min(bytes_read / self.total_bytes, 1.0)
+        elapsed = now - self.start
+        eta = elapsed * (1 - fraction) / fraction if fraction and elapsed > 0 else None
+        self.context.report_progress(ImportProgress(fraction, rows, bytes_read, self.total_bytes, eta))
+        if now - self.last_log >= LOG_INTERVAL and eta is not None:
+            self.last_log = now
+            ConsoleLogger.instance().log(
+                f"Importing {self.path.name}: {fraction:.0%}, {rows:,} rows, about {eta:.1f}s left"
+            )
+
+    def finish(self, rows: int, output: Path) -> None:
+        ConsoleLogger.instance().log(
+            f"Imported {rows:,} rows from {self.path.name} into {output.name} "
+            f"in {perf_counter() - self.start:.2f}s"
+        )
+
+
+class _CountingLines:
+    """
+    Iterates the decoded lines of a binary file while counting the bytes read, csv.reader pulls from it
+    """
+
+    def __init__(self, csv_file: BinaryIO, encoding: str) -> None:
+        self.csv_file = csv_file
+        self.encoding = encoding
+        self.bytes_read = 0
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self.csv_file:
+            self.bytes_read += len(line)
+            yield line.decode(self.encoding)
+
+
+def import_csv(
+    context: TaskContext,
+    path: Path,
+    output: Path,
+    delimiter: str = ",",
+    types: dict[str, str] = None,
+    encoding: str = "utf-8",
+) -> Path:
+    """
+    Task that imports a csv file with a header row into a column store file
+
+    Args:
+        context (TaskContext): Context of the running task, used for progress and cancellation
+        path (Path): The csv file
+        output (Path): The column store file to write
+        delimiter (str, optional): The field delimiter. Defaults to ",".
+        types (dict[str, str], optional): 'q', 'd' or 'text' by column, the rest is inferred
+            (whole numbers, then decimals, then text) from the first chunk and turns text if a later
+            chunk holds text. Defaults to None.
+        encoding (str, optional): Text encoding of the file. Defaults to "utf-8".
+
+    Raises:
+        ValueError: A number column given in types holds a value that isn't a number
+
+    Returns:
+        Path: The written store file
+    """
+    path, output = Path(path), Path(output)
+    progress = _ProgressReporter(context, path)
+    writer = ColumnStoreWriter(output)
+    try:
+        with open(path, "rb") as csv_file:
+            lines = _CountingLines(csv_file, encoding)
+            rows = reader(lines, delimiter=delimiter)
+            names = next(rows, [])
+            kinds = dict(types or {})
+            while chunk := list(islice(rows, CHUNK_ROWS)):
+                context.check_cancelled()
+                if any(len(row) != len(names) for row in chunk):
+                    raise ValueError(f"{path.name} has rows without {len(names)} fields near row {writer.rows}")
+                columns = {}
+                for name, values in zip(names, zip(*chunk)):
+                    kinds.setdefault(name, _infer_kind(values))
+                    try:
+                        columns[name], kinds[name] = _parse_column(name, values, kinds[name])
+                    except ValueError:
+                        if types and name in types:
+                            raise
+                        # The writer rewrites the numbers spilled so far as text
+                        columns[name], kinds[name] = list(values), "text"
+                writer.append(columns)
+                progress.update(lines.bytes_read, writer.rows)
+            # A header without rows still gives the store its columns
+            if not writer.rows:
+                writer.append(
+                    {name: [] if kinds.get(name, "text") == "text" else array(kinds[name]) for name in names}
+                )
+    except BaseException:
+        writer.discard()
+        raise
+    writer.close()
+    progress.finish(writer.rows, output)
+    return output
+
+
+def import_binary(
+    context: TaskContext,
+    path: Path,
+    output: Path,
+    columns: list[tuple[str, str]],
+    byte_order: str = "<",
+) -> Path:
+    """
+    Task that imports a file of fixed size records into a column store file
+
+    Args:
+        context (TaskContext): Context of the running task, used for progress and cancellation
+        path (Path): The binary file, records back to back with no header
+        output (Path): The column store file to write
+        columns (list[tuple[str, str]]): (name, typecode) of every field of a record, in order
+        byte_order (str, optional): struct byte order of the file. Defaults to "<" (little endian).
+
+    Raises:
+        ValueError: A typecode isn't supported or the file ends in a partial record
+
+    Returns:
+        Path: The written store file
+    """
+    path, output = Path(path), Path(output)
+    for name, typecode in columns:
+        if typecode not in TYPECODES:
+            raise ValueError(f"Column {name} has unsupported typecode '{typecode}'")
+    record = Struct(byte_order + "".join(typecode for _, typecode in columns))
+    progress = _ProgressReporter(context, path)
+    writer = ColumnStoreWriter(output)
+    bytes_read = 0
+    try:
+        with open(path, "rb") as binary_file:
+            while chunk := binary_file.read(record.size * CHUNK_ROWS):
+                context.check_cancelled()
+                if len(chunk) % record.size:
+                    raise ValueError(f"{path.name} ends in a partial record")
+                bytes_read += len(chunk)
+                fields = zip(*record.iter_unpack(chunk))
+                writer.append(
+                    {name: array(typecode, values) for (name, typecode), values in zip(columns, fields)}
+                )
+                progress.update(bytes_read, writer.rows)
+    except BaseException:
+        writer.discard()
+        raise
+    writer.close()
+    progress.finish(writer.rows, output)
+    return output
+
+
+def _infer_kind(values: Sequence[str]) -> str:
+    """
+    Picks the narrowest kind every non empty value of a column fits
+
+    Args:
+        values (Sequence[str]): The first chunk of the column
+
+    Returns:
+        str: 'q' for whole numbers, 'd' for decimals and 'text' for anything else
+    """
+    present = [value for value in values if value]
+    for kind, parse in (("q", int), ("d", float)):
+        try:
+            for value in present:
+                parse(value)
+        except ValueError:
+            continue
+        return "q" if kind == "q" and len(present) == len(values) else "d"
+    return "text"
+
+
+def _parse_column(name: str, values: Sequence[str], kind: str) -> tuple[Sequence, str]:
+    """
+    Parses a chunk of a column, whole number columns turn decimal once a decimal or empty value shows up
+
+    Args:
+        name (str): The column name, used in errors
+        values (Sequence[str]): The raw values of the chunk
+        kind (str): 'q', 'd' or 'text'
+
+    Raises:
+        ValueError: A number column holds a value that isn't a number
+
+    Returns:
+        tuple[Sequence, str]: The parsed chunk and the kind of the column from now on
+    """
+    if kind == "text":
+        return list(values), kind
+    if kind == "q":
+        try:
+            return array("q", map(int, values)), kind
+        except ValueError:
+            kind = "d"
+    try:
+        return array("d", map(float, values)), kind
+    except ValueError:
+        pass
+    # Slow path only for chunks with empty fields, which become nan
+    try:
+        return array("d", (float(value) if value else nan for value in values)), kind
+    except ValueError as error:
+        raise ValueError(f"Column {name} holds a value that isn't a number ({error})") from error
+
@@ -0,0 +1,152 @@
+# :Title: lod_pyramid.py
+# :Description: Min/max level of detail pyramid for drawing long signals at screen resolution
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from array import array
+from hashlib import sha256
+from typing import Callable, Sequence
+
+from backend.result_cache.result_cache import memoize
+
+BASE_BIN = 8
+""" Samples per bin on the first level """
+LEVEL_FACTOR = 4
+""" Bins of a level merged into one bin of the level above """
+TOP_BINS = 1024
+""" Levels stop once a level has at most this many bins """
+BLOCK_VALUES = 262_144
+""" Values reduced per pass through C, other threads (the gui) get the GIL between blocks """
+PYRAMID_CACHE_BYTES = 512 * 1024 * 1024
+""" Bytes of pyramids, samples included, cached_pyramid keeps in memory """
+
+
+def reduce_bins(values: Sequence[float], factor: int, func: Callable) -> array:
+    """
+    Reduces every factor consecutive values into one with min or max.
+    Runs in C: map calls func with one strided memoryview slice per position in the bin, no python loop per value.
+    C holds the GIL throughout, so the values are reduced BLOCK_VALUES at a time to keep a gui thread responsive.
+
+    Args:
+        values (Sequence[float]): 'd' array or memoryview of the values
+        factor (int): Values per bin
+        func (Callable): min or max
+
+    Returns:
+        array: One value per bin ('d' array), the last bin may be partial
+    """
+    view = values if isinstance(values, memoryview) else memoryview(values)
+    full = len(view) // factor * factor
+    block = max(BLOCK_VALUES // factor, 1) * factor
+    reduced = array("d")
+    for start in range(0, full, block):
+        stop = min(start + block, full)
+        reduced.extend(map(func, *(view[start + offset:stop:factor] for offset in range(factor))))
+    if full < len(view):
+        reduced.append(func(view[full:]))
+    return reduced
+
+
+class MinMaxPyramid:
+    """
+    The min and max of a signal over bins of BASE_BIN * LEVEL_FACTOR ** level samples.
+    Building it touches every sample a couple of times, every level after the first is a quarter of the one before.
+    """
+
+    def __init__(self, values: Sequence[float]) -> None:
+        view = memoryview(values if isinstance(values, (array, memoryview)) else array("d", values))
+        # envelope hands out raw samples once zoomed in, so other number types are converted once up front
+        self.values: memoryview = view if view.format == "d" else memoryview(array("d", view))
+        """ The raw samples as doubles """
+        self.levels: list[tuple[int, array, array]] = []
+        """ (samples per bin, mins, maxs) of every level, finest first """
+
+        if len(self.values) > BASE_BIN:
+            bin_size = BASE_BIN
+            mins = reduce_bins(self.values, BASE_BIN, min)
+            maxs = reduce_bins(self.values, BASE_BIN, max)
+            self.levels.append((bin_size, mins, maxs))
+            while len(mins) > TOP_BINS:
+                bin_size *= LEVEL_FACTOR
+                mins = reduce_bins(mins, LEVEL_FACTOR, min)
+                maxs = reduce_bins(maxs, LEVEL_FACTOR, max)
+                self.levels.append((bin_size, mins, maxs))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + self.values.nbytes
+            + sum(mins.itemsize * len(mins) * 2 for _, mins, _ in self.levels)
+        )
+
+    def envelope(self, start: int, stop: int, pixels: int) -> tuple[int, int, Sequence[float], Sequence[float]]:
+        """
+        Method to get about one min and max per pixel for a range of samples
+
+        Args:
+            start (int): First sample shown
+            stop (int): Sample after the last one shown
+            pixels (int): Width to draw in
+
+        Returns:
+            tuple[int, int, Sequence[float], Sequence[float]]: (sample the first entry starts at, samples per entry,
+                mins, maxs). Zoomed in past the first level there is one entry per sample and mins and maxs
+                are both the raw samples.
+        """
+        start, stop = max(0, start), min(len(self.values), stop)
+        samples_per_pixel = max(1, -(-(stop - start) // max(1, pixels)))
+
+        # Coarsest level whose bins still fit within a pixel, rounded up so there is at most about one entry per pixel
+        chosen = None
+        for level in self.levels:
+            if level[0] > samples_per_pixel:
+                break
+            chosen = level
+        if chosen is None:
+            raw = self.values[start:stop]
+            return start, 1, raw, raw
+
+        bin_size, mins, maxs = chosen
+        first, last = start // bin_size, -(-stop // bin_size)
+        mins, maxs = memoryview(mins)[first:last], memoryview(maxs)[first:last]
+
+        # Merge the bins that share a pixel so the drawing cost only depends on the width
+        merge = -(-samples_per_pixel // bin_size)
+        if merge > 1:
+            return first * bin_size, bin_size * merge, reduce_bins(mins, merge, min), reduce_bins(maxs, merge, max)
+        return first * bin_size, bin_size, mins, maxs
+
+
+def sample_digest(values: Sequence[float]) -> str:
+    """
+    Identifies a signal by its samples, hashed without copying them
+
+    Args:
+        values (Sequence[float]): Array or memoryview of the samples
+
+    Returns:
+        str: The sample format, count and sha256 of the sample bytes
+    """
+    view = memoryview(values if isinstance(values, (array, memoryview)) else array("d", values))
+    digest = sha256(view if view.c_contiguous else view.tobytes()).hexdigest()
+    return f"{view.format}:{len(view)}:{digest}"
+
+
+@memoize(max_entries=16, max_bytes=PYRAMID_CACHE_BYTES, name="Signal pyramids", key=sample_digest)
+def cached_pyramid(values: Sequence[float]) -> MinMaxPyramid:
+    """
+    Builds the pyramid of a signal, a signal shown before is found by its samples instead of built again.
+    The cached pyramid holds on to the samples, they must not change afterwards.
+
+    Args:
+        values (Sequence[float]): 'd' array or memoryview of the samples
+
+    Returns:
+        MinMaxPyramid: The pyramid of the signal
+    """
+    return MinMaxPyramid(values)
@@ -0,0 +1,131 @@
+# :Title: log_context.py
+# :Description: Contextual log fields bound through contextvars and resolved when a record is emitted
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from logging import Filter, LogRecord
+from typing import Iterator
+
+CONTEXT_FIELDS = ("page", "task", "thread", "process")
+""" The contextual fields in the order they are shown, thread and process come from the record itself """
+
+_bound_fields: ContextVar[dict[str, str]] = ContextVar("log_fields", default={})
+""" Fields bound in the current context, never changed in place so a lookup is a single get """
+
+
+def current_fields() -> dict[str, str]:
+    """
+    Gets the fields bound in the current context, cheap enough to call on every log call
+
+    Returns:
+        dict[str, str]: The bound fields, must not be changed
+    """
+    return _bound_fields.get()
+
+
+def bind_fields(**fields: str) -> Token:
+    """
+    Binds fields in the current context. New threads start without fields, TaskRunner tasks and
+    AsyncLoop coroutines start with the fields of whoever submitted them.
+
+    Args:
+        fields (str): Values by field name, None removes a field
+
+    Returns:
+        Token: Token to hand to reset_fields to restore the fields from before
+    """
+    bound = dict(_bound_fields.get())
+    for name, value in fields.items():
+        if value is None:
+            bound.pop(name, None)
+        else:
+            bound[name] = str(value)
+    return _bound_fields.set(bound)
+
+
+def reset_fields(token: Token) -> None:
+    """
+    Restores the fields from before a bind_fields call
+
+    Args:
+        token (Token): The token bind_fields returned
+    """
+    _bound_fields.reset(token)
+
+
+@contextmanager
+def log_fields(**fields: str) -> Iterator[None]:
+    """
+    Binds fields for the length of a with block
+
+    Args:
+        fields (str): Values by field name, None removes a field
+    """
+    token = bind_fields(**fields)
+    try:
+        yield
+    finally:
+        reset_fields(token)
+
+
+def record_fields(record: LogRecord) -> dict[str, str]:
+    """
+    Resolves the fields of an emitted record, bound thread and process fields win over the record's own
+
+    Args:
+        record (LogRecord): A ConsoleLogger record, carrying the bound fields as log_fields
+
+    Returns:
+        dict[str, str]: Every field that has a value
+    """
+    fields = {"thread": record.threadName, "process": record.processName}
+    fields.update(getattr(record, "log_fields", None) or {})
+    return fields
+
+
+def format_fields(fields: dict[str, str]) -> str:
+    """
+    Formats fields for a log line
+
+    Args:
+        fields (dict[str, str]): Values by field name
+
+    Returns:
+        str: name=value pairs in CONTEXT_FIELDS order followed by any other field
+    """
+    names = [name for name in CONTEXT_FIELDS if name in fields]
+    names += sorted(name for name in fields if name not in CONTEXT_FIELDS)
+    return " ".join(f"{name}={fields[name]}" for name in names)
+
+
+class FieldFilter(Filter):
+    """
+    Only passes records whose contextual fields match, changes apply to the next record
+
+    Args:
+        Filter (logging.Filter): FieldFilter inherits from Filter
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fields: dict[str, str] = {}
+        """ Value every passed record needs by field name, empty passes everything """
+
+    def filter(self, record: LogRecord) -> bool:
+        """
+        The override method of matching the fields of a record
+
+        Args:
+            record (LogRecord): The record to check
+
+        Returns:
+            bool: Whether or not every filtered field matches
+        """
+        if not self.fields:
+            return True
+        fields = record_fields(record)
+        return all(fields.get(name) == value for name, value in self.fields.items())
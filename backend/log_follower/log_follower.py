@@ -0,0 +1,204 @@
+# :Title: log_follower.py
+# :Description: Follows log files written by other processes and shows new lines on the console
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from collections import deque
+from os import fstat, stat
+from pathlib import Path
+from re import compile
+from threading import Event, Thread
+from typing import BinaryIO
+
+from PySide6.QtCore import QObject, QTimer
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+
+POLL_INTERVAL = 0.2
+""" Seconds between checks of the followed file for new bytes """
+MAX_READ_BYTES = 1 << 20
+""" Most bytes read from the file per poll """
+INITIAL_TAIL_BYTES = 64 << 10
+""" Bytes from the end of the file shown when following starts """
+RENDER_INTERVAL_MS = 100
+""" Milliseconds between batches rendered on the console """
+MAX_ENTRIES_PER_RENDER = 500
+""" Most entries rendered per batch, keeps a fast growing file from starving the gui """
+MAX_BACKLOG = 20_000
+""" Most entries waiting to be rendered, older ones are skipped past this """
+
+LINE_PATTERN = compile(
+    r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - (.*)$"
+)
+""" Matches the "%Y-%m-%d %H:%M:%S - LEVEL - msg" format ConsoleLogger writes """
+ANSI_PATTERN = compile(r"\x1b\[[0-9;]*m")
+""" Matches the colorama escape codes of redirected stream output """
+
+
+class LogFollower(QObject):
+    """
+    Reads only the bytes appended to a log file on a background thread, survives rotation and
+    truncation, and renders parsed entries on the console in rate limited batches.
+    Must be created on the gui thread.
+
+    Args:
+        QObject (QObject): LogFollower inherits from QObject
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self.path: Path = Path(path)
+        """ The followed log file """
+        self.skipped: int = 0
+        """ Number of entries skipped because the console couldn't keep up """
+
+        self._pending: deque[tuple[str, ConsoleLevel]] = deque()
+        self._reported_skipped: int = 0
+        self._partial: bytes = b""
+        self._level: ConsoleLevel = ConsoleLevel.INFO
+        self._stop = Event()
+        self._thread: Thread = None
+        self._render_timer = QTimer(self)
+        self._render_timer.timeout.connect(self._render)
+
+    def start(self) -> None:
+        """
+        Method to start following the file.
+        """
+        self._stop.clear()
+        self._thread = Thread(target=self._follow, name="LogFollower", daemon=True)
+        self._thread.start()
+        self._render_timer.start(RENDER_INTERVAL_MS)
+        ConsoleLogger.instance().log(f"Following {self.path}")
+
+    def stop(self) -> None:
+        """
+        Method to stop following the file, entries not rendered yet are dropped.
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self._render_timer.stop()
+        self._pending.clear()
+        ConsoleLogger.instance().log(f"Stopped following {self.path}")
+
+    def _follow(self) -> None:
+        """
+        Method run on the follower thread that polls the file for appended bytes.
+        """
+        log_file: BinaryIO = None
+        first_open = True
+        try:
+            while not self._stop.is_set():
+                if log_file is None:
+                    log_file = self._open(first_open)
+                    first_open = False
+                if log_file is not None:
+                    log_file = self._read_new_bytes(log_file)
+                self._stop.wait(POLL_INTERVAL)
+        finally:
+            if log_file is not None:
+                log_file.close()
+
+    def _open(self, first_open: bool) -> BinaryIO:
+        """
+        Method to open the followed file, starting near its end the first time.
+
+        Args:
+            first_open (bool): Whether or not this is the first time the file is opened
+
+        Returns:
+            BinaryIO: The opened file, None if it doesn't exist yet
+        """
+        try:
+            log_file = open(self.path, "rb")
+        except OSError:
+            return None
+        if first_open:
+            size = fstat(log_file.fileno()).st_size
+            if size > INITIAL_TAIL_BYTES:
+                log_file.seek(size - INITIAL_TAIL_BYTES)
+                log_file.readline()  # Drop the partial first line
+        self._partial = b""
+        return log_file
+
+    def _read_new_bytes(self, log_file: BinaryIO) -> BinaryIO:
+        """
+        Method to read what was appended since the last poll and handle rotation and truncation.
+
+        Args:
+            log_file (BinaryIO): The open followed file
+
+        Returns:
+            BinaryIO: The file to keep reading, None if it was rotated away
+        """
+        try:
+            on_disk = stat(self.path)
+        except OSError:
+            on_disk = None
+        opened = fstat(log_file.fileno())
+
+        rotated = on_disk is None or on_disk.st_ino != opened.st_ino
+        if not rotated and on_disk.st_size < log_file.tell():
+            # Truncated in place, start over from the beginning
+            log_file.seek(0)
+            self._partial = b""
+
+        chunk = log_file.read(MAX_READ_BYTES)
+        if chunk:
+            self._parse(chunk)
+        elif rotated:
+            # Rotated, the old file has been read to its end so switch to the new one
+            log_file.close()
+            return None
+        return log_file
+
+    def _parse(self, chunk: bytes) -> None:
+        """
+        Method to split new bytes into lines and queue the parsed entries for rendering.
+
+        Args:
+            chunk (bytes): The bytes read from the file
+        """
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        name = self.path.name
+        for raw_line in lines:
+            line = ANSI_PATTERN.sub("", raw_line.decode("utf-8", errors="replace")).rstrip("\r")
+            match = LINE_PATTERN.match(line)
+            if match:
+                time, level_name, msg = match.groups()
+                self._level = ConsoleLevel[level_name]
+                text = f"{time} - {level_name} - [{name}] {msg}\n"
+            else:
+                # Continuation lines such as tracebacks keep the level of their entry
+                text = f"{line}\n"
+            self._pending.append((text, self._level))
+        overflow = len(self._pending) - MAX_BACKLOG
+        for _ in range(max(overflow, 0)):
+            self._pending.popleft()
+            self.skipped += 1
+
+    def _render(self) -> None:
+        """
+        Method run on the gui thread that shows the next batch of pending entries.
+        """
+        logger = ConsoleLogger.instance()
+        batch = []
+        skipped = self.skipped
+        if skipped > self._reported_skipped:
+            batch.append(
+                (
+                    f"... {skipped - self._reported_skipped} lines of {self.path.name} skipped\n",
+                    ConsoleLevel.WARNING,
+                )
+            )
+            self._reported_skipped = skipped
+        while self._pending and len(batch) < MAX_ENTRIES_PER_RENDER:
+            text, level = self._pending.popleft()
+            if level in logger.levels:
+                batch.append((text, level))
+        logger.show_entries(batch)
@@ -0,0 +1,175 @@
+# :Title: log_forwarding.py
+# :Description: Forwards console msgs from child processes into the parent ConsoleLogger
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from multiprocessing import Queue, current_process, get_context
+from multiprocessing.util import Finalize
+from os import getpid
+from threading import Lock, Thread, current_thread
+from time import sleep
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+from backend.log_context.log_context import bind_fields, current_fields, reset_fields
+from data.classes.singleton import Singleton
+
+BATCH_SIZE = 256
+""" Number of records a child buffers before sending them in one batch """
+FLUSH_INTERVAL = 0.05
+""" Seconds between background flushes of a child buffer """
+PROCESS_CONTEXT = get_context("spawn")
+""" Start method of worker processes, forking a process that runs the gui and logger threads can deadlock
+on a lock one of those threads held at the time """
+
+
+class ChildLogChannel:
+    """
+    Buffers console msgs in a child process and sends them to the parent in batches
+    """
+
+    def __init__(self, queue: Queue) -> None:
+        self.queue: Queue = queue
+        """ Queue shared with the parent LogForwarder """
+        self.pid: int = getpid()
+        """ Id of the child process, tagged on every batch """
+        self.process_name: str = current_process().name
+        """ Name of the child process, tagged on every batch for the process log field """
+        self.buffer: list[tuple[int, str, dict[str, str], str]] = []
+        """ (level value, msg, bound log fields, thread name) records waiting to be sent """
+
+        self._lock = Lock()
+        Thread(target=self._flush_periodically, name="LogChannel", daemon=True).start()
+        # Runs when the multiprocessing child exits, atexit handlers don't
+        Finalize(self, self.flush, exitpriority=100)
+
+    def send(self, level: ConsoleLevel, msg: str) -> None:
+        """
+        Method to buffer a msg with the contextual fields of the child, the batch is sent right away once it is full
+
+        Args:
+            level (ConsoleLevel): The level of the msg
+            msg (str): The msg
+        """
+        with self._lock:
+            # Unchanged fields and thread names are the same objects, pickle sends them once per batch
+            self.buffer.append((level.value, msg, current_fields(), current_thread().name))
+            full = len(self.buffer) >= BATCH_SIZE
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Method to send every buffered msg to the parent.
+        """
+        with self._lock:
+            batch, self.buffer = self.buffer, []
+        if batch:
+            self.queue.put((self.pid, self.process_name, batch))
+
+    def _flush_periodically(self) -> None:
+        """
+        Method run on a background thread so quiet children still deliver their last msgs quickly.
+        """
+        while True:
+            sleep(FLUSH_INTERVAL)
+            if self.buffer:
+                self.flush()
+
+
+def install_log_forwarding(queue: Queue, levels: set[ConsoleLevel]) -> None:
+    """
+    Process initializer that sends every console msg of the child to the parent
+
+    Args:
+        queue (Queue): The LogForwarder queue of the parent
+        levels (set[ConsoleLevel]): The levels the parent prints, others are dropped in the child
+    """
+    logger = ConsoleLogger.instance()
+    logger.levels = set(levels)
+    logger.set_forwarder(ChildLogChannel(queue))
+
+
+class LogForwarder(Singleton):
+    """
+    Receives batches of console msgs from child processes and logs them tagged with their process id
+
+    Args:
+        Singleton (Singleton): LogForwarder inherits from Singleton class
+    """
+
+    def __init__(self) -> None:
+        self.forwarded: int = 0
+        """ Number of msgs received from child processes """
+
+        self._queue: Queue = None
+        self._thread: Thread = None
+        self._lock = Lock()
+
+    @property
+    def queue(self) -> Queue:
+        """
+        The queue children send their msgs through, the receiver starts on first use
+
+        Returns:
+            Queue: Queue to hand to install_log_forwarding in the child
+        """
+        with self._lock:
+            if self._queue is None:
+                self._queue = PROCESS_CONTEXT.Queue()
+                self._thread = Thread(target=self._receive, name="LogForwarder", daemon=True)
+                self._thread.start()
+            return self._queue
+
+    def initializer(self) -> tuple:
+        """
+        Method to get the initializer for process pools whose children should forward their logs
+
+        Returns:
+            tuple: (initializer, initargs) for ProcessPoolExecutor or multiprocessing.Pool
+        """
+        return install_log_forwarding, (self.queue, set(ConsoleLogger.instance().levels))
+
+    def stop(self) -> None:
+        """
+        Method to log what is still queued and stop the receiver thread.
+        """
+        with self._lock:
+            queue, thread = self._queue, self._thread
+            self._queue = self._thread = None
+        if queue is None:
+            return
+        queue.put(None)
+        thread.join()
+        queue.close()
+
+    def on_reset(self) -> None:
+        """
+        Hook run when the singleton is reset, stops the receiver thread.
+        """
+        self.stop()
+
+    def _receive(self) -> None:
+        """
+        Method run on the receiver thread that merges child msgs into the parent logger.
+        """
+        queue = self._queue
+        logger = ConsoleLogger.instance()
+        while True:
+            item = queue.get()
+            if item is None:
+                return
+            pid, process_name, batch = item
+            token, last = None, None
+            for level, msg, fields, thread_name in batch:
+                # Rebind only when the child's fields change, they mostly stay the same for a whole batch
+                if last is None or fields is not last[0] or thread_name is not last[1]:
+                    if token is not None:
+                        reset_fields(token)
+                    token = bind_fields(**fields, thread=thread_name, process=process_name)
+                    last = (fields, thread_name)
+                logger.log(f"[pid {pid}] {msg}", ConsoleLevel(level))
+            if token is not None:
+                reset_fields(token)
+            self.forwarded += len(batch)
@@ -0,0 +1,521 @@
+# :Title: log_sinks.py
+# :Description: Declarative outputs of the console logger with their buffering, threading and drop settings
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from atexit import register
+from enum import Enum
+from json import load
+from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING, Handler, LogRecord, StreamHandler
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from queue import Empty, Full, Queue
+from struct import Struct
+from sys import stderr, stdout
+from threading import Event, Thread
+from time import monotonic
+from typing import BinaryIO, Callable, Iterator, TextIO
+from weakref import WeakSet
+
+LEVEL_NAMES = {
+    "DEBUG": DEBUG,
+    "INFO": INFO,
+    "WARNING": WARNING,
+    "ERROR": ERROR,
+    "CRITICAL": CRITICAL,
+}
+""" The logging level of every level name allowed in a sink config """
+STREAMS = {"stdout": stdout, "stderr": stderr}
+""" The streams a stream sink can target """
+BINARY_MAGIC = b"GBLOG1\n"
+""" Written at the start of every binary log file """
+BINARY_RECORD = Struct("<dBI")
+""" Header of every binary record: time, level and length of the utf-8 msg that follows """
+
+
+class SinkKind(Enum):
+    """
+    Enum of the outputs a sink can write to
+
+    Args:
+        Enum (Enum): SinkKind inherits from Enum
+    """
+
+    STREAM = "stream"
+    """ stdout or stderr """
+    CONSOLE = "console"
+    """ The console widget of the gui """
+    FILE = "file"
+    """ A text log file, appended to """
+    BINARY = "binary"
+    """ A compact binary log file, read back with read_binary_log """
+
+
+class SinkMode(Enum):
+    """
+    Enum of where a sink does its writing
+
+    Args:
+        Enum (Enum): SinkMode inherits from Enum
+    """
+
+    SYNC = "sync"
+    """ On the thread that logged the msg """
+    ASYNC = "async"
+    """ On a writer thread of the sink, the logging thread only queues the record """
+
+
+class DropPolicy(Enum):
+    """
+    Enum of what a sink does with new records while its queue is full
+
+    Args:
+        Enum (Enum): DropPolicy inherits from Enum
+    """
+
+    BLOCK = "block"
+    """ Wait for room, nothing is lost """
+    DROP_NEWEST = "drop_newest"
+    """ Throw away the new record """
+    DROP_OLDEST = "drop_oldest"
+    """ Throw away the oldest queued record to make room """
+
+
+DEFAULT_BUFFER_SIZES = {
+    SinkKind.STREAM: 64,
+    SinkKind.CONSOLE: 0,
+    SinkKind.FILE: 256,
+    SinkKind.BINARY: 1024,
+}
+""" Records held before writing when a sink doesn't set buffer_size, 0 never limits the console.
+ERROR and CRITICAL records are written right away whatever the size, and CrashHandler flushes on a crash """
+DEFAULT_FLUSH_INTERVALS = {
+    SinkKind.STREAM: 0.1,
+    SinkKind.CONSOLE: 0.0,
+    SinkKind.FILE: 0.5,
+    SinkKind.BINARY: 0.5,
+}
+""" Seconds buffered records wait when a sink doesn't set flush_interval, the console appends right away """
+
+DEFAULT_SINKS = [
+    {"name": "stdout", "kind": "stream", "target": "stdout", "levels": ["DEBUG", "INFO", "WARNING"]},
+    {"name": "stderr", "kind": "stream", "target": "stderr", "levels": ["ERROR", "CRITICAL"]},
+    {"name": "console", "kind": "console"},
+]
+""" The sinks used without a config file, normal msgs to stdout, errors to stderr and all to the gui """
+
+
+class SinkConfig:
+    """
+    Settings of a single sink, read from one entry of the sinks list in a config file
+    """
+
+    def __init__(self, data: dict) -> None:
+        unknown = set(data) - {
+            "name",
+            "kind",
+            "target",
+            "levels",
+            "color",
+            "fields",
+            "buffer_size",
+            "flush_interval",
+            "mode",
+            "queue_size",
+            "drop_policy",
+        }
+        if unknown:
+            raise ValueError(f"Unknown sink settings: {', '.join(sorted(unknown))}")
+        self.kind: SinkKind = SinkKind(data.get("kind", "stream"))
+        """ What the sink writes to """
+        self.name: str = data.get("name", self.kind.value)
+        """ Name of the sink in reports """
+        self.target: str = data.get("target")
+        """ stdout or stderr for stream sinks, the file path for file and binary sinks """
+        self.levels: set[int] = set()
+        """ Logging levels written by the sink, DEBUG still needs debug mode """
+        for level_name in data.get("levels", LEVEL_NAMES):
+            if str(level_name).upper() not in LEVEL_NAMES:
+                raise ValueError(f"Sink '{self.name}' has an unknown level {level_name}")
+            self.levels.add(LEVEL_NAMES[str(level_name).upper()])
+        self.color: bool = data.get("color")
+        """ Force colorama codes on or off for stream sinks, None to only color terminals """
+        self.fields: bool = bool(data.get("fields", False))
+        """ Whether or not lines include the contextual fields (page, task, thread and process) """
+        self.buffer_size: int = int(data.get("buffer_size", DEFAULT_BUFFER_SIZES[self.kind]))
+        """ Records held before writing (for the console, records waiting on the gui before drop_policy applies) """
+        self.flush_interval: float = float(
+            data.get("flush_interval", DEFAULT_FLUSH_INTERVALS[self.kind])
+        )
+        """ Longest time in seconds a buffered record waits to be written (for the console, the batching delay) """
+        self.mode: SinkMode = SinkMode(data.get("mode", "sync"))
+        """ Whether the sink writes on the logging thread or its own writer thread """
+        self.queue_size: int = int(data.get("queue_size", 10_000))
+        """ Records an async sink queues for its writer thread before drop_policy applies """
+        self.drop_policy: DropPolicy = DropPolicy(data.get("drop_policy", "block"))
+        """ What happens to records that don't fit """
+
+        if self.kind == SinkKind.STREAM and self.target not in STREAMS:
+            raise ValueError(f"Sink '{self.name}' needs a target of stdout or stderr")
+        if self.kind in (SinkKind.FILE, SinkKind.BINARY) and not self.target:
+            raise ValueError(f"Sink '{self.name}' needs a target file path")
+
+
+def default_sink_configs() -> list[SinkConfig]:
+    """
+    Gets the sinks used when no config file is loaded
+
+    Returns:
+        list[SinkConfig]: Configs of DEFAULT_SINKS
+    """
+    return [SinkConfig(data) for data in DEFAULT_SINKS]
+
+
+def load_sink_configs(path: Path) -> list[SinkConfig]:
+    """
+    Reads the sinks from a json or toml config file
+
+    Args:
+        path (Path): The config file, toml if it ends in .toml and json otherwise
+
+    Raises:
+        ValueError: The file has no sinks list, a sink has bad settings or toml can't be read before Python 3.11
+
+    Returns:
+        list[SinkConfig]: The config of every sink in the file
+    """
+    path = Path(path)
+    load_config = load
+    if path.suffix == ".toml":
+        # tomllib is only in the standard library from 3.11, json configs work on any version
+        try:
+            from tomllib import load as load_config
+        except ImportError as error:
+            raise ValueError(f"{path}: toml configs need Python 3.11+, use a json config instead") from error
+    with open(path, "rb") as config_file:
+        data = load_config(config_file)
+    if not isinstance(data.get("sinks"), list):
+        raise ValueError(f"{path} has no sinks list")
+    try:
+        return [SinkConfig(sink) for sink in data["sinks"]]
+    except (KeyError, TypeError, ValueError) as error:
+        raise ValueError(f"{path}: {error}") from error
+
+
+class BufferedStreamHandler(StreamHandler):
+    """
+    Stream handler that writes its records in batches of buffer_size, an ERROR or worse record writes the batch
+
+    Args:
+        StreamHandler (logging.StreamHandler): BufferedStreamHandler inherits from StreamHandler
+    """
+
+    empty = ""
+    """ What the buffered records are joined with """
+
+    def __init__(self, stream: TextIO, buffer_size: int = 1, owns_stream: bool = False) -> None:
+        super().__init__(stream)
+        self.buffer_size: int = max(1, buffer_size)
+        """ Records held before they are written """
+        self.buffer: list = []
+        """ Encoded records waiting to be written """
+        self.owns_stream: bool = owns_stream
+        """ Whether the stream is closed with the handler """
+        self.last_flush: float = monotonic()
+        """ monotonic time of the last write """
+
+    def encode(self, record: LogRecord):
+        """
+        Method to turn a record into what is written to the stream
+
+        Args:
+            record (LogRecord): The record
+
+        Returns:
+            str: The formatted line
+        """
+        return self.format(record) + self.terminator
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        The override method that buffers the record and writes the batch once it is full
+
+        Args:
+            record (LogRecord): The record to write
+        """
+        try:
+            self.buffer.append(self.encode(record))
+            if len(self.buffer) >= self.buffer_size or record.levelno >= ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """
+        The override method that writes every buffered record, safe to call from any thread.
+        """
+        self.acquire()
+        try:
+            if self.buffer and self.stream:
+                batch, self.buffer = self.buffer, []
+                self.stream.write(self.empty.join(batch))
+            self.last_flush = monotonic()
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """
+        The override method that writes the buffered records and closes owned files.
+        """
+        self.acquire()
+        try:
+            self.flush()
+            if self.owns_stream and self.stream:
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+            super().close()
+
+
+class BinaryLogHandler(BufferedStreamHandler):
+    """
+    Writes records as a BINARY_RECORD header and the utf-8 msg, skipping text formatting entirely
+
+    Args:
+        BufferedStreamHandler (BufferedStreamHandler): BinaryLogHandler inherits from BufferedStreamHandler
+    """
+
+    empty = b""
+    """ What the buffered records are joined with """
+
+    def __init__(self, stream: BinaryIO, buffer_size: int = 1, owns_stream: bool = False) -> None:
+        super().__init__(stream, buffer_size, owns_stream)
+        if stream.tell() == 0:
+            stream.write(BINARY_MAGIC)
+
+    def encode(self, record: LogRecord) -> bytes:
+        """
+        The override method that packs the record
+
+        Args:
+            record (LogRecord): The record
+
+        Returns:
+            bytes: The packed record
+        """
+        msg = record.getMessage().encode("utf-8", "replace")
+        return BINARY_RECORD.pack(record.created, record.levelno, len(msg)) + msg
+
+
+def read_binary_log(path: Path) -> Iterator[tuple[float, int, str]]:
+    """
+    Reads back the records of a binary sink
+
+    Args:
+        path (Path): The binary log file
+
+    Raises:
+        ValueError: The file isn't a binary log
+
+    Yields:
+        tuple[float, int, str]: The (time, logging level, msg) of every record, oldest first
+    """
+    with open(path, "rb") as log_file:
+        if log_file.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a binary log")
+        while header := log_file.read(BINARY_RECORD.size):
+            if len(header) < BINARY_RECORD.size:
+                return
+            created, levelno, length = BINARY_RECORD.unpack(header)
+            yield created, levelno, log_file.read(length).decode("utf-8", "replace")
+
+
+class ConsoleSinkHandler(Handler):
+    """
+    Hands formatted records to the gui console
+
+    Args:
+        Handler (logging.Handler): ConsoleSinkHandler inherits from Handler
+    """
+
+    def __init__(self, show: Callable[[str, int], None]) -> None:
+        super().__init__()
+        self.show: Callable[[str, int], None] = show
+        """ Called with the formatted line and its logging level """
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        The override method that sends the record to the console
+
+        Args:
+            record (LogRecord): The record to show
+        """
+        try:
+            self.show(self.format(record) + "\n", record.levelno)
+        except Exception:
+            self.handleError(record)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler of async sinks that applies the drop policy once the queue is full
+
+    Args:
+        QueueHandler (logging.handlers.QueueHandler): DroppingQueueHandler inherits from QueueHandler
+    """
+
+    def __init__(self, queue: Queue, drop_policy: DropPolicy) -> None:
+        super().__init__(queue)
+        self.drop_policy: DropPolicy = drop_policy
+        """ What happens to records that don't fit """
+        self.dropped: int = 0
+        """ Number of records thrown away """
+
+    def enqueue(self, record: LogRecord) -> None:
+        """
+        The override method that queues the record for the writer thread
+
+        Args:
+            record (LogRecord): The prepared record
+        """
+        if self.drop_policy == DropPolicy.BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except Full:
+            pass
+        if self.drop_policy == DropPolicy.DROP_OLDEST:
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.queue.put_nowait(record)
+            except (Empty, Full):
+                pass
+        self.dropped += 1
+
+
+class LogSink:
+    """
+    One configured output of the console logger, its handler goes on the logger
+    """
+
+    def __init__(self, config: SinkConfig, show: Callable[[str, int], None]) -> None:
+        self.config: SinkConfig = config
+        """ Settings of the sink """
+        self.writer: Handler = None
+        """ Handler that does the writing """
+        self.handler: Handler = None
+        """ Handler added to the logger, the writer itself or the queue in front of it """
+        self.listener: QueueListener = None
+        """ Writer thread of async sinks """
+
+        if config.kind == SinkKind.STREAM:
+            self.writer = BufferedStreamHandler(STREAMS[config.target], config.buffer_size)
+        elif config.kind == SinkKind.FILE:
+            stream = open(config.target, "a", encoding="utf-8")
+            self.writer = BufferedStreamHandler(stream, config.buffer_size, owns_stream=True)
+        elif config.kind == SinkKind.BINARY:
+            self.writer = BinaryLogHandler(open(config.target, "ab"), config.buffer_size, owns_stream=True)
+        else:
+            self.writer = ConsoleSinkHandler(show)
+
+        self.handler = self.writer
+        if config.mode == SinkMode.ASYNC:
+            self.handler = DroppingQueueHandler(Queue(config.queue_size), config.drop_policy)
+            self.listener = QueueListener(self.handler.queue, self.writer)
+            self.listener.start()
+        _open_sinks.add(self)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of records the sink threw away because its queue was full
+
+        Returns:
+            int: The count since the sink was created
+        """
+        return getattr(self.handler, "dropped", 0)
+
+    def flush_due(self) -> bool:
+        """
+        Whether buffered records have waited at least flush_interval
+
+        Returns:
+            bool: True if flush should be called
+        """
+        return (
+            isinstance(self.writer, BufferedStreamHandler)
+            and bool(self.writer.buffer)
+            and monotonic() - self.writer.last_flush >= self.config.flush_interval
+        )
+
+    def flush(self) -> None:
+        """
+        Method to write every record the sink has buffered so far.
+        """
+        if self.listener is not None:
+            # Wait for the writer thread to catch up with everything already queued
+            self.handler.queue.join()
+        self.writer.flush()
+
+    def close(self) -> None:
+        """
+        Method to write everything left and release the sink, safe to call more than once.
+        """
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        self.writer.close()
+        _open_sinks.discard(self)
+
+
+class SinkFlusher:
+    """
+    Background thread that writes the records buffered sinks have held longer than their flush_interval
+    """
+
+    def __init__(self, sinks: list[LogSink]) -> None:
+        self.sinks: list[LogSink] = [sink for sink in sinks if sink.config.buffer_size > 1]
+        """ The sinks that buffer records """
+
+        self._stopped = Event()
+        self._thread: Thread = None
+        if self.sinks:
+            self._thread = Thread(target=self._run, name="LogSinkFlusher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Method to stop the flusher thread.
+        """
+        self._stopped.set()
+
+    def _run(self) -> None:
+        """
+        Method run on the flusher thread, checks the sinks at a quarter of the shortest interval.
+        """
+        interval = max(0.01, min(sink.config.flush_interval for sink in self.sinks) / 4)
+        while not self._stopped.wait(interval):
+            for sink in self.sinks:
+                if sink.flush_due():
+                    sink.writer.flush()
+
+
+_open_sinks: WeakSet[LogSink] = WeakSet()
+""" Every sink that hasn't been closed yet """
+
+
+@register
+def _close_open_sinks() -> None:
+    """
+    Writes out every sink still open when the interpreter exits, runs before logging shuts down.
+    """
+    for sink in list(_open_sinks):
+        sink.close()
@@ -0,0 +1,92 @@
+# :Title: log_storm.py
+# :Description: Floods the console logger from several threads at a fixed rate for stress testing
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from itertools import cycle
+from threading import Event, Lock, Thread
+from time import perf_counter
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+
+TICK = 0.01
+""" Seconds between the bursts of each storm thread """
+
+
+class LogStorm:
+    """
+    Logs msgs_per_second msgs split over a number of threads until stopped
+    """
+
+    def __init__(self) -> None:
+        self.sent: int = 0
+        """ Number of msgs that reached the console since the storm started, filtered out levels don't count """
+        self.running: bool = False
+        """ Whether or not the storm threads are running """
+
+        self._stopped = Event()
+        self._threads: list[Thread] = []
+        self._lock = Lock()
+
+    def start(self, msgs_per_second: int, threads: int, levels: list[ConsoleLevel]) -> None:
+        """
+        Method to start the storm, an already running storm is stopped first
+
+        Args:
+            msgs_per_second (int): Total msgs logged per second by all threads together
+            threads (int): Number of threads logging
+            levels (list[ConsoleLevel]): Levels the msgs cycle through
+        """
+        self.stop()
+        self.sent = 0
+        self._stopped = Event()
+        rate = msgs_per_second / threads
+        self._threads = [
+            Thread(
+                target=self._run,
+                args=(index, rate, levels, self._stopped),
+                name=f"LogStorm-{index}",
+                daemon=True,
+            )
+            for index in range(threads)
+        ]
+        self.running = True
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """
+        Method to stop the storm and wait for its threads to finish.
+        """
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self.running = False
+
+    def _run(self, index: int, rate: float, levels: list[ConsoleLevel], stopped: Event) -> None:
+        """
+        Method run on every storm thread, logs in bursts every TICK to keep up with its rate
+
+        Args:
+            index (int): Number of the thread, shown in its msgs
+            rate (float): Msgs per second of this thread
+            levels (list[ConsoleLevel]): Levels the msgs cycle through
+            stopped (Event): Set when the storm stops
+        """
+        logger = ConsoleLogger.instance()
+        level_cycle = cycle(levels)
+        start = perf_counter()
+        count = 0
+        while not stopped.is_set():
+            due = int((perf_counter() - start) * rate)
+            # log returns False for msgs of a level that isn't shown, only shown msgs count
+            shown = 0
+            for number in range(count, due):
+                shown += logger.log(f"Log storm thread {index} msg {number}", next(level_cycle))
+            with self._lock:
+                self.sent += shown
+            count = due
+            stopped.wait(TICK)
@@ -0,0 +1,290 @@
+# :Title: memory_inspector.py
+# :Description: Debug mode memory inspector with tracemalloc snapshot diffing and per page accounting
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+import tracemalloc
+from gc import get_referents
+from sys import getsizeof
+from types import FunctionType, ModuleType
+from weakref import ref
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QPlainTextEdit, QTextEdit
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+from backend.task_runner.task_runner import TaskContext, TaskHandle, TaskRunner
+from data.classes.singleton import Singleton
+
+TOP_SITES = 10
+""" Number of allocation sites listed per report """
+TRACEBACK_FRAMES = 1
+""" Frames tracemalloc keeps per allocation, more frames cost more memory """
+MAX_WALKED_OBJECTS = 200_000
+""" Most objects visited when estimating the retained size of one owner """
+SHARED_TYPES = (type, ModuleType, FunctionType)
+""" Objects shared by the whole program that are never counted towards an owner """
+
+
+def format_bytes(size: float) -> str:
+    """
+    Formats a byte count for the log
+
+    Args:
+        size (float): Number of bytes, can be negative for shrinkage
+
+    Returns:
+        str: The size in B, KiB, MiB or GiB
+    """
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    """
+    Takes a snapshot without the allocations made by tracemalloc itself
+
+    Returns:
+        tracemalloc.Snapshot: The filtered snapshot
+    """
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+
+def format_growth(snapshot: tracemalloc.Snapshot, since: tracemalloc.Snapshot, label: str) -> str:
+    """
+    Formats the allocation sites that grew the most between two snapshots
+
+    Args:
+        snapshot (tracemalloc.Snapshot): The newer snapshot
+        since (tracemalloc.Snapshot): The older snapshot
+        label (str): Describes the compared period in the log
+
+    Returns:
+        str: The total growth and the top TOP_SITES growth sites
+    """
+    stats = snapshot.compare_to(since, "lineno")
+    total = sum(stat.size_diff for stat in stats)
+    lines = [f"Memory {format_bytes(total)} {label}, top growth sites:"]
+    for stat in stats[:TOP_SITES]:
+        if stat.size_diff <= 0:
+            break
+        frame = stat.traceback[0]
+        lines.append(
+            f"  {frame.filename}:{frame.lineno} +{format_bytes(stat.size_diff)} "
+            f"({stat.count_diff:+} blocks, {format_bytes(stat.size)} total)"
+        )
+    return "\n".join(lines)
+
+
+def snapshot_task(context: TaskContext, since: tracemalloc.Snapshot) -> tuple[tracemalloc.Snapshot, str]:
+    """
+    Task that takes a snapshot and formats the growth since an older one, off the gui thread
+
+    Args:
+        context (TaskContext): Context of the running task
+        since (tracemalloc.Snapshot): The snapshot of the last report, None for the first one
+
+    Returns:
+        tuple[tracemalloc.Snapshot, str]: The new snapshot and the growth report, None without since
+    """
+    snapshot = take_snapshot()
+    context.check_cancelled()
+    return snapshot, format_growth(snapshot, since, "since last report") if since is not None else None
+
+
+def retained_size(root: object, stop_ids: set[int]) -> tuple[int, int]:
+    """
+    Estimates the python memory retained by an object by walking everything it references.
+    Shared objects like classes, modules and functions and anything in stop_ids are skipped.
+
+    Args:
+        root (object): The owner to measure
+        stop_ids (set[int]): Ids of objects owned by someone else
+
+    Returns:
+        tuple[int, int]: (bytes, number of objects) reachable from root
+    """
+    seen = set(stop_ids)
+    seen.discard(id(root))
+    pending = [root]
+    size = 0
+    objects = 0
+    while pending and objects < MAX_WALKED_OBJECTS:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += getsizeof(obj)
+        objects += 1
+        pending.extend(get_referents(obj))
+    return size, objects
+
+
+def text_size(owner: QObject) -> int:
+    """
+    Estimates the memory held by the text documents of an owner and its children
+
+    Args:
+        owner (QObject): The widget to measure
+
+    Returns:
+        int: Bytes of document text, stored as UTF-16 by Qt
+    """
+    editors = owner.findChildren(QTextEdit) + owner.findChildren(QPlainTextEdit)
+    if isinstance(owner, (QTextEdit, QPlainTextEdit)):
+        editors.append(owner)
+    return sum(editor.document().characterCount() * 2 for editor in editors)
+
+
+class MemoryInspector(Singleton):
+    """
+    Takes periodic tracemalloc snapshots on a TaskRunner thread and reports the top growth sites and
+    the memory retained by each tracked page and by the console history through ConsoleLogger.
+    Only the page accounting, which has to look at the widgets, runs on the gui thread.
+
+    Args:
+        Singleton (Singleton): MemoryInspector inherits from Singleton class
+    """
+
+    def __init__(self) -> None:
+        self.owners: dict[str, ref] = {}
+        """ Weak references to the tracked page widgets by name """
+        self.previous: tracemalloc.Snapshot = None
+        """ Snapshot of the last report """
+        self.baseline: tracemalloc.Snapshot = None
+        """ Snapshot taken when the inspector started """
+        self.owner_sizes: dict[str, int] = {}
+        """ Estimated bytes of every owner at the last report """
+        self.timer: QTimer = None
+        """ Timer that triggers the reports, created on start """
+        self.task: TaskHandle = None
+        """ The snapshot task that is running, a report is skipped while there is one """
+
+    def start(self, interval: float) -> None:
+        """
+        Method to start tracing allocations and reporting, must be called from the gui thread
+
+        Args:
+            interval (float): Seconds between reports
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEBACK_FRAMES)
+        self.baseline = self.previous = None
+        self._submit()
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.report)
+        self.timer.start(int(interval * 1000))
+        ConsoleLogger.instance().log(
+            f"Memory inspector active, reporting every {interval:g}s", ConsoleLevel.DEBUG
+        )
+
+    def stop(self) -> None:
+        """
+        Method to log the growth since start and stop tracing, runs on the gui thread as the app quits.
+        """
+        if self.timer is None:
+            return
+        self.timer.stop()
+        self.timer = None
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        if self.baseline is not None:
+            ConsoleLogger.instance().log(
+                format_growth(take_snapshot(), self.baseline, "since start"), ConsoleLevel.DEBUG
+            )
+        self.previous = self.baseline = None
+        tracemalloc.stop()
+
+    def on_reset(self) -> None:
+        """
+        Hook run when the singleton is reset, stops tracing.
+        """
+        self.stop()
+
+    def track(self, name: str, owner: QObject) -> None:
+        """
+        Method to include a page widget in the per page accounting
+
+        Args:
+            name (str): Name shown in the report
+            owner (QObject): The page widget
+        """
+        self.owners[name] = ref(owner)
+
+    def report(self) -> None:
+        """
+        Method to start a report, the growth sites are logged once the snapshot task finishes.
+        """
+        if self.task is None:
+            self._submit()
+
+    def _submit(self) -> None:
+        """
+        Method to take the next snapshot on a TaskRunner thread.
+        """
+        self.task = TaskRunner.instance().submit(snapshot_task, self.previous, name="Memory snapshot")
+        self.task.finished.connect(self._on_snapshot)
+        self.task.failed.connect(self._on_snapshot_failed)
+
+    def _on_snapshot(self, result: tuple[tracemalloc.Snapshot, str]) -> None:
+        """
+        Method run on the gui thread with a finished snapshot, logs the growth and the retained memory per owner
+
+        Args:
+            result (tuple[tracemalloc.Snapshot, str]): The snapshot and its growth report
+        """
+        self.task = None
+        if self.timer is None:
+            return
+        snapshot, growth = result
+        if self.baseline is None:
+            self.baseline = snapshot
+        self.previous = snapshot
+        if growth is not None:
+            ConsoleLogger.instance().log(growth, ConsoleLevel.DEBUG)
+            self._log_owners()
+
+    def _on_snapshot_failed(self, error: str) -> None:
+        """
+        Method run on the gui thread when a snapshot task failed, the next report tries again
+
+        Args:
+            error (str): The traceback, already logged by the task runner
+        """
+        self.task = None
+
+    def _log_owners(self) -> None:
+        """
+        Method to log the estimated retained memory of every tracked page and of the console history.
+        """
+        owners = {name: owner() for name, owner in self.owners.items()}
+        owners = {name: owner for name, owner in owners.items() if owner is not None}
+        stop_ids = {id(owner) for owner in owners.values()}
+
+        logger = ConsoleLogger.instance()
+        measured = {}
+        for name, owner in owners.items():
+            python_size, objects = retained_size(owner, stop_ids)
+            measured[name] = (python_size + text_size(owner), python_size, objects, owner)
+        history_size, history_objects = retained_size(logger.history, stop_ids)
+        console_text = text_size(logger.console) if logger.console else 0
+
+        lines = ["Retained memory per page:"]
+        for name, (size, python_size, objects, owner) in measured.items():
+            growth = size - self.owner_sizes.get(name, size)
+            self.owner_sizes[name] = size
+            lines.append(
+                f"  {name}: {format_bytes(size)} ({growth:+,} B), {objects} python objects "
+                f"({format_bytes(python_size)}), {len(owner.findChildren(QObject))} Qt children"
+            )
+        lines.append(
+            f"  Console history: {format_bytes(history_size)} in {history_objects} objects "
+            f"for {len(logger.history)} records, {format_bytes(console_text)} of console text"
+        )
+        logger.log("\n".join(lines), ConsoleLevel.DEBUG)
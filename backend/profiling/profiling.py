@@ -0,0 +1,181 @@
+# :Title: profiling.py
+# :Description: CPU profiling of the running app across the gui thread and worker threads
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+import sys
+from cProfile import Profile
+from io import StringIO
+from pathlib import Path
+from pstats import SortKey, Stats
+from threading import Lock, get_ident
+from typing import Any, Callable
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+from data.classes.singleton import Singleton
+
+SUMMARY_LINES = 15
+""" Number of functions listed in the debug summary after profiling stops """
+THREAD_PROFILES = sys.version_info < (3, 12)
+""" Whether or not worker threads get their own profiler, from 3.12 cProfile holds the single sys.monitoring
+profiler slot so only the gui profiler can be enabled at a time """
+
+
+class SessionProfiler(Singleton):
+    """
+    Profiles the gui thread, thread pool tasks and registered long lived threads, then merges
+    everything into one pstats file. Start and stop must be called from the gui thread.
+
+    Args:
+        Singleton (Singleton): SessionProfiler inherits from Singleton class
+    """
+
+    def __init__(self) -> None:
+        self.active: bool = False
+        """ Whether or not a profiling session is running """
+        self.gui_profile: Profile = None
+        """ Profiler of the gui thread for the current session """
+
+        self._lock = Lock()
+        self._stats: list[Stats] = []
+        self._thread_profiles: dict[int, Profile] = {}
+        self._thread_runners: list[Callable[[Callable], None]] = []
+
+    def start(self) -> None:
+        """
+        Method to start a profiling session on the gui thread and every registered thread.
+        """
+        if self.active:
+            return
+        with self._lock:
+            self._stats = []
+            self.active = True
+            runners = list(self._thread_runners)
+        self.gui_profile = Profile()
+        self.gui_profile.enable()
+        for run_in_thread in runners:
+            run_in_thread(self.enable_current_thread)
+        ConsoleLogger.instance().log("Profiling started")
+        if not THREAD_PROFILES:
+            ConsoleLogger.instance().log(
+                "Worker threads aren't profiled separately, Python 3.12+ allows only one active cProfile profiler",
+                ConsoleLevel.WARNING,
+            )
+
+    def stop(self, path: Path) -> Path:
+        """
+        Method to stop the profiling session and write the merged stats.
+        Open the file with `python -m pstats <path>` to sort and browse it.
+
+        Args:
+            path (Path): Where to write the stats file
+
+        Returns:
+            Path: The written stats file, None if no session was running
+        """
+        if not self.active:
+            return None
+        self.gui_profile.disable()
+        with self._lock:
+            self.active = False
+            runners = list(self._thread_runners)
+        for run_in_thread in runners:
+            run_in_thread(self.disable_current_thread)
+
+        stats = Stats(self.gui_profile)
+        self.gui_profile = None
+        with self._lock:
+            thread_stats, self._stats = self._stats, []
+        for other in thread_stats:
+            stats.add(other)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stats.dump_stats(path)
+        ConsoleLogger.instance().log(f"Profiling stopped, stats written to {path}")
+
+        summary = StringIO()
+        stats.stream = summary
+        stats.sort_stats(SortKey.CUMULATIVE).print_stats(SUMMARY_LINES)
+        ConsoleLogger.instance().log(summary.getvalue().strip(), ConsoleLevel.DEBUG)
+        return path
+
+    def profile_call(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Method for worker threads to run a call, profiled if a session is running
+
+        Args:
+            fn (Callable): The function to run
+
+        Returns:
+            Any: The return value of fn
+        """
+        if not self.active or not THREAD_PROFILES:
+            return fn(*args, **kwargs)
+        profile = Profile()
+        profile.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.disable()
+            self._add_stats(profile)
+
+    def register_thread(self, run_in_thread: Callable[[Callable], None]) -> None:
+        """
+        Method for long lived threads to take part in profiling sessions
+
+        Args:
+            run_in_thread (Callable[[Callable], None]): Runs a callable on the thread and waits for it
+        """
+        with self._lock:
+            self._thread_runners.append(run_in_thread)
+            active = self.active
+        if active:
+            run_in_thread(self.enable_current_thread)
+
+    def unregister_thread(self, run_in_thread: Callable[[Callable], None]) -> None:
+        """
+        Method for a registered thread to leave before it stops, keeping what it profiled so far
+
+        Args:
+            run_in_thread (Callable[[Callable], None]): The callable passed to register_thread
+        """
+        with self._lock:
+            if run_in_thread not in self._thread_runners:
+                return
+            self._thread_runners.remove(run_in_thread)
+        run_in_thread(self.disable_current_thread)
+
+    def enable_current_thread(self) -> None:
+        """
+        Method run on a registered thread to start profiling it.
+        """
+        if not self.active or not THREAD_PROFILES:
+            return
+        profile = Profile()
+        with self._lock:
+            self._thread_profiles[get_ident()] = profile
+        profile.enable()
+
+    def disable_current_thread(self) -> None:
+        """
+        Method run on a registered thread to stop profiling it and keep its stats.
+        """
+        with self._lock:
+            profile = self._thread_profiles.pop(get_ident(), None)
+        if profile is not None:
+            profile.disable()
+            self._add_stats(profile)
+
+    def _add_stats(self, profile: Profile) -> None:
+        """
+        Method to convert a disabled profile to stats on its own thread and keep them for merging.
+
+        Args:
+            profile (Profile): The disabled profile
+        """
+        stats = Stats(profile)
+        with self._lock:
+            self._stats.append(stats)
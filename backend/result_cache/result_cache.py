@@ -0,0 +1,416 @@
+# :Title: result_cache.py
+# :Description: Memoization of backend results with a size and age limited memory tier and an optional disk tier
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+import pickle
+from collections import OrderedDict
+from functools import wraps
+from hashlib import sha256
+from os import replace
+from pathlib import Path
+from re import sub
+from sys import getsizeof
+from threading import Lock
+from time import monotonic, perf_counter, time
+from typing import Any, Callable, Hashable
+from weakref import WeakSet
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+
+CACHE_DIR = Path("cache")
+""" Folder the disk tiers are written to, one sub folder per cache """
+CACHE_SUFFIX = ".pkl"
+""" Suffix of the files of the disk tier """
+_MISSING = object()
+""" Marks a key that isn't cached, None is a valid result """
+
+_caches: WeakSet = WeakSet()
+""" Every live cache, for the stats report """
+
+
+def hash_key(key: Hashable) -> str:
+    """
+    Hashes a cache key into a file name, the key has to be picklable
+
+    Args:
+        key (Hashable): The key, usually (args, kwargs) of a call
+
+    Returns:
+        str: sha256 hex digest of the pickled key
+    """
+    return sha256(pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+class ResultCache:
+    """
+    Least recently used results kept in memory up to a number of entries and bytes, with an optional
+    time to live. With a disk folder every result is also pickled to a file named after the hashed key,
+    so results survive restarts and entries evicted from memory are read back instead of recomputed.
+    Safe to use from the gui thread and the TaskRunner workers at the same time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 128,
+        max_bytes: int = None,
+        ttl: float = None,
+        disk_dir: Path = None,
+        size_of: Callable[[Any], int] = getsizeof,
+    ) -> None:
+        self.name: str = name
+        """ Name used in the log and stats """
+        self.max_entries: int = max_entries
+        """ Entries kept in memory before the least recently used one is evicted """
+        self.max_bytes: int = max_bytes
+        """ Bytes of results kept in memory as measured by size_of, None for no limit """
+        self.ttl: float = ttl
+        """ Seconds a result stays valid in both tiers, None to keep it until evicted """
+        self.disk_dir: Path = Path(disk_dir) if disk_dir else None
+        """ Folder of the disk tier, None to keep results in memory only """
+        self.size_of: Callable[[Any], int] = size_of
+        """ Measures a result for max_bytes, the default only counts the outer object """
+        self.hits: int = 0
+        """ Lookups answered from memory """
+        self.disk_hits: int = 0
+        """ Lookups answered from the disk tier """
+        self.misses: int = 0
+        """ Lookups that had to compute the result """
+        self.evictions: int = 0
+        """ Entries dropped from memory to stay under the limits """
+        self.expirations: int = 0
+        """ Entries dropped from either tier because they outlived the ttl """
+
+        self._entries: OrderedDict[Hashable, tuple[Any, int, float]] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+        _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Method to look up a result, memory first and then the disk tier
+
+        Args:
+            key (Hashable): The key
+            default (Any, optional): Returned when the key isn't cached. Defaults to None.
+
+        Returns:
+            Any: The cached result or default
+        """
+        expired = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, _, stored = entry
+                if self._expired(stored):
+                    self._drop(key)
+                    self.expirations += 1
+                    expired = True
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+        if expired:
+            self._log(f"{self.name}: memory entry expired")
+
+        value, age = self._read_disk(key)
+        if value is _MISSING:
+            with self._lock:
+                self.misses += 1
+            return default
+        with self._lock:
+            self.disk_hits += 1
+            evicted = self._store(key, value, monotonic() - age)
+        self._log_evictions(evicted)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Method to cache a result in memory and, with a disk folder, on disk
+
+        Args:
+            key (Hashable): The key, has to be picklable for the disk tier
+            value (Any): The result, has to be picklable for the disk tier
+        """
+        with self._lock:
+            evicted = self._store(key, value, monotonic())
+        self._log_evictions(evicted)
+        self._write_disk(key, value)
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Method to drop every cached result
+
+        Args:
+            disk (bool, optional): Also delete the files of the disk tier. Defaults to False.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk and self.disk_dir is not None:
+            for path in self.disk_dir.glob(f"*{CACHE_SUFFIX}"):
+                path.unlink(missing_ok=True)
+        self._log(f"{self.name}: cleared{' with the disk tier' if disk else ''}")
+
+    def stats(self) -> str:
+        """
+        Method to format the cache activity for the log
+
+        Returns:
+            str: Cached entries and bytes, hits, misses, evictions and expirations
+        """
+        lookups = self.hits + self.disk_hits + self.misses
+        hit_rate = (self.hits + self.disk_hits) / lookups if lookups else 0.0
+        size = f" ({self._bytes:,}/{self.max_bytes:,} bytes)" if self.max_bytes is not None else ""
+        return (
+            f"{self.name}: {len(self._entries)}/{self.max_entries} entries{size} in memory, "
+            f"{self.hits} hits, {self.disk_hits} disk hits, {self.misses} misses ({hit_rate:.0%} hit rate), "
+            f"{self.evictions} evictions, {self.expirations} expirations"
+        )
+
+    def _store(self, key: Hashable, value: Any, stored: float) -> int:
+        """
+        Adds an entry to memory and evicts the least recently used ones past the limits, lock must be held
+
+        Args:
+            key (Hashable): The key
+            value (Any): The result
+            stored (float): monotonic time the result was made
+
+        Returns:
+            int: Number of entries evicted
+        """
+        if key in self._entries:
+            self._drop(key)
+        size = self.size_of(value) if self.max_bytes is not None else 0
+        self._entries[key] = (value, size, stored)
+        self._bytes += size
+        evicted = 0
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes and len(self._entries) > 1
+        ):
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            evicted += 1
+        self.evictions += evicted
+        return evicted
+
+    def _log_evictions(self, evicted: int) -> None:
+        """
+        Reports evictions in debug mode, called after the lock is released so the stats are only built when shown
+
+        Args:
+            evicted (int): Number of entries _store evicted
+        """
+        if evicted and ConsoleLevel.DEBUG in ConsoleLogger.instance().levels:
+            entries = "entry" if evicted == 1 else "entries"
+            self._log(f"{self.name}: evicted {evicted} least recently used {entries} ({self.stats()})")
+
+    def _drop(self, key: Hashable) -> None:
+        """
+        Removes an entry from memory, lock must be held
+
+        Args:
+            key (Hashable): The key
+        """
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _expired(self, stored: float) -> bool:
+        """
+        Checks an entry's age against the ttl
+
+        Args:
+            stored (float): When the entry was made, in the clock of the tier
+
+        Returns:
+            bool: Whether or not the entry outlived the ttl
+        """
+        return self.ttl is not None and monotonic() - stored > self.ttl
+
+    def _disk_path(self, key: Hashable) -> Path:
+        """
+        Gets the file of a key in the disk tier
+
+        Args:
+            key (Hashable): The key
+
+        Returns:
+            Path: The file, named after the hashed key
+        """
+        return self.disk_dir.joinpath(hash_key(key) + CACHE_SUFFIX)
+
+    def _read_disk(self, key: Hashable) -> tuple[Any, float]:
+        """
+        Reads a result from the disk tier, expired and unreadable files are deleted
+
+        Args:
+            key (Hashable): The key
+
+        Returns:
+            tuple[Any, float]: The result, _MISSING if there is none, and its age in seconds
+        """
+        if self.disk_dir is None:
+            return _MISSING, 0.0
+        try:
+            path = self._disk_path(key)
+        except Exception:
+            # Keys that can't be pickled only live in memory
+            return _MISSING, 0.0
+        try:
+            age = max(0.0, time() - path.stat().st_mtime)
+            if self._expired(monotonic() - age):
+                path.unlink(missing_ok=True)
+                with self._lock:
+                    self.expirations += 1
+                self._log(f"{self.name}: disk entry {path.name} expired")
+                return _MISSING, 0.0
+            with open(path, "rb") as cache_file:
+                stored_key, value = pickle.load(cache_file)
+        except FileNotFoundError:
+            return _MISSING, 0.0
+        except Exception as error:
+            path.unlink(missing_ok=True)
+            ConsoleLogger.instance().log(
+                f"{self.name}: dropped unreadable cache file {path.name} ({error})", ConsoleLevel.WARNING
+            )
+            return _MISSING, 0.0
+        # Hash collisions are next to impossible but the stored key is checked anyway
+        if stored_key != key:
+            return _MISSING, 0.0
+        self._log(f"{self.name}: read {path.name} from disk")
+        return value, age
+
+    def _write_disk(self, key: Hashable, value: Any) -> None:
+        """
+        Pickles a result into the disk tier, written to a temporary file first so readers never see half a file
+
+        Args:
+            key (Hashable): The key
+            value (Any): The result
+        """
+        if self.disk_dir is None:
+            return
+        try:
+            path = self._disk_path(key)
+        except Exception as error:
+            self._log(f"{self.name}: kept a result in memory only, its key can't be pickled ({error})")
+            return
+        partial = path.with_suffix(".partial")
+        try:
+            with open(partial, "wb") as cache_file:
+                pickle.dump((key, value), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            replace(partial, path)
+        except Exception as error:
+            partial.unlink(missing_ok=True)
+            ConsoleLogger.instance().log(
+                f"{self.name}: couldn't write the result to disk ({error})", ConsoleLevel.WARNING
+            )
+            return
+        self._log(f"{self.name}: wrote {path.name} to disk")
+
+    def _log(self, msg: str) -> None:
+        """
+        Reports cache activity, only shows in debug mode
+
+        Args:
+            msg (str): The msg
+        """
+        ConsoleLogger.instance().log(msg, ConsoleLevel.DEBUG)
+
+
+def make_key(args: tuple, kwargs: dict) -> Hashable:
+    """
+    Builds the cache key of a call, keyword order doesn't matter
+
+    Args:
+        args (tuple): Positional arguments
+        kwargs (dict): Keyword arguments
+
+    Returns:
+        Hashable: The key, the hashed pickle of the arguments when they aren't hashable
+    """
+    key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+    try:
+        hash(key)
+    except TypeError:
+        return hash_key(key)
+    return key
+
+
+def memoize(
+    max_entries: int = 128,
+    max_bytes: int = None,
+    ttl: float = None,
+    disk: bool = False,
+    name: str = None,
+    key: Callable[..., Hashable] = None,
+) -> Callable[[Callable], Callable]:
+    """
+    Decorator that caches the results of a function by its arguments in a ResultCache.
+    The cache is available as the cache attribute of the decorated function.
+
+    Args:
+        max_entries (int, optional): Results kept in memory. Defaults to 128.
+        max_bytes (int, optional): Bytes of results kept in memory, None for no limit. Defaults to None.
+        ttl (float, optional): Seconds a result stays valid, None to keep it until evicted. Defaults to None.
+        disk (bool, optional): Also keep the results in CACHE_DIR/<name>, arguments and results
+            have to be picklable. Defaults to False.
+        name (str, optional): Name of the cache. Defaults to the module and name of the function.
+        key (Callable[..., Hashable], optional): Builds the cache key from the arguments of a call, for arguments
+            that are expensive to hash or pickle. Defaults to make_key. Calls whose key can't be built aren't cached.
+
+    Returns:
+        Callable[[Callable], Callable]: The decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache_name = name or f"{func.__module__}.{func.__qualname__}"
+        cache = ResultCache(
+            cache_name,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl=ttl,
+            disk_dir=CACHE_DIR.joinpath(sub(r"[^\w.-]", "_", cache_name)) if disk else None,
+        )
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            try:
+                cache_key = make_key(args, kwargs) if key is None else key(*args, **kwargs)
+            except (AttributeError, TypeError, pickle.PicklingError):
+                return func(*args, **kwargs)
+            value = cache.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                return value
+            start = perf_counter()
+            value = func(*args, **kwargs)
+            cache.put(cache_key, value)
+            ConsoleLogger.instance().log(
+                f"{cache_name}: computed a missing result in {(perf_counter() - start) * 1000:.1f}ms",
+                ConsoleLevel.DEBUG,
+            )
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def all_caches() -> list[ResultCache]:
+    """
+    Gets every live cache
+
+    Returns:
+        list[ResultCache]: The caches sorted by name
+    """
+    return sorted(_caches, key=lambda cache: cache.name)
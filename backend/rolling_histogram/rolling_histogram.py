@@ -0,0 +1,91 @@
+# :Title: rolling_histogram.py
+# :Description: Histogram over the most recent samples of a latency measurement
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from bisect import bisect_left
+from collections import deque
+from threading import Lock
+
+BUCKET_BOUNDS_MS = [0.25, 0.5, 1, 2, 4, 8, 16, 33, 66, 133, 266, 533, 1066]
+""" Upper bounds of the histogram buckets in milliseconds, one extra bucket holds everything above """
+
+
+class RollingHistogram:
+    """
+    Keeps the most recent samples of a measurement and their bucket counts, old samples roll out
+    """
+
+    def __init__(self, window: int = 1000) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        """ The most recent samples in milliseconds """
+        self.buckets: list[int] = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        """ Number of recent samples in each bucket """
+        self.total: int = 0
+        """ Number of samples recorded since creation, including rolled out ones """
+
+        self._lock = Lock()
+
+    def record(self, value_ms: float) -> None:
+        """
+        Method to add a sample, rolling out the oldest one once the window is full
+
+        Args:
+            value_ms (float): The measurement in milliseconds
+        """
+        with self._lock:
+            if len(self.samples) == self.samples.maxlen:
+                self.buckets[bisect_left(BUCKET_BOUNDS_MS, self.samples[0])] -= 1
+            self.samples.append(value_ms)
+            self.buckets[bisect_left(BUCKET_BOUNDS_MS, value_ms)] += 1
+            self.total += 1
+
+    def percentile(self, percent: float) -> float:
+        """
+        Method to get a percentile of the recent samples
+
+        Args:
+            percent (float): The percentile between 0 and 100
+
+        Returns:
+            float: The sample at that percentile in milliseconds, 0 without samples
+        """
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return 0.0
+        return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+    def summary(self, name: str) -> str:
+        """
+        Method to format the percentiles and non empty buckets for the log
+
+        Args:
+            name (str): Name of the measurement
+
+        Returns:
+            str: Multi line summary of the histogram
+        """
+        with self._lock:
+            ordered = sorted(self.samples)
+            buckets = list(self.buckets)
+        if not ordered:
+            return f"{name}: no samples"
+        lines = [
+            f"{name}: {len(ordered)} recent of {self.total} samples, "
+            f"p50 {ordered[len(ordered) // 2]:.2f}ms, "
+            f"p95 {ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]:.2f}ms, "
+            f"max {ordered[-1]:.2f}ms"
+        ]
+        widest = max(buckets)
+        for index, count in enumerate(buckets):
+            if not count:
+                continue
+            if index < len(BUCKET_BOUNDS_MS):
+                bound = f"<= {BUCKET_BOUNDS_MS[index]:g}ms"
+            else:
+                bound = f"> {BUCKET_BOUNDS_MS[-1]:g}ms"
+            lines.append(f"  {bound:>11} {'#' * max(1, count * 30 // widest):30} {count}")
+        return "\n".join(lines)
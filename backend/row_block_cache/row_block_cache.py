@@ -0,0 +1,79 @@
+# :Title: row_block_cache.py
+# :Description: Least recently used cache of fixed size row blocks
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from collections import OrderedDict
+from typing import Any, Callable, Sequence
+
+
+class RowBlockCache:
+    """
+    Keeps the most recently used blocks of rows, reading missing blocks through a loader
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[int, int], list[Sequence[Any]]],
+        block_rows: int = 256,
+        max_blocks: int = 64,
+    ) -> None:
+        self.loader: Callable[[int, int], list[Sequence[Any]]] = loader
+        """ Reads the rows from start to stop when a block is missing """
+        self.block_rows: int = block_rows
+        """ Rows per block """
+        self.max_blocks: int = max_blocks
+        """ Blocks kept before the least recently used one is evicted """
+        self.hits: int = 0
+        """ Rows found in a cached block """
+        self.misses: int = 0
+        """ Blocks that had to be read """
+        self.evictions: int = 0
+        """ Blocks dropped to make room """
+
+        self._blocks: OrderedDict[int, list[Sequence[Any]]] = OrderedDict()
+
+    def row(self, row: int) -> Sequence[Any]:
+        """
+        Method to get a row, reading its block if it isn't cached
+
+        Args:
+            row (int): The row number
+
+        Returns:
+            Sequence[Any]: The column values of the row
+        """
+        number, offset = divmod(row, self.block_rows)
+        block = self._blocks.get(number)
+        if block is None:
+            self.misses += 1
+            start = number * self.block_rows
+            block = self.loader(start, start + self.block_rows)
+            self._blocks[number] = block
+            if len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+            self._blocks.move_to_end(number)
+        return block[offset]
+
+    def clear(self) -> None:
+        """
+        Method to drop every cached block, used when the source changes.
+        """
+        self._blocks.clear()
+
+    def stats(self) -> str:
+        """
+        Method to format the cache activity for the log
+
+        Returns:
+            str: Cached blocks, hits, misses and evictions
+        """
+        return (
+            f"{len(self._blocks)}/{self.max_blocks} blocks of {self.block_rows} rows cached, "
+            f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions"
+        )
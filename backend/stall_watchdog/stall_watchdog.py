@@ -0,0 +1,164 @@
+# :Title: stall_watchdog.py
+# :Description: Watchdog thread that detects gui event loop stalls and samples the gui thread stack
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from statistics import quantiles
+from sys import _current_frames
+from threading import Event, Lock, Thread, get_ident
+from time import perf_counter
+from traceback import format_stack
+
+from PySide6.QtCore import QObject, Signal
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+
+MAX_RECORDED_STALLS = 1000
+""" Number of most recent stall durations kept for the percentile statistics """
+
+
+class StallStatistics:
+    """
+    Keeps track of how often and how long the gui event loop stalled
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        """ Number of stalls over the threshold """
+        self.total: float = 0.0
+        """ Total seconds spent stalled """
+        self.longest: float = 0.0
+        """ Longest stall in seconds """
+        self.recent: list[float] = []
+        """ Most recent stall durations in seconds """
+
+    def record(self, duration: float) -> None:
+        """
+        Method to add a stall to the statistics
+
+        Args:
+            duration (float): How long the event loop was stalled in seconds
+        """
+        self.count += 1
+        self.total += duration
+        self.longest = max(self.longest, duration)
+        self.recent.append(duration)
+        if len(self.recent) > MAX_RECORDED_STALLS:
+            del self.recent[0]
+
+    def summary(self) -> str:
+        """
+        Method to format the statistics for the log
+
+        Returns:
+            str: Human readable summary of the stalls
+        """
+        if not self.count:
+            return "no gui stalls detected"
+        summary = (
+            f"{self.count} gui stalls, {self.total:.3f}s stalled in total, "
+            f"mean {self.total / self.count * 1000:.1f}ms, longest {self.longest * 1000:.1f}ms"
+        )
+        if len(self.recent) > 1:
+            p95 = quantiles(self.recent, n=20, method="inclusive")[18]
+            summary += f", p95 {p95 * 1000:.1f}ms"
+        return summary
+
+
+class StallWatchdog(QObject):
+    """
+    Pings the gui event loop from a watchdog thread and reports the gui thread stack when it stalls.
+    Must be created on the gui thread.
+
+    Args:
+        QObject (QObject): StallWatchdog inherits from QObject
+    """
+
+    _ping = Signal()
+    """ Emitted from the watchdog thread, answered once the gui event loop gets to it """
+
+    def __init__(self, threshold_ms: float) -> None:
+        super().__init__()
+        self.threshold: float = threshold_ms / 1000
+        """ Seconds the event loop can go without answering before it counts as stalled """
+        self.interval: float = max(self.threshold / 4, 0.01)
+        """ Seconds between watchdog checks """
+        self.statistics: StallStatistics = StallStatistics()
+        """ Durations of every stall seen so far """
+
+        self._gui_thread_id: int = get_ident()
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread = None
+        self._ping_sent_at: float = None
+        self._reported: bool = False
+
+        self._ping.connect(self._pong)
+
+    def start(self) -> None:
+        """
+        Method to start the watchdog thread.
+        """
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Method to stop the watchdog thread and log the stall statistics.
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        ConsoleLogger.instance().log(f"Stall watchdog: {self.statistics.summary()}")
+
+    def _run(self) -> None:
+        """
+        Method run on the watchdog thread that pings the event loop and checks for stalls.
+        """
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                now = perf_counter()
+                if self._ping_sent_at is None:
+                    self._ping_sent_at = now
+                    self._ping.emit()
+                    continue
+                waited = now - self._ping_sent_at
+                if waited < self.threshold or self._reported:
+                    continue
+                self._reported = True
+            self._report_stall(waited)
+
+    def _report_stall(self, waited: float) -> None:
+        """
+        Method to log the current gui thread stack while the event loop is stalled.
+
+        Args:
+            waited (float): Seconds the event loop has been stalled so far
+        """
+        frame = _current_frames().get(self._gui_thread_id)
+        stack = "".join(format_stack(frame)) if frame else "  gui thread stack unavailable\n"
+        ConsoleLogger.instance().log(
+            f"Gui event loop stalled for {waited * 1000:.0f}ms, gui thread stack:\n{stack.rstrip()}",
+            ConsoleLevel.WARNING,
+        )
+
+    def _pong(self) -> None:
+        """
+        Method run on the gui thread when the ping gets through the event loop.
+        """
+        with self._lock:
+            duration = perf_counter() - self._ping_sent_at
+            reported = self._reported
+            self._ping_sent_at = None
+            self._reported = False
+            if duration >= self.threshold:
+                self.statistics.record(duration)
+        if reported:
+            ConsoleLogger.instance().log(
+                f"Gui event loop recovered after {duration * 1000:.0f}ms",
+                ConsoleLevel.WARNING,
+            )
@@ -0,0 +1,395 @@
+# :Title: task_runner.py
+# :Description: Runs backend work on thread or process pools and hands results back to the gui thread
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from itertools import count
+from os import cpu_count
+from threading import Event, Lock, Thread
+from time import perf_counter
+from traceback import format_exc
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, Qt, Signal
+
+from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+from backend.log_context.log_context import bind_fields, current_fields, log_fields, reset_fields
+from backend.log_forwarding.log_forwarding import PROCESS_CONTEXT, LogForwarder
+from backend.profiling.profiling import SessionProfiler
+from data.classes.singleton import Singleton
+
+
+class TaskMode(Enum):
+    """
+    Enum to keep track of where a task is executed
+
+    Args:
+        Enum (Enum): TaskMode inherits from Enum
+    """
+
+    THREAD = "thread"
+    """ Runs in a worker thread, best for I/O and code that releases the GIL """
+    PROCESS = "process"
+    """ Runs in a worker process, best for CPU heavy pure python code """
+
+
+class TaskCancelled(Exception):
+    """
+    Raised inside a task to stop early once cancellation has been requested
+
+    Args:
+        Exception (Exception): TaskCancelled inherits from Exception
+    """
+
+
+class _QueueProgressSink:
+    """
+    Picklable progress callback that forwards progress from a worker process to the parent
+    """
+
+    def __init__(self, queue, task_id: int) -> None:
+        self.queue = queue
+        self.task_id = task_id
+
+    def __call__(self, progress: Any) -> None:
+        self.queue.put((self.task_id, progress))
+
+
+class TaskContext:
+    """
+    Handed to every task as its first argument to report progress and check for cancellation
+    """
+
+    def __init__(self, cancel_event: Event, progress_sink: Callable[[Any], None]) -> None:
+        self._cancel_event = cancel_event
+        """ Set by the gui thread when the task is cancelled """
+        self._progress_sink = progress_sink
+        """ Callable that delivers progress updates to the gui thread """
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether or not cancellation of the task has been requested
+
+        Returns:
+            bool: True once TaskHandle.cancel has been called
+        """
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        """
+        Method to stop the task by raising TaskCancelled if cancellation was requested.
+        """
+        if self._cancel_event.is_set():
+            raise TaskCancelled()
+
+    def report_progress(self, progress: Any) -> None:
+        """
+        Method to send a progress update to the gui thread
+
+        Args:
+            progress (Any): Progress value, usually a float between 0 and 1
+        """
+        self._progress_sink(progress)
+
+
+def _run_task(fn: Callable, context: TaskContext, args: tuple, kwargs: dict, fields: dict[str, str]) -> tuple:
+    """
+    Runs a task inside the worker and times it. Tracebacks are returned as text so the
+    outcome can always be pickled back from a worker process.
+
+    Args:
+        fn (Callable): The task function
+        context (TaskContext): Context passed as the first argument to fn
+        args (tuple): Positional arguments for fn
+        kwargs (dict): Keyword arguments for fn
+        fields (dict[str, str]): Contextual log fields bound while the task runs
+
+    Returns:
+        tuple: (outcome, value, run time in seconds) where outcome is "finished", "cancelled" or "failed"
+    """
+    start = perf_counter()
+    token = bind_fields(**fields)
+    try:
+        result = fn(context, *args, **kwargs)
+    except TaskCancelled:
+        return "cancelled", None, perf_counter() - start
+    except Exception:
+        return "failed", format_exc(), perf_counter() - start
+    finally:
+        # Send msgs a worker process buffered along with the task result
+        ConsoleLogger.instance().flush()
+        reset_fields(token)
+    return "finished", result, perf_counter() - start
+
+
+class TaskHandle(QObject):
+    """
+    Handle for a submitted task, all of its signals are delivered on the gui thread
+
+    Args:
+        QObject (QObject): TaskHandle inherits from QObject
+    """
+
+    progress = Signal(object)
+    """ Emitted with each progress value the task reports """
+    finished = Signal(object)
+    """ Emitted with the return value of the task """
+    failed = Signal(str)
+    """ Emitted with the traceback of the exception the task raised """
+    cancelled = Signal()
+    """ Emitted once a cancelled task has stopped """
+
+    # Internal signals emitted from worker threads and queued onto the gui thread
+    _progress_made = Signal(object)
+    _completed = Signal(object)
+
+    def __init__(self, task_id: int, name: str, mode: TaskMode) -> None:
+        super().__init__()
+        self.task_id: int = task_id
+        """ Unique id of the task """
+        self.name: str = name
+        """ Name of the task used in the log msgs """
+        self.mode: TaskMode = mode
+        """ Where the task is executed """
+        self.cancel_event = None
+        """ Event shared with the worker to request cancellation """
+        self.future: Future = None
+        """ Future of the task in its executor """
+        self.submitted_at: float = perf_counter()
+        """ When the task was submitted """
+        self.done: bool = False
+        """ Whether or not the task has completed in any way """
+
+        self._progress_made.connect(self._on_progress_made)
+        # Always queued so callbacks connected right after submit never miss the result
+        self._completed.connect(self._on_completed, Qt.QueuedConnection)
+
+    def cancel(self) -> None:
+        """
+        Method to cancel the task. Queued tasks never start, running tasks
+        stop at their next TaskContext.check_cancelled call.
+        """
+        if self.done:
+            return
+        self.cancel_event.set()
+        if self.future.cancel():
+            self._completed.emit(("cancelled", None, 0.0))
+
+    def _on_progress_made(self, progress: Any) -> None:
+        """
+        Method run on the gui thread to pass progress on, late updates from a process are dropped.
+
+        Args:
+            progress (Any): The progress value the task reported
+        """
+        if not self.done:
+            self.progress.emit(progress)
+
+    def _on_future_done(self, future: Future) -> None:
+        """
+        Callback run in the worker once the executor resolves the future.
+
+        Args:
+            future (Future): The resolved future of the task
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            # The task itself never raises, so this is a broken pool or pickling issue
+            self._completed.emit(("failed", f"{type(error).__name__}: {error}", 0.0))
+        else:
+            self._completed.emit(future.result())
+
+    def _on_completed(self, outcome: tuple) -> None:
+        """
+        Method run on the gui thread to log the outcome and emit the public signals.
+
+        Args:
+            outcome (tuple): The (outcome, value, run time) tuple from _run_task
+        """
+        if self.done:
+            return
+        self.done = True
+        TaskRunner.instance().forget(self)
+        state, value, run_time = outcome
+        total_time = perf_counter() - self.submitted_at
+        timing = f"ran {run_time:.3f}s, {total_time:.3f}s since submitted"
+        # Outcome msgs and the handlers of the signals log with the id of the task
+        with log_fields(task=str(self.task_id)):
+            match state:
+                case "finished":
+                    ConsoleLogger.instance().log(f"Task '{self.name}' finished ({timing})")
+                    self.finished.emit(value)
+                case "cancelled":
+                    ConsoleLogger.instance().log(
+                        f"Task '{self.name}' cancelled ({timing})", ConsoleLevel.WARNING
+                    )
+                    self.cancelled.emit()
+                case "failed":
+                    ConsoleLogger.instance().log(
+                        f"Task '{self.name}' failed ({timing})\n{value}", ConsoleLevel.ERROR
+                    )
+                    self.failed.emit(value)
+
+
+class TaskRunner(Singleton):
+    """
+    Executes backend tasks off the gui thread on a thread pool or a process pool
+
+    Args:
+        Singleton (Singleton): TaskRunner inherits from Singleton class
+    """
+
+    def __init__(self) -> None:
+        self.thread_pool: ThreadPoolExecutor = None
+        """ Pool for TaskMode.THREAD tasks, created on first use """
+        self.process_pool: ProcessPoolExecutor = None
+        """ Pool for TaskMode.PROCESS tasks, created on first use """
+        self.max_workers: int = cpu_count() or 1
+        """ Number of workers in each pool """
+        self.handles: dict[int, TaskHandle] = {}
+        """ Tasks that have not completed yet, by task id """
+
+        self._ids = count(1)
+        self._lock = Lock()
+        self._manager = None
+        self._progress_queue = None
+        self._progress_thread: Thread = None
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        mode: TaskMode = TaskMode.THREAD,
+        name: str = None,
+        **kwargs,
+    ) -> TaskHandle:
+        """
+        Method to run fn(context, *args, **kwargs) in the background. Must be called from the gui thread.
+
+        Args:
+            fn (Callable): The task, must be a module level function for TaskMode.PROCESS
+            mode (TaskMode, optional): Where the task runs. Defaults to TaskMode.THREAD.
+            name (str, optional): Name used in the log msgs. Defaults to the function name.
+
+        Returns:
+            TaskHandle: Handle to connect to and cancel the task with
+        """
+        handle = TaskHandle(next(self._ids), name or fn.__name__, mode)
+        if mode == TaskMode.PROCESS:
+            self._ensure_process_pool()
+            handle.cancel_event = self._manager.Event()
+            sink = _QueueProgressSink(self._progress_queue, handle.task_id)
+            executor = self.process_pool
+        else:
+            self._ensure_thread_pool()
+            handle.cancel_event = Event()
+            sink = handle._progress_made.emit
+            executor = self.thread_pool
+
+        with self._lock:
+            self.handles[handle.task_id] = handle
+        context = TaskContext(handle.cancel_event, sink)
+        # The task logs with the fields of the submitter (the page) and its own id
+        fields = {**current_fields(), "task": str(handle.task_id)}
+        with log_fields(task=str(handle.task_id)):
+            ConsoleLogger.instance().log(f"Task '{handle.name}' started ({mode.value} pool)")
+        if mode == TaskMode.PROCESS:
+            handle.future = executor.submit(_run_task, fn, context, args, kwargs, fields)
+        else:
+            handle.future = executor.submit(
+                SessionProfiler.instance().profile_call,
+                _run_task,
+                fn,
+                context,
+                args,
+                kwargs,
+                fields,
+            )
+        handle.future.add_done_callback(handle._on_future_done)
+        return handle
+
+    def forget(self, handle: TaskHandle) -> None:
+        """
+        Method to stop tracking a completed task
+
+        Args:
+            handle (TaskHandle): The completed task
+        """
+        with self._lock:
+            self.handles.pop(handle.task_id, None)
+
+    def shutdown(self) -> None:
+        """
+        Method to cancel every task and stop the pools, called when the app quits.
+        """
+        with self._lock:
+            handles = list(self.handles.values())
+        for handle in handles:
+            handle.cancel()
+        if self.thread_pool:
+            self.thread_pool.shutdown(wait=False, cancel_futures=True)
+            self.thread_pool = None
+        if self.process_pool:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+            self.process_pool = None
+        if self._manager:
+            self._progress_queue.put(None)
+            self._progress_thread.join()
+            self._manager.shutdown()
+            self._manager = None
+
+    def on_reset(self) -> None:
+        """
+        Hook run when the singleton is reset, stops the pools.
+        """
+        self.shutdown()
+
+    def _ensure_thread_pool(self) -> None:
+        """
+        Method to create the thread pool on first use.
+        """
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="TaskRunner"
+            )
+
+    def _ensure_process_pool(self) -> None:
+        """
+        Method to create the process pool and its progress channel on first use.
+        """
+        if self.process_pool is None:
+            initializer, initargs = LogForwarder.instance().initializer()
+            self.process_pool = ProcessPoolExecutor(
+                self.max_workers, mp_context=PROCESS_CONTEXT, initializer=initializer, initargs=initargs
+            )
+        if self._manager is None:
+            self._manager = PROCESS_CONTEXT.Manager()
+            self._progress_queue = self._manager.Queue()
+            self._progress_thread = Thread(
+                target=self._forward_progress, name="TaskRunnerProgress", daemon=True
+            )
+            self._progress_thread.start()
+
+    def _forward_progress(self) -> None:
+        """
+        Method run on a background thread that forwards progress from worker processes to their handles.
+        """
+        while True:
+            try:
+                item = self._progress_queue.get()
+            except (EOFError, OSError):
+                return
+            if item is None:
+                return
+            task_id, progress = item
+            with self._lock:
+                handle = self.handles.get(task_id)
+            if handle is not None:
+                handle._progress_made.emit(progress)
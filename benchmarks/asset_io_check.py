@@ -0,0 +1,71 @@
+# :Title: asset_io_check.py
+# :Description: Confirms the frontend starts without reading any asset files from disk
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+#
+# Run from the project root: python -m benchmarks.asset_io_check
+
+# Imports
+import sys
+from os import chdir, environ, fsdecode
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from PySide6.QtWidgets import QApplication
+
+ASSET_SUFFIXES = {".qss", ".png", ".jpg", ".jpeg", ".svg", ".ico", ".gif", ".ttf", ".otf"}
+""" File types that belong in the resource bundle instead of being read at startup """
+ASSET_SOURCE = Path(__file__).resolve().parent.parent.joinpath("frontend", "resources", "source")
+""" Folder of the source assets compiled into the bundle """
+
+asset_reads: list[str] = []
+""" Every asset file opened while the frontend started """
+
+
+def audit(event: str, event_args: tuple) -> None:
+    """
+    Audit hook that records every opened file that looks like an asset
+
+    Args:
+        event (str): Name of the audited event
+        event_args (tuple): Arguments of the event, the path comes first for open
+    """
+    if event != "open" or isinstance(event_args[0], int):
+        return
+    path = Path(fsdecode(event_args[0]))
+    if path.suffix.lower() in ASSET_SUFFIXES or ASSET_SOURCE in path.resolve().parents:
+        asset_reads.append(str(path))
+
+
+if __name__ == "__main__":
+    # No display needed, this runs on CI machines
+    environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+
+    # Start from somewhere else so paths relative to the project root would break
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    with TemporaryDirectory() as elsewhere:
+        chdir(elsewhere)
+        sys.addaudithook(audit)
+
+        from frontend.frontend import Frontend
+
+        window = Frontend()
+        window.show()
+        app.processEvents()
+
+        styled = bool(window.styleSheet())
+        window.close()
+        app.processEvents()
+
+    if not styled:
+        sys.stderr.write("FAILED: the style sheet was not loaded from the resource bundle\n")
+        sys.exit(1)
+    if asset_reads:
+        sys.stderr.write("FAILED: startup read asset files from disk\n")
+        for path in asset_reads:
+            sys.stderr.write(f"  {path}\n")
+        sys.exit(1)
+    sys.stderr.write("OK: startup read no asset files from disk\n")
@@ -0,0 +1,164 @@
+# :Title: async_loop_latency.py
+# :Description: Benchmark of Qt and asyncio event loop latency under concurrent async load
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+#
+# Run from the project root: python -m benchmarks.async_loop_latency [--loads 0 100 1000] [--seconds 2]
+
+# Imports
+import sys
+from argparse import ArgumentParser
+from asyncio import sleep
+from os import environ
+from random import random
+from statistics import quantiles
+from time import perf_counter
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+
+from backend.async_loop.async_loop import AsyncLoop
+from middleware.async_tasks import async_slot, run_async
+
+TICK_MS = 5
+""" Interval of the timers whose lateness is measured """
+
+
+async def busy_coroutine(stop_at: float) -> int:
+    """
+    Load generator, sleeps for short random intervals until stop_at
+
+    Args:
+        stop_at (float): perf_counter time to stop at
+
+    Returns:
+        int: Number of wake ups
+    """
+    wake_ups = 0
+    while perf_counter() < stop_at:
+        await sleep(random() * 0.01)
+        wake_ups += 1
+    return wake_ups
+
+
+async def asyncio_lateness(stop_at: float) -> list[float]:
+    """
+    Measures how late asyncio.sleep wakes up on the loaded asyncio loop
+
+    Args:
+        stop_at (float): perf_counter time to stop at
+
+    Returns:
+        list[float]: Lateness of every wake up in seconds
+    """
+    samples = []
+    while perf_counter() < stop_at:
+        start = perf_counter()
+        await sleep(TICK_MS / 1000)
+        samples.append(perf_counter() - start - TICK_MS / 1000)
+    return samples
+
+
+async def echo(value: float) -> float:
+    """
+    Backend coroutine used for the gui hand-off round trip
+
+    Args:
+        value (float): Value to return
+
+    Returns:
+        float: value
+    """
+    return value
+
+
+def summarize(samples: list[float]) -> str:
+    """
+    Formats latency samples as percentiles in milliseconds
+
+    Args:
+        samples (list[float]): Latency samples in seconds
+
+    Returns:
+        str: p50/p95/p99/max summary
+    """
+    if len(samples) < 2:
+        return "not enough samples"
+    cuts = quantiles(samples, n=100, method="inclusive")
+    return (
+        f"p50 {cuts[49] * 1000:7.2f}ms  p95 {cuts[94] * 1000:7.2f}ms  "
+        f"p99 {cuts[98] * 1000:7.2f}ms  max {max(samples) * 1000:7.2f}ms"
+    )
+
+
+def run_load(app: QApplication, coroutines: int, seconds: float) -> None:
+    """
+    Runs one load level and prints its latencies
+
+    Args:
+        app (QApplication): The running application
+        coroutines (int): Number of concurrent busy coroutines on the asyncio loop
+        seconds (float): How long to measure for
+    """
+    stop_at = perf_counter() + seconds
+    loop = AsyncLoop.instance()
+    load = [loop.submit(busy_coroutine(stop_at)) for _ in range(coroutines)]
+    asyncio_future = loop.submit(asyncio_lateness(stop_at))
+
+    # Qt timer lateness on the gui thread
+    qt_samples = []
+    last_tick = [perf_counter()]
+
+    def on_tick() -> None:
+        now = perf_counter()
+        qt_samples.append(now - last_tick[0] - TICK_MS / 1000)
+        last_tick[0] = now
+        if now >= stop_at:
+            timer.stop()
+
+    timer = QTimer()
+    timer.timeout.connect(on_tick)
+    timer.start(TICK_MS)
+
+    # Round trip of a gui coroutine awaiting the backend
+    handoff_samples = []
+
+    @async_slot
+    async def handoff() -> None:
+        while perf_counter() < stop_at:
+            start = perf_counter()
+            await run_async(echo(start))
+            handoff_samples.append(perf_counter() - start)
+
+    handoff()
+
+    QTimer.singleShot(int(seconds * 1000) + 50, app.quit)
+    app.exec()
+
+    wake_ups = sum(future.result() for future in load)
+    print(f"{coroutines} coroutines ({wake_ups / seconds:,.0f} wake ups/s)")
+    print(f"  qt timer lateness     {summarize(qt_samples)}")
+    print(f"  asyncio lateness      {summarize(asyncio_future.result())}")
+    print(f"  gui hand-off latency  {summarize(handoff_samples)}")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--loads",
+        help="numbers of concurrent coroutines to measure",
+        nargs="+",
+        type=int,
+        default=[0, 100, 1000, 5000],
+    )
+    parser.add_argument(
+        "--seconds", help="seconds to measure each load", type=float, default=2.0
+    )
+    args = parser.parse_args()
+
+    environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(sys.argv)
+    for load in args.loads:
+        run_load(app, load, args.seconds)
+    AsyncLoop.instance().stop()
@@ -0,0 +1,76 @@
+# :Title: log_forwarding_throughput.py
+# :Description: Benchmark of console msg throughput from many busy child processes
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+#
+# Run from the project root: python -m benchmarks.log_forwarding_throughput [--workers 1 4 8] [--msgs 20000]
+
+# Imports
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from logging import CRITICAL
+from time import perf_counter, sleep
+
+from backend.console_logging.console_logging import ConsoleLogger
+from backend.log_forwarding.log_forwarding import PROCESS_CONTEXT, LogForwarder
+
+
+def busy_worker(msgs: int) -> int:
+    """
+    Logs msgs as fast as possible from a child process
+
+    Args:
+        msgs (int): Number of msgs to log
+
+    Returns:
+        int: Number of msgs logged
+    """
+    logger = ConsoleLogger.instance()
+    for index in range(msgs):
+        logger.log(f"worker msg {index}")
+    logger.flush()
+    return msgs
+
+
+def run_workers(workers: int, msgs: int) -> None:
+    """
+    Runs one worker count and prints the forwarded throughput
+
+    Args:
+        workers (int): Number of child processes
+        msgs (int): Number of msgs each child logs
+    """
+    forwarder = LogForwarder.instance()
+    initializer, initargs = forwarder.initializer()
+    expected = forwarder.forwarded + workers * msgs
+    with ProcessPoolExecutor(
+        workers, mp_context=PROCESS_CONTEXT, initializer=initializer, initargs=initargs
+    ) as pool:
+        start = perf_counter()
+        list(pool.map(busy_worker, [msgs] * workers))
+        sent = perf_counter() - start
+    while forwarder.forwarded < expected:
+        sleep(0.001)
+    merged = perf_counter() - start
+    print(
+        f"{workers:3} workers  sent {workers * msgs / sent:12,.0f} msgs/s  "
+        f"merged {workers * msgs / merged:12,.0f} msgs/s"
+    )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--workers", help="numbers of child processes", nargs="+", type=int, default=[1, 4, 8]
+    )
+    parser.add_argument(
+        "--msgs", help="msgs logged by each child", type=int, default=20000
+    )
+    args = parser.parse_args()
+
+    # Measure the forwarding path, not the terminal
+    ConsoleLogger.instance().logger.setLevel(CRITICAL + 1)
+    for workers in args.workers:
+        run_workers(workers, args.msgs)
+    LogForwarder.instance().stop()
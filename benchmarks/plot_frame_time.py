@@ -0,0 +1,107 @@
+# :Title: plot_frame_time.py
+# :Description: Benchmark of the SignalPlot pyramid build and frame time for long signals
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+#
+# Run from the project root: python -m benchmarks.plot_frame_time [--sizes 1000000 10000000] [--frames 60]
+
+# Imports
+import sys
+from argparse import ArgumentParser
+from array import array
+from math import sin
+from os import environ
+from random import Random
+from statistics import quantiles
+from time import perf_counter
+
+from PySide6.QtWidgets import QApplication
+
+from backend.lod_pyramid.lod_pyramid import MinMaxPyramid
+from frontend.widgets.signal_plot import SignalPlot
+
+ZOOMS = [1, 10, 1_000, 100_000]
+""" Shown fraction of the signal is 1 / zoom, every zoom level is panned across the signal """
+
+
+def make_signal(size: int) -> array:
+    """
+    Builds a noisy sine sweep
+
+    Args:
+        size (int): Number of samples
+
+    Returns:
+        array: The samples ('d' array)
+    """
+    noise = Random(0)
+    return array("d", (sin(index * index / size / 50) + noise.random() * 0.1 for index in range(size)))
+
+
+def summarize(samples: list[float]) -> str:
+    """
+    Formats frame times as percentiles in milliseconds
+
+    Args:
+        samples (list[float]): Frame times in milliseconds
+
+    Returns:
+        str: p50/p95/max summary
+    """
+    cuts = quantiles(samples, n=100, method="inclusive")
+    return f"p50 {cuts[49]:6.2f}ms  p95 {cuts[94]:6.2f}ms  max {max(samples):6.2f}ms"
+
+
+def run_size(app: QApplication, plot: SignalPlot, size: int, frames: int) -> None:
+    """
+    Builds the pyramid of one signal size and times frames at every zoom level
+
+    Args:
+        app (QApplication): The running application
+        plot (SignalPlot): The plot to draw with
+        size (int): Number of samples
+        frames (int): Frames drawn per zoom level
+    """
+    values = make_signal(size)
+    start = perf_counter()
+    pyramid = MinMaxPyramid(values)
+    build = perf_counter() - start
+    plot.set_pyramid(pyramid)
+    app.processEvents()
+
+    print(f"{size:,} samples (pyramid built in {build:.2f}s, {len(pyramid.levels)} levels)")
+    for zoom in ZOOMS:
+        span = max(size / zoom, 16)
+        paint_times, frame_times = [], []
+        for frame in range(frames):
+            view_start = (size - span) * frame / max(1, frames - 1)
+            plot.set_view(view_start, view_start + span)
+            start = perf_counter()
+            plot.repaint()
+            frame_times.append((perf_counter() - start) * 1000)
+            paint_times.append(plot.last_frame_ms)
+        print(f"  1/{zoom:<7,} paint {summarize(paint_times)}   frame {summarize(frame_times)}")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--sizes",
+        help="signal lengths to measure",
+        nargs="+",
+        type=int,
+        default=[1_000_000, 10_000_000],
+    )
+    parser.add_argument(
+        "--frames", help="frames drawn per zoom level", type=int, default=60
+    )
+    args = parser.parse_args()
+
+    environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(sys.argv)
+    plot = SignalPlot()
+    plot.resize(1280, 400)
+    plot.show()
+    for size in args.sizes:
+        run_size(app, plot, size, args.frames)
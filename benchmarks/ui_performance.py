@@ -0,0 +1,74 @@
+# :Title: ui_performance.py
+# :Description: Headless scripted ui performance run of the frontend with a json report
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+#
+# Run from the project root: python -m benchmarks.ui_performance [--script actions.json] [--output report.json]
+#                             python -m benchmarks.ui_performance --replay session.jsonl [--paced]
+
+# Imports
+import sys
+from argparse import ArgumentParser
+from json import dump, load
+from os import environ
+from pathlib import Path
+
+from PySide6.QtWidgets import QApplication
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--script", help="json list of actions to run instead of the default script"
+    )
+    parser.add_argument(
+        "--replay", help="event log recorded with main.py --record to replay instead of a script"
+    )
+    parser.add_argument(
+        "--paced",
+        help="wait out the recorded delay between replayed events instead of only waiting for the ui to settle",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--repeat", help="number of times to run the script", type=int, default=3
+    )
+    parser.add_argument(
+        "--output", help="where to write the json report", default="ui_performance.json"
+    )
+    args = parser.parse_args()
+
+    # No display needed, this runs on CI machines
+    environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+
+    from frontend.frontend import Frontend
+    from frontend.performance.interaction_recorder import load_events
+    from frontend.performance.ui_runner import DEFAULT_SCRIPT, UiRunner
+
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script) as script_file:
+            script = load(script_file)
+    elif args.replay:
+        script = load_events(args.replay)
+
+    frontend = Frontend()
+    frontend.show()
+    runner = UiRunner(app, frontend, args.paced)
+    runner.run_script(script, args.repeat)
+
+    report = runner.report()
+    if args.replay:
+        for index, result in enumerate(report["actions"]):
+            sys.stderr.write(
+                f"{index:4} {result['name']:40} handler {result['handler_ms']:8.2f}ms "
+                f"settled {result['settled_ms']:8.2f}ms, {result['paints']} paints\n"
+            )
+    with open(Path(args.output), "w") as report_file:
+        dump(report, report_file, indent=2)
+    for key, stats in report["summary"].items():
+        sys.stderr.write(
+            f"{key:32} settled {stats['median_settled_ms']:8.2f}ms median "
+            f"{stats['max_settled_ms']:8.2f}ms max, {stats['mean_paints']:.1f} paints\n"
+        )
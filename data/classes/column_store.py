@@ -0,0 +1,710 @@
+# :Title: column_store.py
+# :Description: Columnar dataset of typed arrays, optionally memory mapped from a small file format
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from array import array
+from itertools import compress, repeat
+from json import dumps, loads
+from math import fsum
+from mmap import ACCESS_READ, mmap
+from operator import eq, ge, gt, le, lt, ne
+from pathlib import Path
+from shutil import copyfileobj
+from struct import Struct
+from sys import byteorder
+from tempfile import TemporaryDirectory
+from typing import Any, BinaryIO, Iterable, Sequence
+
+from data.classes.table_source import TableSource
+
+STORE_MAGIC = b"GBCOL1\n"
+""" Written at the start of every column store file """
+HEADER_SIZE = Struct("<I")
+""" Length of the json header that follows the magic """
+ALIGNMENT = 8
+""" Every column starts at a multiple of this many bytes so it can be cast in place """
+TYPECODES = "bBhHiIqQfd"
+""" The array typecodes a column can hold """
+COMPARISONS = {"<": lt, "<=": le, "==": eq, "!=": ne, ">": gt, ">=": ge}
+""" The operators where accepts """
+COPY_BYTES = 1024 * 1024
+""" Bytes copied at a time when a writer puts its spilled columns together """
+MAX_CATEGORIES = 65536
+""" Distinct values a text column is category coded up to, past it the text is stored as is """
+
+
+class Column(object):
+    """
+    One typed column, its values are a memoryview so slices share memory with the original.
+    Text columns hold codes into a list of categories, or with too many distinct values for that
+    the utf-8 text of every row back to back and the offset every row starts at.
+
+    Args:
+        object (object): Column inherits from object
+    """
+
+    def __init__(
+        self, name: str, values: memoryview, categories: list[str] = None, text: memoryview = None
+    ) -> None:
+        self.name: str = name
+        """ Name of the column """
+        self.values: memoryview = values
+        """ The typed values (the category codes or the 'Q' text offsets of text columns) """
+        self.categories: list[str] = categories
+        """ The text of every code, None for other columns """
+        self.text: memoryview = text
+        """ The utf-8 text of every row, None for other columns. values then holds one offset
+        per row plus the end of the last row """
+
+    @property
+    def typecode(self) -> str:
+        """
+        The array typecode of the values
+
+        Returns:
+            str: One of TYPECODES
+        """
+        return self.values.format
+
+    def __len__(self) -> int:
+        return len(self.values) - 1 if self.text is not None else len(self.values)
+
+    def __getitem__(self, row: int) -> Any:
+        if self.categories is not None:
+            return self.categories[self.values[row]]
+        if self.text is not None:
+            return str(self.text[self.values[row] : self.values[row + 1]], "utf-8")
+        return self.values[row]
+
+    def slice(self, start: int, stop: int) -> "Column":
+        """
+        Method to view a range of rows without copying
+
+        Args:
+            start (int): First row
+            stop (int): Row after the last row
+
+        Returns:
+            Column: Column over the same memory
+        """
+        if self.text is not None:
+            # The offsets keep pointing into the whole text, so one more is kept for the end of the last row
+            start, stop, _ = slice(start, stop).indices(len(self))
+            return Column(self.name, self.values[start : max(start, stop) + 1], text=self.text)
+        return Column(self.name, self.values[start:stop], self.categories)
+
+    def read(self, start: int, stop: int) -> list[Any]:
+        """
+        Method to read a range of rows as python values
+
+        Args:
+            start (int): First row
+            stop (int): Row after the last row
+
+        Returns:
+            list[Any]: The values, text for text columns
+        """
+        if self.text is not None:
+            start, stop, _ = slice(start, stop).indices(len(self))
+            offsets = self.values[start : max(start, stop) + 1].tolist()
+            text = bytes(self.text[offsets[0] : offsets[-1]])
+            first = offsets[0]
+            return [
+                str(text[begin - first : end - first], "utf-8") for begin, end in zip(offsets, offsets[1:])
+            ]
+        values = self.values[start:stop].tolist()
+        if self.categories is None:
+            return values
+        return list(map(self.categories.__getitem__, values))
+
+
+class ColumnStore(TableSource):
+    """
+    Dataset of equally long typed columns, usable as the source of a LazyTableModel.
+    Loaded stores map their file, so every process opening it shares the same pages.
+
+    Args:
+        TableSource (TableSource): ColumnStore inherits from TableSource
+    """
+
+    def __init__(self, columns: list[Column], mapping: mmap = None) -> None:
+        super().__init__([column.name for column in columns])
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise ValueError("Every column of a store needs the same number of rows")
+        self.data: dict[str, Column] = {column.name: column for column in columns}
+        """ The columns by name """
+        self.mapping: mmap = mapping
+        """ The mapped file the columns point into, None for stores in memory """
+
+        self._rows: int = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, Sequence[Any]]) -> "ColumnStore":
+        """
+        Builds a store in memory, arrays are used as they are and other sequences are converted.
+        Sequences of text become category coded columns, up to MAX_CATEGORIES distinct values.
+
+        Args:
+            columns (dict[str, Sequence[Any]]): The values of every column by name
+
+        Returns:
+            ColumnStore: The new store
+        """
+        built = []
+        for name, values in columns.items():
+            if isinstance(values, (array, memoryview)):
+                built.append(Column(name, memoryview(values)))
+            elif values and isinstance(values[0], str):
+                codes, categories = encode_categories(values)
+                if len(categories) <= MAX_CATEGORIES:
+                    built.append(Column(name, memoryview(codes), categories))
+                else:
+                    offsets, text = encode_text(values)
+                    built.append(Column(name, memoryview(offsets), text=memoryview(text)))
+            elif all(isinstance(value, int) for value in values):
+                built.append(Column(name, memoryview(array("q", values))))
+            else:
+                built.append(Column(name, memoryview(array("d", values))))
+        return cls(built)
+
+    @classmethod
+    def load(cls, path: Path, use_mmap: bool = True) -> "ColumnStore":
+        """
+        Opens a store saved with save
+
+        Args:
+            path (Path): The store file
+            use_mmap (bool, optional): Map the file instead of reading it into memory. Defaults to True.
+
+        Raises:
+            ValueError: The file isn't a store or was written on a machine of the other byte order
+
+        Returns:
+            ColumnStore: The store, its columns point straight into the file when mapped
+        """
+        with open(path, "rb") as store_file:
+            if use_mmap:
+                buffer = mmap(store_file.fileno(), 0, access=ACCESS_READ)
+            else:
+                buffer = store_file.read()
+        view = memoryview(buffer)
+        if bytes(view[: len(STORE_MAGIC)]) != STORE_MAGIC:
+            raise ValueError(f"{path} is not a column store")
+        (header_length,) = HEADER_SIZE.unpack_from(view, len(STORE_MAGIC))
+        header_start = len(STORE_MAGIC) + HEADER_SIZE.size
+        header = loads(bytes(view[header_start : header_start + header_length]))
+        if header["byteorder"] != byteorder:
+            raise ValueError(f"{path} was written on a {header['byteorder']} endian machine")
+
+        data_start = _align(header_start + header_length)
+        columns = []
+        for column in header["columns"]:
+            start = data_start + column["offset"]
+            stop = start + column["size"]
+            values = view[start:stop].cast(column["typecode"])
+            text = view[stop : stop + column["text_size"]] if column.get("text_size") is not None else None
+            columns.append(Column(column["name"], values, column["categories"], text))
+        view.release()
+        return cls(columns, buffer if use_mmap else None)
+
+    def save(self, path: Path) -> None:
+        """
+        Writes the store: magic, json header, then every column aligned to ALIGNMENT bytes.
+        The text of a text column without categories follows right after its offsets.
+
+        Args:
+            path (Path): The file to write
+        """
+        columns = list(self.data.values())
+        with open(path, "wb") as store_file:
+            offsets = _write_header(
+                store_file,
+                self._rows,
+                [
+                    (
+                        column.name,
+                        column.typecode,
+                        column.values.nbytes,
+                        column.categories,
+                        column.text.nbytes if column.text is not None else None,
+                    )
+                    for column in columns
+                ],
+            )
+            for column, offset in zip(columns, offsets):
+                store_file.write(b"\0" * (offset - store_file.tell()))
+                store_file.write(column.values.cast("B"))
+                if column.text is not None:
+                    store_file.write(column.text)
+
+    def close(self) -> None:
+        """
+        Method to release the mapped file, the store can't be read afterwards.
+        The file stays mapped until slices taken from the store are released too.
+        """
+        for column in self.data.values():
+            column.values.release()
+            if column.text is not None:
+                column.text.release()
+        if self.mapping is not None:
+            try:
+                self.mapping.close()
+            except BufferError:
+                pass
+            self.mapping = None
+
+    def column(self, name: str) -> Column:
+        """
+        Method to get a column by name
+
+        Args:
+            name (str): The column name
+
+        Returns:
+            Column: The column
+        """
+        return self.data[name]
+
+    def row_count(self) -> int:
+        """
+        Method to get the number of rows in the store
+
+        Returns:
+            int: The row count
+        """
+        return self._rows
+
+    def read_rows(self, start: int, stop: int) -> list[tuple]:
+        """
+        Method to read a range of rows
+
+        Args:
+            start (int): First row to read
+            stop (int): Row after the last row to read
+
+        Returns:
+            list[tuple]: One tuple of column values per row
+        """
+        return list(zip(*(column.read(start, stop) for column in self.data.values())))
+
+    def column_values(self, column: int) -> Column:
+        """
+        Method to get every value of a column without copying it
+
+        Args:
+            column (int): The column number
+
+        Returns:
+            Column: The column, indexable by row
+        """
+        return self.data[self.columns[column]]
+
+    def slice(self, start: int, stop: int) -> "ColumnStore":
+        """
+        Method to view a range of rows without copying
+
+        Args:
+            start (int): First row
+            stop (int): Row after the last row
+
+        Returns:
+            ColumnStore: Store over the same memory
+        """
+        return ColumnStore(
+            [column.slice(start, stop) for column in self.data.values()], self.mapping
+        )
+
+    def take(self, rows: Iterable[int]) -> "ColumnStore":
+        """
+        Method to copy the chosen rows into a new store in memory
+
+        Args:
+            rows (Iterable[int]): Row numbers, for example from where
+
+        Returns:
+            ColumnStore: The new store
+        """
+        rows = rows if isinstance(rows, (array, list)) else array("q", rows)
+        columns = []
+        for column in self.data.values():
+            if column.text is not None:
+                offsets, text = encode_text(map(column.__getitem__, rows))
+                columns.append(Column(column.name, memoryview(offsets), text=memoryview(text)))
+            else:
+                values = array(column.typecode, map(column.values.__getitem__, rows))
+                columns.append(Column(column.name, memoryview(values), column.categories))
+        return ColumnStore(columns)
+
+    def where(self, name: str, op: str, value: Any, rows: Iterable[int] = None) -> array:
+        """
+        Method to find the rows whose column compares true against a value.
+        The comparison runs over the whole column in C (map over the memoryview), not row by row in python.
+
+        Args:
+            name (str): The column name
+            op (str): One of COMPARISONS
+            value (Any): The value to compare against, text for text columns (== and != only)
+            rows (Iterable[int], optional): Only look at these rows, to combine filters. Defaults to None.
+
+        Returns:
+            array: The matching row numbers ('q' array)
+        """
+        column = self.data[name]
+        compare = COMPARISONS[op]
+        if column.categories is not None or column.text is not None:
+            if op not in ("==", "!="):
+                raise ValueError("Text columns only support == and !=")
+        if column.categories is not None:
+            value = column.categories.index(value) if value in column.categories else -1
+        # Text stored as is has to be decoded row by row
+        lookup = column.__getitem__ if column.text is not None else column.values.__getitem__
+        if rows is None:
+            values = column.values if column.text is None else map(lookup, range(len(column)))
+            mask = map(compare, values, repeat(value))
+            return array("q", compress(range(len(column)), mask))
+        rows = rows if isinstance(rows, (array, list)) else array("q", rows)
+        mask = map(compare, map(lookup, rows), repeat(value))
+        return array("q", compress(rows, mask))
+
+    def aggregate(self, name: str, func: str, rows: Iterable[int] = None) -> float:
+        """
+        Method to reduce a number column, over every row or only the given ones
+
+        Args:
+            name (str): The column name
+            func (str): count, sum, min, max or mean
+            rows (Iterable[int], optional): Only use these rows, for example from where. Defaults to None.
+
+        Returns:
+            float: The result, None for min, max and mean of no rows
+        """
+        column = self.data[name]
+        values = column.values
+        if rows is not None:
+            values = list(map(values.__getitem__, rows))
+        if func == "count":
+            return len(column) if rows is None else len(values)
+        if func == "sum":
+            return fsum(values) if column.typecode in "fd" else sum(values)
+        if not len(values):
+            return None
+        if func == "min":
+            return min(values)
+        if func == "max":
+            return max(values)
+        if func == "mean":
+            return fsum(values) / len(values)
+        raise ValueError(f"Unknown aggregate {func}")
+
+
+class ColumnStoreWriter(object):
+    """
+    Builds a store file from chunks of columns while holding at most one chunk in memory.
+    Every column is spilled to its own temporary file next to the output until close puts them together.
+    Text columns are category coded until they pass MAX_CATEGORIES distinct values, from then on
+    the text itself is spilled so memory stays bounded however many distinct values a column has.
+
+    Args:
+        object (object): ColumnStoreWriter inherits from object
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = Path(path)
+        """ The store file written by close """
+        self.rows: int = 0
+        """ Rows appended so far """
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._spill_dir = TemporaryDirectory(dir=self.path.parent, prefix=".column_spill_")
+        self._spills: dict[str, BinaryIO] = {}
+        self._typecodes: dict[str, str] = {}
+        self._categories: dict[str, dict[str, int]] = {}
+        self._texts: dict[str, BinaryIO] = {}
+
+    def append(self, columns: dict[str, Sequence[Any]]) -> None:
+        """
+        Method to add a chunk of rows, every column must be given in every chunk.
+        Arrays keep their typecode (an 'q' column turns 'd' once a 'd' chunk arrives, a number column turns
+        text once text arrives) and text is category coded up to MAX_CATEGORIES distinct values.
+
+        Args:
+            columns (dict[str, Sequence[Any]]): Arrays or lists of text of equal length by column name
+
+        Raises:
+            ValueError: The chunk doesn't fit the columns appended before
+        """
+        if len({len(values) for values in columns.values()}) > 1:
+            raise ValueError("Every column of a chunk needs the same number of rows")
+        if self._spills and set(columns) != set(self._spills):
+            raise ValueError("Every chunk needs the same columns")
+        for name, values in columns.items():
+            if name not in self._spills:
+                self._spills[name] = open(Path(self._spill_dir.name, f"{len(self._spills)}.col"), "w+b")
+                if isinstance(values, array):
+                    self._typecodes[name] = values.typecode
+                else:
+                    self._typecodes[name] = "I"
+                    self._categories[name] = {}
+            if not isinstance(values, array):
+                self._append_text(name, values)
+                continue
+            if name in self._categories or name in self._texts:
+                raise ValueError(f"Column {name} can't change from text to '{values.typecode}'")
+            if values.typecode != self._typecodes[name]:
+                values = self._convert(name, values)
+            values.tofile(self._spills[name])
+        self.rows += len(next(iter(columns.values()), ()))
+
+    def close(self) -> Path:
+        """
+        Method to write the store file from the spilled columns and remove them
+
+        Returns:
+            Path: The store file, open it with ColumnStore.load
+        """
+        names = list(self._spills)
+        try:
+            with open(self.path, "wb") as store_file:
+                # The offsets of text columns end with the end of the last row
+                for name, text in self._texts.items():
+                    array("Q", [text.tell()]).tofile(self._spills[name])
+                offsets = _write_header(
+                    store_file,
+                    self.rows,
+                    [
+                        (
+                            name,
+                            self._typecodes[name],
+                            self._spills[name].tell(),
+                            list(self._categories[name]) if name in self._categories else None,
+                            self._texts[name].tell() if name in self._texts else None,
+                        )
+                        for name in names
+                    ],
+                )
+                for name, offset in zip(names, offsets):
+                    store_file.write(b"\0" * (offset - store_file.tell()))
+                    for spill in (self._spills[name], self._texts.get(name)):
+                        if spill is not None:
+                            spill.seek(0)
+                            copyfileobj(spill, store_file, COPY_BYTES)
+        finally:
+            self.discard()
+        return self.path
+
+    def discard(self) -> None:
+        """
+        Method to remove the spilled columns without writing the store, used when an import stops early.
+        """
+        for spill in [*self._spills.values(), *self._texts.values()]:
+            spill.close()
+        self._spills = {}
+        self._texts = {}
+        self._spill_dir.cleanup()
+
+    def _append_text(self, name: str, values: Sequence[str]) -> None:
+        """
+        Method to spill a chunk of a text column, as category codes until the column passes MAX_CATEGORIES
+
+        Args:
+            name (str): The column name
+            values (Sequence[str]): The chunk of the column
+        """
+        if name not in self._categories and name not in self._texts:
+            self._textify(name)
+        codes = self._categories.get(name)
+        if codes is not None:
+            chunk = array("I", (codes.setdefault(value, len(codes)) for value in values))
+            if len(codes) <= MAX_CATEGORIES:
+                chunk.tofile(self._spills[name])
+                return
+            self._uncategorize(name)
+        self._spill_text(name, (value.encode() for value in values))
+
+    def _textify(self, name: str) -> None:
+        """
+        Method to rewrite the numbers spilled so far as text and category code the column from now on,
+        a block at a time
+
+        Args:
+            name (str): The column name
+        """
+        typecode = self._typecodes[name]
+        index = list(self._spills).index(name)
+        old = self._spills[name]
+        self._spills[name] = open(Path(self._spill_dir.name, f"{index}.{self.rows}.codes.col"), "w+b")
+        self._typecodes[name] = "I"
+        self._categories[name] = {}
+        old.seek(0)
+        while block := old.read(COPY_BYTES):
+            self._append_text(name, [_number_text(value) for value in array(typecode, block)])
+        old.close()
+
+    def _uncategorize(self, name: str) -> None:
+        """
+        Method to rewrite the codes spilled so far as text and stop category coding a column, a block at a time
+
+        Args:
+            name (str): The column name
+        """
+        categories = [category.encode() for category in self._categories.pop(name)]
+        index = list(self._spills).index(name)
+        old = self._spills[name]
+        self._spills[name] = open(Path(self._spill_dir.name, f"{index}.{self.rows}.col"), "w+b")
+        self._texts[name] = open(Path(self._spill_dir.name, f"{index}.text"), "w+b")
+        self._typecodes[name] = "Q"
+        old.seek(0)
+        while block := old.read(COPY_BYTES):
+            self._spill_text(name, map(categories.__getitem__, array("I", block)))
+        old.close()
+
+    def _spill_text(self, name: str, values: Iterable[bytes]) -> None:
+        """
+        Method to spill encoded text of a column along with the offset every row starts at
+
+        Args:
+            name (str): The column name
+            values (Iterable[bytes]): The utf-8 text of every row
+        """
+        text = self._texts[name]
+        position = text.tell()
+        offsets = array("Q")
+        chunk = bytearray()
+        for value in values:
+            offsets.append(position + len(chunk))
+            chunk += value
+        offsets.tofile(self._spills[name])
+        text.write(chunk)
+
+    def _convert(self, name: str, values: array) -> array:
+        """
+        Method to bring a chunk and the column to the same typecode, only whole numbers turning decimal is allowed
+
+        Args:
+            name (str): The column name
+            values (array): The chunk of the column
+
+        Raises:
+            ValueError: The typecodes can't be combined
+
+        Returns:
+            array: The chunk in the typecode of the column
+        """
+        typecode = self._typecodes[name]
+        if values.typecode == "q" and typecode == "d":
+            return array("d", values)
+        if values.typecode != "d" or typecode != "q":
+            raise ValueError(f"Column {name} can't change from '{typecode}' to '{values.typecode}'")
+
+        # Rewrite what was spilled so far as decimals, a block at a time
+        old = self._spills[name]
+        new = open(Path(self._spill_dir.name, f"{list(self._spills).index(name)}.{self.rows}.col"), "w+b")
+        old.seek(0)
+        while block := old.read(COPY_BYTES):
+            array("d", array("q", block)).tofile(new)
+        old.close()
+        self._spills[name] = new
+        self._typecodes[name] = "d"
+        return values
+
+
+def encode_categories(values: Iterable[str]) -> tuple[array, list[str]]:
+    """
+    Turns text into category codes, each distinct text is stored once
+
+    Args:
+        values (Iterable[str]): The text values
+
+    Returns:
+        tuple[array, list[str]]: ('I' array of codes, the text of every code)
+    """
+    codes: dict[str, int] = {}
+    encoded = array("I", (codes.setdefault(value, len(codes)) for value in values))
+    return encoded, list(codes)
+
+
+def encode_text(values: Iterable[str]) -> tuple[array, bytes]:
+    """
+    Turns text into utf-8 stored back to back, for text with too many distinct values to category code
+
+    Args:
+        values (Iterable[str]): The text values
+
+    Returns:
+        tuple[array, bytes]: ('Q' array of the offset every value starts at plus the end, the text)
+    """
+    offsets = array("Q", [0])
+    text = bytearray()
+    for value in values:
+        text += value.encode()
+        offsets.append(len(text))
+    return offsets, bytes(text)
+
+
+def _number_text(value: float) -> str:
+    """
+    Writes a number of a column turning text the way it would be read from a file, nan is an empty field
+
+    Args:
+        value (float): The number
+
+    Returns:
+        str: The text of the number
+    """
+    return "" if value != value else repr(value)
+
+
+def _write_header(
+    store_file: BinaryIO, rows: int, columns: list[tuple[str, str, int, list[str], int]]
+) -> list[int]:
+    """
+    Writes the magic and json header of a store file
+
+    Args:
+        store_file (BinaryIO): The file being written, at its start
+        rows (int): Rows in the store
+        columns (list[tuple[str, str, int, list[str], int]]): (name, typecode, size in bytes, categories,
+            size of the text that follows in bytes) of every column
+
+    Returns:
+        list[int]: The position in the file every column has to be written at
+    """
+    # Column offsets are relative to the aligned end of the header
+    header = {"byteorder": byteorder, "rows": rows, "columns": []}
+    offset = 0
+    for name, typecode, size, categories, text_size in columns:
+        header["columns"].append(
+            {
+                "name": name,
+                "typecode": typecode,
+                "offset": offset,
+                "size": size,
+                "categories": categories,
+                "text_size": text_size,
+            }
+        )
+        offset = _align(offset + size + (text_size or 0))
+    text = dumps(header).encode()
+    data_start = _align(len(STORE_MAGIC) + HEADER_SIZE.size + len(text))
+
+    store_file.write(STORE_MAGIC)
+    store_file.write(HEADER_SIZE.pack(len(text)))
+    store_file.write(text)
+    return [data_start + column["offset"] for column in header["columns"]]
+
+
+def _align(offset: int) -> int:
+    """
+    Rounds an offset up to the next multiple of ALIGNMENT
+
+    Args:
+        offset (int): The offset in bytes
+
+    Returns:
+        int: The aligned offset
+    """
+    return -(-offset // ALIGNMENT) * ALIGNMENT
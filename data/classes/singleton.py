@@ -1,20 +1,150 @@
 # :Title: singleton.py
 # :Description: Class to inherit in other classes to create singleton
 # :Created: 5/31/2024
-# :Last Modified: 5/31/2024
+# :Last Modified: 10/19/2026
 # :Author: Robert Greenslade
 
+# Imports
+from functools import wraps
+from threading import RLock
+from typing import Callable
+
+
+def _init_once(init: Callable, owner: type) -> Callable:
+    """
+    Wraps a singleton __init__ so it only ever runs once per instance
+
+    Args:
+        init (Callable): The __init__ defined on the singleton class
+        owner (type): The class init is defined on
+
+    Returns:
+        Callable: __init__ that returns right away once the instance is initialized
+    """
+
+    @wraps(init)
+    def wrapper(self, *args, **kwargs) -> None:
+        if self._singleton_initialized:
+            return
+        cls = type(self)
+        with cls._singleton_lock:
+            running = self._singleton_initializing
+            if running:
+                # Only the super().__init__ chain of the running __init__ gets through, any other
+                # re-entry (like instance() reached from inside __init__) gets the partly built instance
+                if owner in running:
+                    return
+                self._singleton_initializing = running + (owner,)
+                try:
+                    init(self, *args, **kwargs)
+                finally:
+                    self._singleton_initializing = running
+                return
+            if self._singleton_initialized:
+                return
+            self._singleton_initializing = (owner,)
+            try:
+                init(self, *args, **kwargs)
+            finally:
+                self._singleton_initializing = ()
+            self._singleton_initialized = True
+            cls._singleton_ready = self
+
+    return wrapper
+
 
 class Singleton(object):
     """
-    Class to inherit from anywhere in the code where a singleton is needed
+    Class to inherit from anywhere in the code where a singleton is needed.
+    Creation is thread safe and __init__ only runs the first time the class is called.
 
     Args:
         object (object): Singleton inherits from object
     """
 
+    _singleton_classes: list[type] = []
+    """ Every singleton class, in the order they were defined """
+    _singleton_initialized: bool = False
+    """ Whether or not __init__ has finished on this instance """
+    _singleton_initializing: tuple[type, ...] = ()
+    """ Classes whose __init__ is currently running on this instance, outermost first """
+    _singleton_lock: RLock = RLock()
+    """ Guards creating the instance, every subclass gets its own """
+    _singleton_instance: "Singleton" = None
+    """ The instance of the class, set once __new__ made it """
+    _singleton_ready: "Singleton" = None
+    """ The instance once its __init__ finished, what instance hands out """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every class gets its own instance and lock, subclasses never share their parent's
+        cls._singleton_lock = RLock()
+        cls._singleton_instance = None
+        cls._singleton_ready = None
+        Singleton._singleton_classes.append(cls)
+        if "__init__" in cls.__dict__:
+            cls.__init__ = _init_once(cls.__dict__["__init__"], cls)
+
     def __new__(cls, *args, **kwargs):
-        # see if the instance is already in existence. If not, make a new one.
-        if not hasattr(cls, "_singleton_instance"):
-            cls._singleton_instance = super(Singleton, cls).__new__(cls)
-        return cls._singleton_instance
+        # see if the instance is already in existence. If not, make a new one under the lock.
+        instance = cls._singleton_instance
+        if instance is None:
+            with cls._singleton_lock:
+                instance = cls._singleton_instance
+                if instance is None:
+                    instance = super(Singleton, cls).__new__(cls)
+                    cls._singleton_instance = instance
+                    # Without an __init__ to wrap (the base class itself) the instance is ready right away
+                    if cls.__init__ is object.__init__:
+                        instance._singleton_initialized = True
+                        cls._singleton_ready = instance
+        return instance
+
+    @classmethod
+    def instance(cls):
+        """
+        Cached accessor for hot paths, skips __new__ and __init__ once the instance is ready
+
+        Returns:
+            Singleton: The initialized instance of the class
+        """
+        instance = cls._singleton_ready
+        if instance is None:
+            instance = cls()
+        return instance
+
+    @classmethod
+    def has_instance(cls) -> bool:
+        """
+        Whether or not the class has been instantiated
+
+        Returns:
+            bool: True if an initialized instance exists
+        """
+        return cls._singleton_ready is not None
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """
+        Drops the current instance so the next call builds a fresh one, used by tests and benchmarks.
+        The on_reset hook of the dropped instance is run first.
+        """
+        with cls._singleton_lock:
+            instance = cls._singleton_instance
+            cls._singleton_instance = None
+            cls._singleton_ready = None
+        if instance is not None and instance._singleton_initialized:
+            instance.on_reset()
+
+    @staticmethod
+    def reset_all() -> None:
+        """
+        Drops the instances of every singleton class, newest classes first and the base class last
+        """
+        for cls in [*reversed(Singleton._singleton_classes), Singleton]:
+            cls.reset_instance()
+
+    def on_reset(self) -> None:
+        """
+        Hook run when reset_instance drops this instance, override to release resources.
+        """
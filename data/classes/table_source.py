@@ -0,0 +1,127 @@
+# :Title: table_source.py
+# :Description: Row access interface that lazy tables read their data through
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from abc import ABC, abstractmethod
+from typing import Any, Sequence
+
+
+class TableSource(ABC):
+    """
+    Class to inherit from for anything a LazyTableModel shows.
+    Rows are only read in ranges when the table needs them, nothing is copied up front.
+
+    Args:
+        ABC (ABC): TableSource inherits from ABC, row_count and read_rows have to be implemented
+    """
+
+    def __init__(self, columns: list[str]) -> None:
+        self.columns: list[str] = list(columns)
+        """ The column names, in display order """
+
+    @abstractmethod
+    def row_count(self) -> int:
+        """
+        Method to get the number of rows in the source
+
+        Returns:
+            int: The row count
+        """
+
+    @abstractmethod
+    def read_rows(self, start: int, stop: int) -> list[Sequence[Any]]:
+        """
+        Method to read a range of rows
+
+        Args:
+            start (int): First row to read
+            stop (int): Row after the last row to read
+
+        Returns:
+            list[Sequence[Any]]: One sequence of column values per row
+        """
+
+    def column_values(self, column: int) -> Sequence[Any]:
+        """
+        Method to get every value of a column, used to build sort and filter indexes.
+        Override it to hand out the column without copying (the default reads every row).
+
+        Args:
+            column (int): The column number
+
+        Returns:
+            Sequence[Any]: The values of the column, indexable by row
+        """
+        return [row[column] for row in self.read_rows(0, self.row_count())]
+
+
+class ColumnView(object):
+    """
+    Read only view of one column of a list of rows, nothing is copied
+
+    Args:
+        object (object): ColumnView inherits from object
+    """
+
+    def __init__(self, rows: Sequence[Sequence[Any]], column: int) -> None:
+        self.rows: Sequence[Sequence[Any]] = rows
+        """ The rows the column belongs to """
+        self.column: int = column
+        """ The column number """
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.rows[row][self.column]
+
+
+class ListTableSource(TableSource):
+    """
+    TableSource over rows that are already in memory
+
+    Args:
+        TableSource (TableSource): ListTableSource inherits from TableSource
+    """
+
+    def __init__(self, columns: list[str], rows: Sequence[Sequence[Any]]) -> None:
+        super().__init__(columns)
+        self.rows: Sequence[Sequence[Any]] = rows
+        """ The rows, used as given """
+
+    def row_count(self) -> int:
+        """
+        Method to get the number of rows in the source
+
+        Returns:
+            int: The row count
+        """
+        return len(self.rows)
+
+    def read_rows(self, start: int, stop: int) -> list[Sequence[Any]]:
+        """
+        Method to read a range of rows
+
+        Args:
+            start (int): First row to read
+            stop (int): Row after the last row to read
+
+        Returns:
+            list[Sequence[Any]]: The rows in the range
+        """
+        return list(self.rows[start:stop])
+
+    def column_values(self, column: int) -> ColumnView:
+        """
+        Method to get every value of a column without copying it
+
+        Args:
+            column (int): The column number
+
+        Returns:
+            ColumnView: View of the column over the rows
+        """
+        return ColumnView(self.rows, column)
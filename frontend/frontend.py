@@ -1,13 +1,15 @@
 # :Title: frontend.py
 # :Description: Gather all frontend code into one window
 # :Created: 5/30/2024
-# :Last Modified: 6/6/2024
+# :Last Modified: 10/19/2026
 # :Author: Robert Greenslade
 
 # Imports
-from pathlib import Path
+from PySide6.QtCore import QFile, QIODevice
 
+import frontend.resources.compiled.resources  # noqa: F401 registers the bundled assets
 from backend.console_logging.console_logging import ConsoleLevel
+from frontend.performance.page_switch_metrics import measure_page_switch, measure_restyle
 from frontend.widgets.console_widget import ConsoleWidget
 from frontend.widgets.main_window import MainWindow
 from frontend.widgets.side_widgets.side_page_1 import SidePage1
@@ -19,7 +21,8 @@ from frontend.widgets.top_widgets.top_page_2 import TopPage2
 from frontend.widgets.top_widgets.top_page_3 import TopPage3
 from frontend.widgets.top_widgets.top_page_4 import TopPage4
 from middleware.console_output import log as print
-from middleware.console_output import set_console
+from middleware.console_output import set_console, set_log_page
+from middleware.memory import track_memory
 
 
 class Frontend(MainWindow):
@@ -34,9 +37,11 @@ class Frontend(MainWindow):
         # Main Window Init
         super().__init__()
 
-        with open(Path("frontend").joinpath("dark_style.qss")) as dark_style_file:
-            _dark_style = dark_style_file.read()
-            self.setStyleSheet(_dark_style)
+        # Styles come from the compiled resource bundle, no file access needed
+        dark_style_file = QFile(":/dark_style.qss")
+        dark_style_file.open(QIODevice.ReadOnly | QIODevice.Text)
+        self.setStyleSheet(bytes(dark_style_file.readAll()).decode())
+        dark_style_file.close()
 
         # Console Widget Init
         self.console_widget = ConsoleWidget()
@@ -64,6 +69,16 @@ class Frontend(MainWindow):
         self.top_page_3_layout.addWidget(self.top_page_3_widget)
         self.top_page_4_layout.addWidget(self.top_page_4_widget)
 
+        # Memory Accounting (only reported while the memory inspector runs)
+        track_memory("SidePage1", self.side_page_1_widget)
+        track_memory("SidePage2", self.side_page_2_widget)
+        track_memory("SidePage3", self.side_page_3_widget)
+        track_memory("SidePage4", self.side_page_4_widget)
+        track_memory("TopPage1", self.top_page_1_widget)
+        track_memory("TopPage2", self.top_page_2_widget)
+        track_memory("TopPage3", self.top_page_3_widget)
+        track_memory("TopPage4", self.top_page_4_widget)
+
         # Button Connection
         self.page_1_btn.clicked.connect(self.on_page_1_btn_click)
         self.page_2_btn.clicked.connect(self.on_page_2_btn_click)
@@ -80,42 +95,51 @@ class Frontend(MainWindow):
         # Set Default Page
         self.on_page_1_btn_click()
 
+    @measure_page_switch
     def on_page_1_btn_click(self) -> None:
         """
         Method for page 1 btn click.
         """
+        set_log_page("Page 1")
         self.side_widget.setCurrentIndex(0)
         self.top_widget.setCurrentIndex(0)
         self._adjust_tab_style(0)
         print("Switched to page 1", ConsoleLevel.DEBUG)
 
+    @measure_page_switch
     def on_page_2_btn_click(self) -> None:
         """
         Method for page 2 btn click.
         """
+        set_log_page("Page 2")
         self.side_widget.setCurrentIndex(1)
         self.top_widget.setCurrentIndex(1)
         self._adjust_tab_style(1)
         print("Switched to page 2", ConsoleLevel.DEBUG)
 
+    @measure_page_switch
     def on_page_3_btn_click(self) -> None:
         """
         Method for page 3 btn click.
         """
+        set_log_page("Page 3")
         self.side_widget.setCurrentIndex(2)
         self.top_widget.setCurrentIndex(2)
         self._adjust_tab_style(2)
         print("Switched to page 3", ConsoleLevel.DEBUG)
 
+    @measure_page_switch
     def on_page_4_btn_click(self) -> None:
         """
         Method for page 4 btn click.
         """
+        set_log_page("Page 4")
         self.side_widget.setCurrentIndex(3)
         self.top_widget.setCurrentIndex(3)
         self._adjust_tab_style(3)
         print("Switched to page 4", ConsoleLevel.DEBUG)
 
+    @measure_restyle
     def _adjust_tab_style(self, tab_index: int) -> None:
         """
         Method for adjusting the style of the page buttons as they are clicked.
@@ -0,0 +1,147 @@
+# :Title: interaction_recorder.py
+# :Description: Records page button clicks, resizes and splitter moves of the frontend into a replayable event log
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from json import dumps, loads
+from pathlib import Path
+from time import perf_counter
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QAbstractButton, QMainWindow, QSplitter
+
+from backend.console_logging.console_logging import ConsoleLevel
+from middleware.console_output import log as print
+
+COALESCE_MS = 250
+""" Moves of the same splitter or window resizes closer together than this are kept as one event """
+
+
+def load_events(path: Path) -> list[dict]:
+    """
+    Reads an event log written by InteractionRecorder
+
+    Args:
+        path (Path): The event log, one json event per line
+
+    Returns:
+        list[dict]: The events, UiRunner actions with an after_ms delay
+    """
+    with open(path) as event_file:
+        return [loads(line) for line in event_file if line.strip()]
+
+
+def save_events(path: Path, events: list[dict]) -> None:
+    """
+    Writes an event log, one compact json event per line
+
+    Args:
+        path (Path): Where to write the log
+        events (list[dict]): The events
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as event_file:
+        for event in events:
+            event_file.write(dumps(event, separators=(",", ":")) + "\n")
+
+
+class InteractionRecorder(QObject):
+    """
+    Records what a user does to the frontend window as UiRunner actions, so a session can be replayed
+    headless by benchmarks/ui_performance.py. Only controls the window holds as attributes are recorded,
+    those are the names UiRunner looks targets up by.
+    Bursts of splitter moves and resizes are coalesced into their final state to keep the log compact.
+
+    Args:
+        QObject (QObject): InteractionRecorder inherits from QObject
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self.path: Path = Path(path)
+        """ Where the event log is saved """
+        self.window: QMainWindow = None
+        """ The recorded window, set by attach """
+        self.events: list[dict] = []
+        """ The recorded events in order """
+
+        self._last_time: float = None
+
+    def attach(self, window: QMainWindow) -> None:
+        """
+        Method to start recording a window, the first events restore its current size and splitters
+
+        Args:
+            window (QMainWindow): The frontend window
+        """
+        self.window = window
+        self._last_time = perf_counter()
+        self.events.append({"action": "resize", "width": window.width(), "height": window.height(), "after_ms": 0})
+
+        for name, widget in vars(window).items():
+            if isinstance(widget, QAbstractButton):
+                widget.clicked.connect(lambda _=False, name=name: self._record({"action": "click", "target": name}))
+            elif isinstance(widget, QSplitter):
+                self.events.append({"action": "splitter", "target": name, "sizes": widget.sizes(), "after_ms": 0})
+                widget.splitterMoved.connect(
+                    lambda _position, _index, name=name, splitter=widget: self._record(
+                        {"action": "splitter", "target": name, "sizes": splitter.sizes()}
+                    )
+                )
+        window.installEventFilter(self)
+        print(f"Recording interactions into {self.path}", ConsoleLevel.DEBUG)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """
+        The override method that records resizes of the window
+
+        Args:
+            watched (QObject): The window
+            event (QEvent): The event
+
+        Returns:
+            bool: Always False so the event is still delivered
+        """
+        if event.type() == QEvent.Resize:
+            size = event.size()
+            self._record({"action": "resize", "width": size.width(), "height": size.height()})
+        return False
+
+    def save(self) -> Path:
+        """
+        Method to write the event log, connected to aboutToQuit
+
+        Returns:
+            Path: The written log, None if the recorder was never attached
+        """
+        if self.window is None:
+            return None
+        save_events(self.path, self.events)
+        print(f"Recorded {len(self.events)} interactions into {self.path}")
+        return self.path
+
+    def _record(self, event: dict) -> None:
+        """
+        Adds an event with the ms since the one before, a burst of the same move only keeps its last state
+
+        Args:
+            event (dict): The UiRunner action
+        """
+        now = perf_counter()
+        after_ms = round((now - self._last_time) * 1000)
+        self._last_time = now
+        last = self.events[-1] if self.events else None
+        if (
+            last is not None
+            and event["action"] in ("resize", "splitter")
+            and last["action"] == event["action"]
+            and last.get("target") == event.get("target")
+            and after_ms < COALESCE_MS
+        ):
+            last.update(event, after_ms=last["after_ms"] + after_ms)
+            return
+        event["after_ms"] = after_ms
+        self.events.append(event)
@@ -0,0 +1,194 @@
+# :Title: page_switch_metrics.py
+# :Description: Measures how long a page button click takes until the new pages are painted
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from functools import wraps
+from time import perf_counter
+from typing import Callable
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QWidget
+
+from backend.rolling_histogram.rolling_histogram import RollingHistogram
+from data.classes.singleton import Singleton
+from middleware.console_output import log as print
+
+MEASUREMENTS = {
+    "handler": "Page switch handler",
+    "restyle": "Page button restyle",
+    "frame": "Click to new page painted",
+}
+""" The measurements kept for every page switch and their names in the log """
+
+
+class PaintWatcher(QObject):
+    """
+    Event filter that reports when each watched page paints for the first time after a switch
+
+    Args:
+        QObject (QObject): PaintWatcher inherits from QObject
+    """
+
+    def __init__(self, on_painted: Callable[[], None]) -> None:
+        super().__init__()
+        self.waiting: set[QWidget] = set()
+        """ Pages that haven't painted since the switch """
+        self.on_painted = on_painted
+        """ Called once every watched page has painted """
+
+    def watch(self, pages: list[QWidget]) -> None:
+        """
+        Method to start waiting for the pages to paint, replacing any earlier wait
+
+        Args:
+            pages (list[QWidget]): The pages that were switched to
+        """
+        for page in self.waiting:
+            page.removeEventFilter(self)
+        self.waiting = {page for page in pages if page is not None}
+        for page in self.waiting:
+            page.installEventFilter(self)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """
+        The override method that notices the first paint of each watched page
+
+        Args:
+            watched (QObject): The page receiving the event
+            event (QEvent): The event
+
+        Returns:
+            bool: Always False so the paint still happens
+        """
+        if event.type() == QEvent.Paint and watched in self.waiting:
+            self.waiting.discard(watched)
+            watched.removeEventFilter(self)
+            if not self.waiting:
+                self.on_painted()
+        return False
+
+
+class PageSwitchMetrics(Singleton):
+    """
+    Rolling histograms of the handler, restyle and click to paint times of page switches
+
+    Args:
+        Singleton (Singleton): PageSwitchMetrics inherits from Singleton class
+    """
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, RollingHistogram] = {
+            key: RollingHistogram() for key in MEASUREMENTS
+        }
+        """ The histogram of each measurement """
+        self.watcher: PaintWatcher = None
+        """ Waits for the switched to pages to paint, created on the first switch """
+
+        self._clicked_at: float = None
+
+    def begin(self) -> float:
+        """
+        Method to mark the start of a page switch
+
+        Returns:
+            float: perf_counter time of the start
+        """
+        self._clicked_at = perf_counter()
+        return self._clicked_at
+
+    def wait_for_paint(self, pages: list[QWidget]) -> None:
+        """
+        Method to measure until the pages that were switched to have painted
+
+        Args:
+            pages (list[QWidget]): The new current pages
+        """
+        if self.watcher is None:
+            self.watcher = PaintWatcher(self._on_painted)
+        self.watcher.watch(pages)
+
+    def record(self, key: str, start: float) -> None:
+        """
+        Method to record the time since start for a measurement
+
+        Args:
+            key (str): One of the MEASUREMENTS keys
+            start (float): perf_counter time the measurement started
+        """
+        self.histograms[key].record((perf_counter() - start) * 1000)
+
+    def summary(self) -> str:
+        """
+        Method to format every histogram for the log
+
+        Returns:
+            str: The summaries of every measurement
+        """
+        return "\n".join(
+            self.histograms[key].summary(name) for key, name in MEASUREMENTS.items()
+        )
+
+    def _on_painted(self) -> None:
+        """
+        Method called once both new pages have painted.
+        """
+        if self._clicked_at is not None:
+            self.record("frame", self._clicked_at)
+            self._clicked_at = None
+
+
+def measure_page_switch(handler: Callable) -> Callable:
+    """
+    Decorator for the Frontend page button handlers that records the handler time and the time
+    until the new side_widget and top_widget pages are painted
+
+    Args:
+        handler (Callable): The page button handler
+
+    Returns:
+        Callable: The measured handler
+    """
+
+    @wraps(handler)
+    def wrapper(self, *args, **kwargs):
+        metrics = PageSwitchMetrics.instance()
+        start = metrics.begin()
+        result = handler(self, *args, **kwargs)
+        metrics.record("handler", start)
+        metrics.wait_for_paint(
+            [self.side_widget.currentWidget(), self.top_widget.currentWidget()]
+        )
+        return result
+
+    return wrapper
+
+
+def measure_restyle(restyle: Callable) -> Callable:
+    """
+    Decorator for the page button restyle method that records how long the style sheets take
+
+    Args:
+        restyle (Callable): The restyle method
+
+    Returns:
+        Callable: The measured restyle method
+    """
+
+    @wraps(restyle)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        result = restyle(*args, **kwargs)
+        PageSwitchMetrics.instance().record("restyle", start)
+        return result
+
+    return wrapper
+
+
+def log_page_switch_metrics() -> None:
+    """
+    Logs the page switch histograms
+    """
+    print(f"Page switch latency\n{PageSwitchMetrics.instance().summary()}")
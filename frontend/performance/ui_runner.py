@@ -0,0 +1,232 @@
+# :Title: ui_runner.py
+# :Description: Drives the frontend from a script of actions and measures latency and paints per action
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from platform import platform
+from statistics import mean, median
+from sys import version as python_version
+from time import perf_counter, sleep
+
+from PySide6 import __version__ as pyside_version
+from PySide6.QtCore import QEvent, QEventLoop, QObject
+from PySide6.QtWidgets import QApplication, QMainWindow
+
+from backend.console_logging.console_logging import ConsoleLevel
+from middleware.console_output import log as print
+
+QUIET_TIME = 0.05
+""" Seconds without a paint after which an action counts as settled """
+NO_PAINT_TIMEOUT = 0.25
+""" Seconds to wait for a first paint before an action counts as not painting """
+SETTLE_TIMEOUT = 5.0
+""" Most seconds an action is given to settle """
+
+DEFAULT_SCRIPT = [
+    {"action": "click", "target": "page_1_btn"},
+    {"action": "click", "target": "page_2_btn"},
+    {"action": "click", "target": "page_3_btn"},
+    {"action": "click", "target": "page_4_btn"},
+    {"action": "log_storm", "count": 1000, "level": "INFO"},
+    {"action": "log_storm", "count": 1000, "level": "WARNING"},
+    {"action": "resize", "width": 1280, "height": 900},
+    {"action": "resize", "width": 800, "height": 831},
+]
+""" Actions run when no script is given, page clicks, log storms and window resizes """
+TIMING_KEYS = ("after_ms",)
+""" Keys of an action that only pace a replay and aren't part of its name """
+
+
+class PaintCounter(QObject):
+    """
+    Application wide event filter that counts paint events and remembers when they happened
+
+    Args:
+        QObject (QObject): PaintCounter inherits from QObject
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count: int = 0
+        """ Paint events seen since the last reset """
+        self.first_paint: float = None
+        """ perf_counter time of the first paint since the last reset """
+        self.last_paint: float = None
+        """ perf_counter time of the latest paint since the last reset """
+
+    def reset(self) -> None:
+        """
+        Method to start counting a new action.
+        """
+        self.count = 0
+        self.first_paint = self.last_paint = None
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """
+        The override method that records every paint event
+
+        Args:
+            watched (QObject): The object receiving the event
+            event (QEvent): The event
+
+        Returns:
+            bool: Always False so the event is still delivered
+        """
+        if event.type() == QEvent.Paint:
+            now = perf_counter()
+            self.count += 1
+            self.last_paint = now
+            if self.first_paint is None:
+                self.first_paint = now
+        return False
+
+
+class UiRunner:
+    """
+    Runs scripted actions against a frontend window and measures each one
+    """
+
+    def __init__(self, app: QApplication, window: QMainWindow, paced: bool = False) -> None:
+        self.app: QApplication = app
+        """ The running application """
+        self.window: QMainWindow = window
+        """ The frontend window actions are run against """
+        self.paced: bool = paced
+        """ Whether or not recorded actions wait out their after_ms delay, off replays as fast as the ui settles """
+        self.results: list[dict] = []
+        """ The measurements of every action run so far """
+
+        self._last_start: float = None
+
+        self.paints = PaintCounter()
+        app.installEventFilter(self.paints)
+
+    def settle(self) -> None:
+        """
+        Method to process events until the window stops painting.
+        """
+        start = perf_counter()
+        while perf_counter() - start < SETTLE_TIMEOUT:
+            self.app.processEvents(QEventLoop.AllEvents, 5)
+            now = perf_counter()
+            if self.paints.last_paint is None:
+                if now - start >= NO_PAINT_TIMEOUT:
+                    return
+            elif now - self.paints.last_paint >= QUIET_TIME:
+                return
+            sleep(0.001)
+
+    def run_action(self, action: dict) -> dict:
+        """
+        Method to run one action and measure its handler time, paint latency and paint count
+
+        Args:
+            action (dict): The action, see DEFAULT_SCRIPT for the supported kinds, a splitter action
+                sets the sizes of a splitter and recorded actions carry an after_ms delay
+
+        Returns:
+            dict: The action with its measurements added
+        """
+        self.settle()
+        if self.paced and self._last_start is not None:
+            self.wait(action.get("after_ms", 0) / 1000 - (perf_counter() - self._last_start))
+        self.paints.reset()
+        start = self._last_start = perf_counter()
+        self.perform(action)
+        handler_time = perf_counter() - start
+        self.settle()
+
+        first_paint, last_paint = self.paints.first_paint, self.paints.last_paint
+        result = dict(action)
+        result["name"] = " ".join(str(value) for key, value in action.items() if key not in TIMING_KEYS)
+        result["handler_ms"] = handler_time * 1000
+        result["first_paint_ms"] = (first_paint - start) * 1000 if first_paint else None
+        result["settled_ms"] = (last_paint - start) * 1000 if last_paint else handler_time * 1000
+        result["paints"] = self.paints.count
+        self.results.append(result)
+        return result
+
+    def perform(self, action: dict) -> None:
+        """
+        Method to execute an action against the window
+
+        Args:
+            action (dict): The action to execute
+
+        Raises:
+            ValueError: If the kind of action isn't supported
+        """
+        match action["action"]:
+            case "click":
+                getattr(self.window, action["target"]).click()
+            case "log_storm":
+                level = ConsoleLevel[action.get("level", "INFO")]
+                for index in range(action.get("count", 1000)):
+                    print(f"Log storm msg {index}", level)
+            case "resize":
+                self.window.resize(action["width"], action["height"])
+            case "splitter":
+                getattr(self.window, action["target"]).setSizes(action["sizes"])
+            case "wait":
+                self.settle()
+            case _:
+                raise ValueError(f"Unknown ui action {action['action']!r}")
+
+    def wait(self, seconds: float) -> None:
+        """
+        Method to keep processing events for a while
+
+        Args:
+            seconds (float): How long to wait, nothing happens for zero or less
+        """
+        end = perf_counter() + seconds
+        while perf_counter() < end:
+            self.app.processEvents(QEventLoop.AllEvents, 5)
+            sleep(0.001)
+
+    def run_script(self, script: list[dict], repeat: int = 1) -> list[dict]:
+        """
+        Method to run a whole script
+
+        Args:
+            script (list[dict]): The actions to run in order
+            repeat (int, optional): Number of times to run the script. Defaults to 1.
+
+        Returns:
+            list[dict]: The measurements of every action
+        """
+        for _ in range(repeat):
+            for action in script:
+                self.run_action(action)
+        return self.results
+
+    def report(self) -> dict:
+        """
+        Method to build the json report of every action run so far
+
+        Returns:
+            dict: Environment info, per action measurements and a summary per kind of action
+        """
+        groups: dict[str, list[dict]] = {}
+        for result in self.results:
+            groups.setdefault(result["name"], []).append(result)
+        summary = {
+            key: {
+                "runs": len(results),
+                "median_settled_ms": median(result["settled_ms"] for result in results),
+                "max_settled_ms": max(result["settled_ms"] for result in results),
+                "median_handler_ms": median(result["handler_ms"] for result in results),
+                "mean_paints": mean(result["paints"] for result in results),
+            }
+            for key, results in groups.items()
+        }
+        return {
+            "platform": platform(),
+            "qpa_platform": QApplication.platformName(),
+            "python": python_version.split()[0],
+            "pyside": pyside_version,
+            "actions": self.results,
+            "summary": summary,
+        }
@@ -0,0 +1,91 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.7.1
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x03\x9d\
+/\
+* \x0a * :Title: da\
+rk_style.qss\x0a * \
+:Description: Da\
+rk mode styling \
+document\x0a * :Cre\
+ated: 6/6/2024\x0a \
+* :Last Modified\
+: 6/6/2024\x0a * :A\
+uthor: Robert Gr\
+eenslade\x0a */\x0a\x0aQM\
+ainWindow {\x0a  ba\
+ckground-color: \
+#222831;\x0a  color\
+: #F8F0E3;\x0a  bor\
+der-radius: 4px;\
+\x0a  padding: 2px;\
+\x0a  border: none;\
+\x0a}\x0a\x0aQLabel {\x0a  b\
+ackground-color:\
+ #222831;\x0a  colo\
+r: #808080;\x0a  bo\
+rder-radius: 4px\
+;\x0a  padding: 2px\
+;\x0a  border: none\
+;\x0a}\x0a\x0aQMenuBar {\x0a\
+  background-col\
+or: #222831;\x0a  c\
+olor: #808080;\x0a \
+ border-radius: \
+4px;\x0a  padding: \
+2px;\x0a  border: n\
+one;\x0a}\x0a\x0aQTextEdi\
+t {\x0a  background\
+-color: #696969;\
+\x0a  color: #EEEEE\
+E;\x0a  border-radi\
+us: 4px;\x0a  paddi\
+ng: 2px;\x0a}\x0a\x0aQPus\
+hButton {\x0a  back\
+ground-color: #3\
+1363F;\x0a  color: \
+#808080;\x0a  borde\
+r-radius: 4px;\x0a \
+ padding: 2px;\x0a}\
+\x0a\x0aQPushButton::H\
+over {\x0a  backgro\
+und-color: #8080\
+80;\x0a  color: #31\
+363F;\x0a  border-r\
+adius: 4px;\x0a  pa\
+dding: 2px;\x0a}\x0a\x0aQ\
+PushButton::Pres\
+sed {\x0a  backgrou\
+nd-color: #80808\
+0;\x0a  color: #313\
+63F;\x0a  border-ra\
+dius: 4px;\x0a  pad\
+ding: 2px;\x0a}\
+"
+
+qt_resource_name = b"\
+\x00\x0e\
+\x01\x06\x97C\
+\x00d\
+\x00a\x00r\x00k\x00_\x00s\x00t\x00y\x00l\x00e\x00.\x00q\x00s\x00s\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1TL\xad4\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,24 @@
+# :Title: recompile.py
+# :Description: Compile all source assets into one qt resource bundle
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from os import system
+from pathlib import Path
+
+# Every file under source is bundled, at the same path relative to source (:/dark_style.qss)
+source = Path(__file__).parent.joinpath("source")
+files = sorted(path.relative_to(source).as_posix() for path in source.rglob("*") if path.is_file())
+
+# Write the resource collection listing every asset
+qrc = Path(__file__).parent.joinpath("resources.qrc")
+with open(qrc, "w") as qrc_file:
+    qrc_file.write('<!DOCTYPE RCC>\n<RCC version="1.0">\n<qresource prefix="/">\n')
+    for file in files:
+        qrc_file.write(f'    <file alias="{file}">source/{file}</file>\n')
+    qrc_file.write("</qresource>\n</RCC>\n")
+
+# Compile the collection into a module that registers the bundle when imported
+system(f'pyside6-rcc {qrc} -o {Path(__file__).parent.joinpath("compiled", "resources.py")}')
@@ -0,0 +1,93 @@
+# :Title: startup.py
+# :Description: Staged startup that imports the frontend in the background behind a splash screen
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from importlib import import_module
+from threading import Thread
+from time import perf_counter
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QApplication, QMainWindow, QSplashScreen
+
+from backend.console_logging.console_logging import ConsoleLevel
+from middleware.console_output import log as print
+
+FRONTEND_MODULE = "frontend.frontend"
+""" Module holding the Frontend class, imports every widget module along with it """
+
+
+class StartupLoader(QObject):
+    """
+    Imports the frontend modules on a background thread and builds the window on the gui thread
+
+    Args:
+        QObject (QObject): StartupLoader inherits from QObject
+    """
+
+    modules_imported = Signal()
+    """ Emitted from the import thread once every frontend module is loaded """
+    import_failed = Signal(str)
+    """ Emitted from the import thread if a frontend module could not be loaded """
+    frontend_ready = Signal(QMainWindow)
+    """ Emitted on the gui thread with the main window once it is shown """
+
+    def __init__(self, splash: QSplashScreen) -> None:
+        super().__init__()
+        self.splash: QSplashScreen = splash
+        """ The splash screen to close once the frontend is shown """
+        self.frontend: QMainWindow = None
+        """ The main window, created on the gui thread once imports are done """
+        self._start_time: float = 0.0
+        """ When the loader was started, used for the startup timing debug msgs """
+
+        # Signals emitted from the import thread are queued onto the gui thread
+        self.modules_imported.connect(self._build_frontend)
+        self.import_failed.connect(self._on_import_failed)
+
+    def start(self) -> None:
+        """
+        Method to start importing the frontend modules in the background.
+        """
+        self._start_time = perf_counter()
+        Thread(target=self._import_modules, name="StartupImports", daemon=True).start()
+
+    def _import_modules(self) -> None:
+        """
+        Method run on the import thread, only imports modules and never creates Qt objects.
+        """
+        try:
+            import_module(FRONTEND_MODULE)
+        except Exception as error:
+            self.import_failed.emit(f"{type(error).__name__}: {error}")
+            return
+        self.modules_imported.emit()
+
+    def _build_frontend(self) -> None:
+        """
+        Method to create the main window on the gui thread and swap it in for the splash screen.
+        """
+        imported_time = perf_counter()
+        frontend_class = getattr(import_module(FRONTEND_MODULE), "Frontend")
+        self.frontend = frontend_class()
+        self.frontend.show()
+        self.splash.finish(self.frontend)
+        self.frontend_ready.emit(self.frontend)
+        print(
+            f"Frontend modules imported in {imported_time - self._start_time:.3f}s, "
+            f"window built in {perf_counter() - imported_time:.3f}s",
+            ConsoleLevel.DEBUG,
+        )
+
+    def _on_import_failed(self, error: str) -> None:
+        """
+        Method to report a failed frontend import and shut the app down.
+
+        Args:
+            error (str): Description of the import error
+        """
+        self.splash.close()
+        print(f"Frontend failed to import: {error}", ConsoleLevel.CRITICAL)
+        QApplication.instance().exit(1)
@@ -15,8 +15,9 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QLabel, QSizePolicy, QSpacerItem,
-    QVBoxLayout, QWidget)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QGridLayout, QHBoxLayout,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QSpinBox, QVBoxLayout, QWidget)
 
 class Ui_Form(object):
     def setupUi(self, Form):
@@ -42,10 +43,127 @@ class Ui_Form(object):
 
         self.verticalLayout.addItem(self.verticalSpacer)
 
-        self.widget = QWidget(Form)
-        self.widget.setObjectName(u"widget")
+        self.storm_layout = QGridLayout()
+        self.storm_layout.setObjectName(u"storm_layout")
+        self.rate_label = QLabel(Form)
+        self.rate_label.setObjectName(u"rate_label")
 
-        self.verticalLayout.addWidget(self.widget)
+        self.storm_layout.addWidget(self.rate_label, 0, 0, 1, 1)
+
+        self.rate_spin = QSpinBox(Form)
+        self.rate_spin.setObjectName(u"rate_spin")
+        self.rate_spin.setMinimum(1)
+        self.rate_spin.setMaximum(1000000)
+        self.rate_spin.setSingleStep(1000)
+        self.rate_spin.setValue(5000)
+
+        self.storm_layout.addWidget(self.rate_spin, 0, 1, 1, 1)
+
+        self.threads_label = QLabel(Form)
+        self.threads_label.setObjectName(u"threads_label")
+
+        self.storm_layout.addWidget(self.threads_label, 1, 0, 1, 1)
+
+        self.threads_spin = QSpinBox(Form)
+        self.threads_spin.setObjectName(u"threads_spin")
+        self.threads_spin.setMinimum(1)
+        self.threads_spin.setMaximum(64)
+        self.threads_spin.setSingleStep(1)
+        self.threads_spin.setValue(4)
+
+        self.storm_layout.addWidget(self.threads_spin, 1, 1, 1, 1)
+
+        self.levels_label = QLabel(Form)
+        self.levels_label.setObjectName(u"levels_label")
+
+        self.storm_layout.addWidget(self.levels_label, 2, 0, 1, 1)
+
+        self.levels_layout = QHBoxLayout()
+        self.levels_layout.setObjectName(u"levels_layout")
+        self.debug_check = QCheckBox(Form)
+        self.debug_check.setObjectName(u"debug_check")
+        self.debug_check.setChecked(False)
+
+        self.levels_layout.addWidget(self.debug_check)
+
+        self.info_check = QCheckBox(Form)
+        self.info_check.setObjectName(u"info_check")
+        self.info_check.setChecked(True)
+
+        self.levels_layout.addWidget(self.info_check)
+
+        self.warning_check = QCheckBox(Form)
+        self.warning_check.setObjectName(u"warning_check")
+        self.warning_check.setChecked(False)
+
+        self.levels_layout.addWidget(self.warning_check)
+
+        self.error_check = QCheckBox(Form)
+        self.error_check.setObjectName(u"error_check")
+        self.error_check.setChecked(False)
+
+        self.levels_layout.addWidget(self.error_check)
+
+        self.critical_check = QCheckBox(Form)
+        self.critical_check.setObjectName(u"critical_check")
+        self.critical_check.setChecked(False)
+
+        self.levels_layout.addWidget(self.critical_check)
+
+
+        self.storm_layout.addLayout(self.levels_layout, 2, 1, 1, 1)
+
+        self.start_btn = QPushButton(Form)
+        self.start_btn.setObjectName(u"start_btn")
+
+        self.storm_layout.addWidget(self.start_btn, 3, 1, 1, 1)
+
+        self.throughput_label = QLabel(Form)
+        self.throughput_label.setObjectName(u"throughput_label")
+
+        self.storm_layout.addWidget(self.throughput_label, 4, 0, 1, 1)
+
+        self.throughput_value = QLabel(Form)
+        self.throughput_value.setObjectName(u"throughput_value")
+
+        self.storm_layout.addWidget(self.throughput_value, 4, 1, 1, 1)
+
+        self.dropped_label = QLabel(Form)
+        self.dropped_label.setObjectName(u"dropped_label")
+
+        self.storm_layout.addWidget(self.dropped_label, 5, 0, 1, 1)
+
+        self.dropped_value = QLabel(Form)
+        self.dropped_value.setObjectName(u"dropped_value")
+
+        self.storm_layout.addWidget(self.dropped_value, 5, 1, 1, 1)
+
+        self.render_label = QLabel(Form)
+        self.render_label.setObjectName(u"render_label")
+
+        self.storm_layout.addWidget(self.render_label, 6, 0, 1, 1)
+
+        self.render_value = QLabel(Form)
+        self.render_value.setObjectName(u"render_value")
+
+        self.storm_layout.addWidget(self.render_value, 6, 1, 1, 1)
+
+        self.frame_label = QLabel(Form)
+        self.frame_label.setObjectName(u"frame_label")
+
+        self.storm_layout.addWidget(self.frame_label, 7, 0, 1, 1)
+
+        self.frame_value = QLabel(Form)
+        self.frame_value.setObjectName(u"frame_value")
+
+        self.storm_layout.addWidget(self.frame_value, 7, 1, 1, 1)
+
+
+        self.verticalLayout.addLayout(self.storm_layout)
+
+        self.bottomSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout.addItem(self.bottomSpacer)
 
 
         self.retranslateUi(Form)
@@ -55,6 +173,23 @@ class Ui_Form(object):
 
     def retranslateUi(self, Form):
         Form.setWindowTitle(QCoreApplication.translate("Form", u"Form", None))
-        self.title.setText(QCoreApplication.translate("Form", u"Page 4 Main", None))
+        self.title.setText(QCoreApplication.translate("Form", u"Log Storm", None))
+        self.rate_label.setText(QCoreApplication.translate("Form", u"Msgs per second", None))
+        self.threads_label.setText(QCoreApplication.translate("Form", u"Threads", None))
+        self.levels_label.setText(QCoreApplication.translate("Form", u"Levels", None))
+        self.debug_check.setText(QCoreApplication.translate("Form", u"Debug", None))
+        self.info_check.setText(QCoreApplication.translate("Form", u"Info", None))
+        self.warning_check.setText(QCoreApplication.translate("Form", u"Warning", None))
+        self.error_check.setText(QCoreApplication.translate("Form", u"Error", None))
+        self.critical_check.setText(QCoreApplication.translate("Form", u"Critical", None))
+        self.start_btn.setText(QCoreApplication.translate("Form", u"Start", None))
+        self.throughput_label.setText(QCoreApplication.translate("Form", u"Throughput", None))
+        self.throughput_value.setText(QCoreApplication.translate("Form", u"-", None))
+        self.dropped_label.setText(QCoreApplication.translate("Form", u"Dropped records", None))
+        self.dropped_value.setText(QCoreApplication.translate("Form", u"-", None))
+        self.render_label.setText(QCoreApplication.translate("Form", u"Console render rate", None))
+        self.render_value.setText(QCoreApplication.translate("Form", u"-", None))
+        self.frame_label.setText(QCoreApplication.translate("Form", u"Gui frame latency", None))
+        self.frame_value.setText(QCoreApplication.translate("Form", u"-", None))
     # retranslateUi
 
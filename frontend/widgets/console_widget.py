@@ -1,16 +1,144 @@
 # :Title: console_widget.py
 # :Description: Wrapper class for console_widget
 # :Created: 6/6/2024
-# :Last Modified: 6/6/2024
+# :Last Modified: 10/19/2026
 # :Author: Robert Greenslade
 
 # Imports
-from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtWidgets import QFileDialog, QInputDialog, QWidget
 
+from backend.console_logging.console_logging import ConsoleLevel
+from backend.log_follower.log_follower import LogFollower
+from frontend.performance.page_switch_metrics import log_page_switch_metrics
 from frontend.ui.compiled.console_widget import Ui_console_widget
+from middleware.console_output import filter_console, follow_log, log_page, save_log, show_log_fields
+from middleware.profiling import is_profiling, start_profiling, stop_profiling
+
+# Save log menu entries and the lowest level each one keeps
+SAVE_LOG_LEVELS = {
+    "All Levels": ConsoleLevel.DEBUG,
+    "Info and Above": ConsoleLevel.INFO,
+    "Warnings and Above": ConsoleLevel.WARNING,
+    "Errors and Above": ConsoleLevel.ERROR,
+}
 
 
 class ConsoleWidget(QWidget, Ui_console_widget):
     def __init__(self):
         super().__init__()
         self.setupUi(self)
+        self.followers: list[LogFollower] = []
+        """ Log files currently followed on the console """
+        self.show_fields: bool = False
+        """ Whether or not new msgs show their page, task, thread and process """
+        self.field_filter: dict[str, str] = {}
+        """ Contextual fields new msgs need to show on the console """
+
+        # Context Menu
+        self.console_text.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.console_text.customContextMenuRequested.connect(self.on_context_menu)
+
+    def on_context_menu(self, position: QPoint) -> None:
+        """
+        Method for showing the console context menu with the developer actions.
+
+        Args:
+            position (QPoint): Where the menu was requested, relative to console_text
+        """
+        menu = self.console_text.createStandardContextMenu()
+        menu.addSeparator()
+        save_menu = menu.addMenu("Save Log")
+        for label, min_level in SAVE_LOG_LEVELS.items():
+            save_menu.addAction(
+                label, lambda min_level=min_level: self.on_save_log(min_level)
+            )
+        menu.addAction("Follow Log File...", self.on_follow_log)
+        for follower in self.followers:
+            menu.addAction(
+                f"Stop Following {follower.path.name}",
+                lambda follower=follower: self.on_stop_following(follower),
+            )
+        menu.addSeparator()
+        fields_action = menu.addAction("Show Context Fields", self.on_toggle_fields)
+        fields_action.setCheckable(True)
+        fields_action.setChecked(self.show_fields)
+        filter_text = ", ".join(f"{name}={value}" for name, value in self.field_filter.items())
+        filter_menu = menu.addMenu(f"Filter Msgs ({filter_text})" if filter_text else "Filter Msgs")
+        if log_page():
+            filter_menu.addAction(
+                f"Only {log_page()}", lambda page=log_page(): self.on_filter({"page": page})
+            )
+        filter_menu.addAction("Only Gui Thread", lambda: self.on_filter({"thread": "MainThread"}))
+        filter_menu.addAction("By Field...", self.on_filter_by_field)
+        filter_menu.addAction("Show Everything", lambda: self.on_filter({}))
+        menu.addSeparator()
+        menu.addAction("Show Page Switch Latency", log_page_switch_metrics)
+        if is_profiling():
+            menu.addAction("Stop Profiling", stop_profiling)
+        else:
+            menu.addAction("Start Profiling", start_profiling)
+        menu.exec(self.console_text.mapToGlobal(position))
+        menu.deleteLater()
+
+    def on_toggle_fields(self) -> None:
+        """
+        Method for showing or hiding the contextual fields of new msgs.
+        """
+        self.show_fields = not self.show_fields
+        show_log_fields(self.show_fields)
+
+    def on_filter(self, fields: dict[str, str]) -> None:
+        """
+        Method for only showing new msgs with matching contextual fields.
+
+        Args:
+            fields (dict[str, str]): Value by field name, empty to show every msg
+        """
+        self.field_filter = fields
+        filter_console(fields)
+
+    def on_filter_by_field(self) -> None:
+        """
+        Method for asking for the fields to filter new msgs by, written as comma separated name=value pairs.
+        """
+        current = ", ".join(f"{name}={value}" for name, value in self.field_filter.items())
+        text, accepted = QInputDialog.getText(
+            self, "Filter Msgs", "Fields (page, task, thread or process) as name=value, ...:", text=current
+        )
+        if accepted:
+            pairs = [pair.split("=", 1) for pair in text.split(",") if "=" in pair]
+            self.on_filter({name.strip(): value.strip() for name, value in pairs})
+
+    def on_save_log(self, min_level: ConsoleLevel) -> None:
+        """
+        Method for saving the console history, the file is written in the background.
+
+        Args:
+            min_level (ConsoleLevel): Lowest level to keep in the saved log
+        """
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save Log", "console.log", "Log (*.log);;Compressed Log (*.log.gz)"
+        )
+        if path:
+            save_log(path, min_level)
+
+    def on_follow_log(self) -> None:
+        """
+        Method for picking a log file written by another process to follow on the console.
+        """
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Follow Log File", "", "Log (*.log *.txt);;All Files (*)"
+        )
+        if path:
+            self.followers.append(follow_log(path))
+
+    def on_stop_following(self, follower: LogFollower) -> None:
+        """
+        Method for no longer following a log file.
+
+        Args:
+            follower (LogFollower): The follower to stop
+        """
+        follower.stop()
+        self.followers.remove(follower)
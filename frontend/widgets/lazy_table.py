@@ -0,0 +1,394 @@
+# :Title: lazy_table.py
+# :Description: Table model and view for large datasets, rows are fetched as they scroll into view
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from array import array
+from time import perf_counter
+from typing import Any, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView, QWidget
+
+from backend.console_logging.console_logging import ConsoleLevel
+from backend.row_block_cache.row_block_cache import RowBlockCache
+from backend.task_runner.task_runner import TaskContext, TaskHandle
+from data.classes.table_source import TableSource
+from middleware.background_tasks import run_task
+from middleware.console_output import log as print
+
+FETCH_ROWS = 1000
+""" Rows added to the table every time the view scrolls to the end of what is loaded """
+BLOCK_ROWS = 256
+""" Rows read from the source at a time """
+MAX_BLOCKS = 64
+""" Row blocks kept in memory before the least recently used is evicted """
+FILTER_CHUNK_ROWS = 65536
+""" Rows filtered between checks for a newer filter or sort """
+
+
+def sort_order(context: TaskContext, values: Sequence[Any], count: int, descending: bool) -> array:
+    """
+    Task that orders the rows of a column, empty (None) cells go first ascending and last descending.
+    Columns mixing types that can't be compared are ordered by their text.
+
+    Args:
+        context (TaskContext): Context of the running task
+        values (Sequence[Any]): The values of the column, indexable by row
+        count (int): Number of rows
+        descending (bool): Whether or not the largest values go first
+
+    Returns:
+        array: The source rows in sorted order ('q' array)
+    """
+    empty = array("q", (row for row in range(count) if values[row] is None))
+    rows = [row for row in range(count) if values[row] is not None] if empty else range(count)
+    context.check_cancelled()
+    try:
+        rows = sorted(rows, key=values.__getitem__, reverse=descending)
+    except TypeError:
+        rows = sorted(rows, key=lambda row: str(values[row]), reverse=descending)
+    context.check_cancelled()
+    order = array("q", rows)
+    return order + empty if descending else empty + order
+
+
+def filter_rows(context: TaskContext, values: Sequence[Any], rows: Sequence[int], text: str) -> array:
+    """
+    Task that keeps the rows whose value contains the text, case insensitive
+
+    Args:
+        context (TaskContext): Context of the running task
+        values (Sequence[Any]): The values of the column, indexable by row
+        rows (Sequence[int]): The rows to check in the order they are shown
+        text (str): The lower case text to look for
+
+    Returns:
+        array: The matching rows in the same order ('q' array)
+    """
+    matches = array("q")
+    for start in range(0, len(rows), FILTER_CHUNK_ROWS):
+        context.check_cancelled()
+        matches.extend(
+            row for row in rows[start:start + FILTER_CHUNK_ROWS] if text in str(values[row]).lower()
+        )
+    return matches
+
+
+class LazyTableModel(QAbstractTableModel):
+    """
+    Table model that only reads the rows the view shows, in cached blocks.
+    Sorting and filtering build an index of source rows on a worker thread, the rows themselves are never copied.
+
+    Args:
+        QAbstractTableModel (QAbstractTableModel): LazyTableModel inherits from QAbstractTableModel
+    """
+
+    def __init__(self, source: TableSource, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self.source: TableSource = source
+        """ Where the rows are read from """
+        self.cache: RowBlockCache = RowBlockCache(source.read_rows, BLOCK_ROWS, MAX_BLOCKS)
+        """ The most recently shown row blocks """
+
+        self._order: array = None
+        self._index: array = None
+        self._sort_task: TaskHandle = None
+        self._sort_id: int = 0
+        self._filter: tuple[int, str] = None
+        self._filter_task: TaskHandle = None
+        self._filter_id: int = 0
+        self._loaded: int = min(FETCH_ROWS, source.row_count())
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        The override method for the number of rows loaded so far
+
+        Args:
+            parent (QModelIndex, optional): Parent index, tables have none. Defaults to QModelIndex().
+
+        Returns:
+            int: The loaded row count
+        """
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        The override method for the number of columns
+
+        Args:
+            parent (QModelIndex, optional): Parent index, tables have none. Defaults to QModelIndex().
+
+        Returns:
+            int: The column count of the source
+        """
+        return 0 if parent.isValid() else len(self.source.columns)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """
+        The override method telling the view whether more rows can be loaded
+
+        Args:
+            parent (QModelIndex, optional): Parent index, tables have none. Defaults to QModelIndex().
+
+        Returns:
+            bool: True while rows are left to load
+        """
+        return not parent.isValid() and self._loaded < self.visible_row_count()
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """
+        The override method that loads the next FETCH_ROWS rows
+
+        Args:
+            parent (QModelIndex, optional): Parent index, tables have none. Defaults to QModelIndex().
+        """
+        count = min(FETCH_ROWS, self.visible_row_count() - self._loaded)
+        if parent.isValid() or count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """
+        The override method that reads a cell through the row block cache
+
+        Args:
+            index (QModelIndex): The cell
+            role (int, optional): The data role, only display is supported. Defaults to Qt.DisplayRole.
+
+        Returns:
+            Any: The value of the cell, None for other roles
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self.cache.row(self.source_row(index.row()))[index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """
+        The override method for the column names and source row numbers
+
+        Args:
+            section (int): The column or row
+            orientation (Qt.Orientation): Horizontal for columns, vertical for rows
+            role (int, optional): The data role, only display is supported. Defaults to Qt.DisplayRole.
+
+        Returns:
+            Any: The header text, None for other roles
+        """
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.source.columns[section]
+        return str(self.source_row(section) + 1)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """
+        The override method that orders the rows through an index of source rows.
+        The index is built on a worker thread, the rows keep their current order until it is done.
+
+        Args:
+            column (int): The column to sort by, -1 for the source order
+            order (Qt.SortOrder, optional): Ascending or descending. Defaults to Qt.AscendingOrder.
+        """
+        self._cancel_sort()
+        if column < 0:
+            self._order = None
+            self._rebuild_index()
+            return
+        start = perf_counter()
+        sort_id = self._sort_id
+        self._sort_task = run_task(
+            sort_order,
+            self.source.column_values(column),
+            self.source.row_count(),
+            order == Qt.DescendingOrder,
+            name=f"Sort by {self.source.columns[column]}",
+            on_result=lambda rows: self._apply_order(rows, sort_id, column, start),
+        )
+
+    def set_filter(self, column: int, text: str) -> None:
+        """
+        Method to only show the rows whose column contains the text, case insensitive.
+        The rows are matched on a worker thread, the shown rows stay until it is done.
+
+        Args:
+            column (int): The column to match
+            text (str): The text to look for, empty to show every row
+        """
+        self._filter = (column, text.lower()) if text else None
+        self._rebuild_index()
+
+    def set_source(self, source: TableSource) -> None:
+        """
+        Method to show a different source, the sort and filter are cleared
+
+        Args:
+            source (TableSource): The new source
+        """
+        self._cancel_sort()
+        self._cancel_filter()
+        self.beginResetModel()
+        self.source = source
+        self.cache = RowBlockCache(source.read_rows, BLOCK_ROWS, MAX_BLOCKS)
+        self._order = self._index = self._filter = None
+        self._loaded = min(FETCH_ROWS, source.row_count())
+        self.endResetModel()
+
+    def visible_row_count(self) -> int:
+        """
+        Method to get the number of rows that pass the filter, loaded or not
+
+        Returns:
+            int: The row count of the sorted and filtered table
+        """
+        if self._index is not None:
+            return len(self._index)
+        return self.source.row_count()
+
+    def source_row(self, row: int) -> int:
+        """
+        Method to map a table row to its row in the source
+
+        Args:
+            row (int): The row in the table
+
+        Returns:
+            int: The row in the source
+        """
+        return row if self._index is None else self._index[row]
+
+    def _cancel_sort(self) -> None:
+        """
+        Method to drop the sort that is running, its result is ignored if it already finished.
+        """
+        self._sort_id += 1
+        if self._sort_task is not None:
+            self._sort_task.cancel()
+            self._sort_task = None
+
+    def _cancel_filter(self) -> None:
+        """
+        Method to drop the filter pass that is running, its result is ignored if it already finished.
+        """
+        self._filter_id += 1
+        if self._filter_task is not None:
+            self._filter_task.cancel()
+            self._filter_task = None
+
+    def _apply_order(self, order: array, sort_id: int, column: int, start: float) -> None:
+        """
+        Method to show the rows in a sort order built by sort_order
+
+        Args:
+            order (array): The source rows in sorted order
+            sort_id (int): Which sort built the order, stale ones are dropped
+            column (int): The sorted column
+            start (float): perf_counter time the sort was requested
+        """
+        if sort_id != self._sort_id:
+            return
+        self._sort_task = None
+        self._order = order
+        self._rebuild_index()
+        print(
+            f"Sorted {len(order)} rows by {self.source.columns[column]} "
+            f"in {(perf_counter() - start) * 1000:.1f}ms",
+            ConsoleLevel.DEBUG,
+        )
+
+    def _rebuild_index(self) -> None:
+        """
+        Method to combine the sort order and filter into the index of shown source rows.
+        Without a filter the sort order is shown right away, otherwise filter_rows runs on a worker thread.
+        """
+        self._cancel_filter()
+        if self._filter is None:
+            self._set_index(self._order)
+            return
+        start = perf_counter()
+        filter_id = self._filter_id
+        column, text = self._filter
+        rows = range(self.source.row_count()) if self._order is None else self._order
+        self._filter_task = run_task(
+            filter_rows,
+            self.source.column_values(column),
+            rows,
+            text,
+            name=f"Filter {self.source.columns[column]}",
+            on_result=lambda index: self._apply_filter(index, filter_id, column, start),
+        )
+
+    def _apply_filter(self, index: array, filter_id: int, column: int, start: float) -> None:
+        """
+        Method to show the rows kept by filter_rows
+
+        Args:
+            index (array): The source rows that passed the filter, in shown order
+            filter_id (int): Which filter pass built the index, stale ones are dropped
+            column (int): The filtered column
+            start (float): perf_counter time the filter pass was requested
+        """
+        if filter_id != self._filter_id:
+            return
+        self._filter_task = None
+        self._set_index(index)
+        print(
+            f"Filtered {self.source.columns[column]} for '{self._filter[1]}', "
+            f"{len(index)} of {self.source.row_count()} rows "
+            f"in {(perf_counter() - start) * 1000:.1f}ms",
+            ConsoleLevel.DEBUG,
+        )
+
+    def _set_index(self, index: array) -> None:
+        """
+        Method to swap in the index of shown source rows
+
+        Args:
+            index (array): The source rows to show in order, None for every row in source order
+        """
+        self.beginResetModel()
+        self._index = index
+        self._loaded = min(FETCH_ROWS, self.visible_row_count())
+        self.endResetModel()
+
+
+class LazyTableView(QTableView):
+    """
+    Table view set up for LazyTableModel, fixed row heights and no sorting until a header is clicked
+
+    Args:
+        QTableView (QTableView): LazyTableView inherits from QTableView
+    """
+
+    def __init__(self, parent: QWidget = None) -> None:
+        super().__init__(parent)
+        self.setWordWrap(False)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        # Enabling sorting sorts by the indicator right away, -1 keeps the source order
+        self.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.setSortingEnabled(True)
+
+    def set_source(self, source: TableSource) -> LazyTableModel:
+        """
+        Method to show a source, creating the model on first use
+
+        Args:
+            source (TableSource): The rows to show
+
+        Returns:
+            LazyTableModel: The model of the view
+        """
+        model = self.model()
+        if isinstance(model, LazyTableModel):
+            model.set_source(source)
+        else:
+            model = LazyTableModel(source, self)
+            self.setModel(model)
+        self.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        return model
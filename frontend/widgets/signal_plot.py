@@ -0,0 +1,326 @@
+# :Title: signal_plot.py
+# :Description: QPainter plot of long evenly sampled signals drawn from a min/max level of detail pyramid
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from array import array
+from time import perf_counter
+from typing import Sequence
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QColor, QMouseEvent, QPainter, QPaintEvent, QPen, QPolygonF, QTransform, QWheelEvent
+from PySide6.QtWidgets import QWidget
+from shiboken6 import VoidPtr
+
+from backend.lod_pyramid.lod_pyramid import MinMaxPyramid, cached_pyramid
+from backend.task_runner.task_runner import TaskContext, TaskHandle
+from middleware.background_tasks import run_task
+
+BACKGROUND_COLOR = QColor("#222831")
+""" Fill behind the plot, matches the main window """
+SIGNAL_COLOR = QColor("#76ABAE")
+""" Color of the signal line """
+TEXT_COLOR = QColor("#808080")
+""" Color of the range labels """
+MARGIN = 4
+""" Pixels kept free around the signal """
+ZOOM_STEP = 1.25
+""" Zoom factor of one mouse wheel notch """
+MIN_SAMPLES_SHOWN = 16
+""" Zooming in stops once this few samples fill the width """
+
+
+def envelope_polygon(mins: Sequence[float], maxs: Sequence[float]) -> QPolygonF:
+    """
+    Builds the line through an envelope with x as the entry index and y as the value, a painter transform
+    maps it to pixels. The points are laid out with array slice assignments and copied straight into the
+    polygon's memory, creating a QPointF per point costs more than the drawing itself.
+
+    Args:
+        mins (Sequence[float]): Min of every entry, 'd' array or memoryview
+        maxs (Sequence[float]): Max of every entry, the same object as mins for raw samples
+
+    Returns:
+        QPolygonF: One point per raw sample, otherwise a zigzag between the max and min of every entry
+    """
+    count = len(mins)
+    indexes = array("d", range(count))
+    if mins is maxs:
+        points = array("d", bytes(16 * count))
+        points[0::2] = indexes
+        points[1::2] = _as_array(mins)
+    else:
+        points = array("d", bytes(32 * count))
+        points[0::4] = indexes
+        points[1::4] = _as_array(maxs)
+        points[2::4] = indexes
+        points[3::4] = _as_array(mins)
+
+    polygon = QPolygonF()
+    polygon.resize(len(points) // 2)
+    memoryview(VoidPtr(polygon.data(), len(points) * points.itemsize, True))[:] = memoryview(points).cast("B")
+    return polygon
+
+
+def _as_array(values: Sequence[float]) -> array:
+    """
+    Gets values as a 'd' array, array slices only take arrays
+
+    Args:
+        values (Sequence[float]): Array, memoryview or other sequence of numbers
+
+    Returns:
+        array: The values as a 'd' array, copied in one go from a 'd' memoryview and converted otherwise
+    """
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    if isinstance(values, memoryview) and values.format == "d":
+        copied = array("d")
+        copied.frombytes(values.cast("B"))
+        return copied
+    return array("d", values)
+
+
+def build_pyramid(context: TaskContext, values: Sequence[float]) -> MinMaxPyramid:
+    """
+    Task that builds the min/max pyramid of a signal (about 0.2s per million samples), or finds it in the
+    cache of signals shown before
+
+    Args:
+        context (TaskContext): Context of the running task
+        values (Sequence[float]): 'd' array or memoryview of the samples
+
+    Returns:
+        MinMaxPyramid: The pyramid of the signal
+    """
+    return cached_pyramid(values)
+
+
+class SignalPlot(QWidget):
+    """
+    Plots millions of samples at screen resolution, only the visible range is read on every frame.
+    Wheel to zoom around the cursor, drag to pan and double click to show everything again.
+
+    Args:
+        QWidget (QWidget): SignalPlot inherits from QWidget
+    """
+
+    def __init__(self, parent: QWidget = None) -> None:
+        super().__init__(parent)
+        self.pyramid: MinMaxPyramid = None
+        """ Min/max levels of the shown signal """
+        self.start_time: float = 0.0
+        """ Time of the first sample """
+        self.step: float = 1.0
+        """ Time between samples """
+        self.view_start: float = 0.0
+        """ First sample in view, fractional while zoomed in """
+        self.view_stop: float = 0.0
+        """ Sample after the last one in view """
+        self.last_frame_ms: float = 0.0
+        """ How long the latest paint took """
+
+        self._drag_x: float = None
+        self._pyramid_task: TaskHandle = None
+        self._pyramid_id: int = 0
+        self.setMinimumSize(100, 60)
+
+    def set_signal(self, values: Sequence[float], start_time: float = 0.0, step: float = 1.0) -> None:
+        """
+        Method to show a signal, its pyramid is built on a worker thread and the previous signal stays
+        shown until it is done. The samples must not change while the pyramid is built.
+
+        Args:
+            values (Sequence[float]): 'd' array or memoryview of the samples
+            start_time (float, optional): Time of the first sample. Defaults to 0.0.
+            step (float, optional): Time between samples. Defaults to 1.0.
+        """
+        self._cancel_build()
+        pyramid_id = self._pyramid_id
+        self._pyramid_task = run_task(
+            build_pyramid,
+            values,
+            name=f"Build pyramid of {len(values):,} samples",
+            on_result=lambda pyramid: self._apply_pyramid(pyramid, pyramid_id, start_time, step),
+        )
+
+    def set_pyramid(self, pyramid: MinMaxPyramid, start_time: float = 0.0, step: float = 1.0) -> None:
+        """
+        Method to show a signal whose pyramid was already built, for example by a background task
+
+        Args:
+            pyramid (MinMaxPyramid): The pyramid of the signal
+            start_time (float, optional): Time of the first sample. Defaults to 0.0.
+            step (float, optional): Time between samples. Defaults to 1.0.
+        """
+        self._cancel_build()
+        self.pyramid = pyramid
+        self.start_time = start_time
+        self.step = step
+        self.reset_view()
+
+    def reset_view(self) -> None:
+        """
+        Method to show the whole signal.
+        """
+        self.view_start = 0.0
+        self.view_stop = float(len(self.pyramid)) if self.pyramid else 0.0
+        self.update()
+
+    def set_view(self, start: float, stop: float) -> None:
+        """
+        Method to show a range of samples, kept inside the signal
+
+        Args:
+            start (float): First sample to show
+            stop (float): Sample after the last one to show
+        """
+        if self.pyramid is None:
+            return
+        length = len(self.pyramid)
+        span = min(max(stop - start, MIN_SAMPLES_SHOWN), length)
+        start = min(max(start, 0.0), length - span)
+        self.view_start, self.view_stop = start, start + span
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        The override method that draws about one min/max line per pixel of the visible range
+
+        Args:
+            event (QPaintEvent): The paint event
+        """
+        started = perf_counter()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), BACKGROUND_COLOR)
+        if self.pyramid is None or len(self.pyramid) == 0:
+            painter.end()
+            return
+
+        area = QRectF(self.rect()).adjusted(MARGIN, MARGIN, -MARGIN, -MARGIN)
+        first, per_entry, mins, maxs = self.pyramid.envelope(
+            int(self.view_start), int(self.view_stop) + 1, int(area.width())
+        )
+        if len(mins):
+            low, high = min(mins), max(maxs)
+            scale_y = area.height() / ((high - low) or 1.0)
+            scale_x = area.width() / (self.view_stop - self.view_start)
+            offset = (first - self.view_start + per_entry / 2) * scale_x
+            painter.setTransform(
+                QTransform(
+                    per_entry * scale_x, 0, 0, -scale_y, area.left() + offset, area.bottom() + low * scale_y
+                )
+            )
+            pen = QPen(SIGNAL_COLOR, 1)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.drawPolyline(envelope_polygon(mins, maxs))
+
+            painter.resetTransform()
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(area, Qt.AlignTop | Qt.AlignLeft, f"{high:.4g}")
+            painter.drawText(area, Qt.AlignBottom | Qt.AlignLeft, f"{low:.4g}")
+            time_range = (
+                f"{self.start_time + self.view_start * self.step:.6g} - "
+                f"{self.start_time + self.view_stop * self.step:.6g}"
+            )
+            painter.drawText(area, Qt.AlignBottom | Qt.AlignRight, time_range)
+        painter.end()
+        self.last_frame_ms = (perf_counter() - started) * 1000
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        """
+        The override method that zooms around the sample under the cursor
+
+        Args:
+            event (QWheelEvent): The wheel event
+        """
+        if self.pyramid is None:
+            return
+        notches = event.angleDelta().y() / 120
+        factor = ZOOM_STEP ** -notches
+        anchor = self._sample_at(event.position().x())
+        self.set_view(
+            anchor - (anchor - self.view_start) * factor,
+            anchor + (self.view_stop - anchor) * factor,
+        )
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """
+        The override method that starts a pan
+
+        Args:
+            event (QMouseEvent): The mouse event
+        """
+        if event.button() == Qt.LeftButton:
+            self._drag_x = event.position().x()
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        """
+        The override method that pans while the left button is held
+
+        Args:
+            event (QMouseEvent): The mouse event
+        """
+        if self._drag_x is None or self.pyramid is None:
+            return
+        x = event.position().x()
+        shift = (self._drag_x - x) * (self.view_stop - self.view_start) / max(1, self.width() - 2 * MARGIN)
+        self._drag_x = x
+        self.set_view(self.view_start + shift, self.view_stop + shift)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """
+        The override method that ends a pan
+
+        Args:
+            event (QMouseEvent): The mouse event
+        """
+        self._drag_x = None
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        """
+        The override method that shows the whole signal again
+
+        Args:
+            event (QMouseEvent): The mouse event
+        """
+        if self.pyramid is not None:
+            self.reset_view()
+
+    def _sample_at(self, x: float) -> float:
+        """
+        Method to map a widget x position to a sample
+
+        Args:
+            x (float): Position in the widget
+
+        Returns:
+            float: The sample at that position
+        """
+        fraction = (x - MARGIN) / max(1, self.width() - 2 * MARGIN)
+        return self.view_start + fraction * (self.view_stop - self.view_start)
+
+    def _cancel_build(self) -> None:
+        """
+        Method to drop the pyramid build that is running, its result is ignored if it already finished.
+        """
+        self._pyramid_id += 1
+        if self._pyramid_task is not None:
+            self._pyramid_task.cancel()
+            self._pyramid_task = None
+
+    def _apply_pyramid(self, pyramid: MinMaxPyramid, pyramid_id: int, start_time: float, step: float) -> None:
+        """
+        Method to show a pyramid built by build_pyramid
+
+        Args:
+            pyramid (MinMaxPyramid): The pyramid of the signal
+            pyramid_id (int): Which build made the pyramid, stale ones are dropped
+            start_time (float): Time of the first sample
+            step (float): Time between samples
+        """
+        if pyramid_id == self._pyramid_id:
+            self.set_pyramid(pyramid, start_time, step)
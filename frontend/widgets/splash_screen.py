@@ -0,0 +1,43 @@
+# :Title: splash_screen.py
+# :Description: Lightweight splash screen shown while the frontend loads
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPixmap
+from PySide6.QtWidgets import QSplashScreen
+
+
+class SplashScreen(QSplashScreen):
+    """
+    Splash screen drawn entirely in code so it can be shown before any ui modules are imported
+
+    Args:
+        QSplashScreen (QSplashScreen): SplashScreen inherits from QSplashScreen
+    """
+
+    def __init__(self):
+        super().__init__(self._draw_pixmap())
+        self.showMessage(
+            "Loading...", Qt.AlignBottom | Qt.AlignHCenter, QColor("#808080")
+        )
+
+    def _draw_pixmap(self) -> QPixmap:
+        """
+        Method for drawing the splash background in the dark style colors.
+
+        Returns:
+            QPixmap: The pixmap the splash screen displays
+        """
+        pixmap = QPixmap(400, 200)
+        pixmap.fill(QColor("#222831"))
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setPointSize(16)
+        painter.setFont(font)
+        painter.setPen(QColor("#EEEEEE"))
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, "guiBoilerplate")
+        painter.end()
+        return pixmap
@@ -1,16 +1,136 @@
 # :Title: top_page_4.py
-# :Description: Wrapper class for top_page_4
+# :Description: Wrapper class for top_page_4, the log storm stress page
 # :Created: 6/6/2024
-# :Last Modified: 6/6/2024
+# :Last Modified: 10/19/2026
 # :Author: Robert Greenslade
 
 # Imports
-from PySide6.QtWidgets import QWidget
+from time import perf_counter
 
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication, QWidget
+
+from backend.console_logging.console_logging import ConsoleLevel
+from backend.log_storm.log_storm import LogStorm
+from backend.rolling_histogram.rolling_histogram import RollingHistogram
 from frontend.ui.compiled.top_page_4 import Ui_Form
+from middleware.console_output import console_render_counts, dropped_log_records
+from middleware.console_output import log as print
+
+STATS_INTERVAL_MS = 1000
+""" Milliseconds between updates of the live stats """
+FRAME_INTERVAL_MS = 16
+""" Milliseconds between the frame timer ticks, lateness beyond this is the frame latency """
 
 
 class TopPage4(QWidget, Ui_Form):
+    """
+    Developer page that floods the console from several threads and shows how the gui keeps up
+
+    Args:
+        QWidget (QWidget): TopPage4 inherits from QWidget
+    """
+
     def __init__(self):
         super().__init__()
         self.setupUi(self)
+
+        self.storm = LogStorm()
+        """ Logs the configured msgs from its own threads """
+        self.frame_latency = RollingHistogram()
+        """ How late the frame timer ticks, the time the gui thread was busy """
+
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(STATS_INTERVAL_MS)
+        self._stats_timer.timeout.connect(self._update_stats)
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self._on_frame)
+        self._last_frame: float = None
+        self._last_stats: tuple[float, int, int, int] = None
+        self._dropped_at_start: int = 0
+
+        self.level_checks = {
+            ConsoleLevel.DEBUG: self.debug_check,
+            ConsoleLevel.INFO: self.info_check,
+            ConsoleLevel.WARNING: self.warning_check,
+            ConsoleLevel.ERROR: self.error_check,
+            ConsoleLevel.CRITICAL: self.critical_check,
+        }
+        """ The check box of every level the storm can log at """
+
+        self.start_btn.clicked.connect(self.on_start_btn_click)
+        QApplication.instance().aboutToQuit.connect(self.on_stop)
+
+    def on_start_btn_click(self) -> None:
+        """
+        Method for the start btn click, starts the storm or stops the running one.
+        """
+        if self.storm.running:
+            self.on_stop()
+            return
+        levels = [level for level, check in self.level_checks.items() if check.isChecked()]
+        if not levels:
+            print("Pick at least one level for the log storm", ConsoleLevel.WARNING)
+            return
+
+        self.frame_latency = RollingHistogram()
+        self._dropped_at_start = sum(dropped_log_records().values())
+        self._last_stats = (perf_counter(), 0, *console_render_counts())
+        self._last_frame = perf_counter()
+        self.storm.start(self.rate_spin.value(), self.threads_spin.value(), levels)
+        self._frame_timer.start()
+        self._stats_timer.start()
+        self.start_btn.setText("Stop")
+        print(
+            f"Log storm started, {self.rate_spin.value()} msgs/s from "
+            f"{self.threads_spin.value()} threads at {', '.join(level.name for level in levels)}"
+        )
+
+    def on_stop(self) -> None:
+        """
+        Method to stop the storm and show the final stats.
+        """
+        if not self.storm.running:
+            return
+        self.storm.stop()
+        self._frame_timer.stop()
+        self._stats_timer.stop()
+        self._update_stats()
+        self.start_btn.setText("Start")
+        print(f"Log storm stopped after {self.storm.sent} msgs")
+
+    def _on_frame(self) -> None:
+        """
+        Method run on every frame timer tick, records how late the tick came.
+        """
+        now = perf_counter()
+        self.frame_latency.record(max(0.0, (now - self._last_frame) * 1000 - FRAME_INTERVAL_MS))
+        self._last_frame = now
+
+    def _update_stats(self) -> None:
+        """
+        Method to show the throughput, drops, render rate and frame latency since the last update.
+        """
+        now = perf_counter()
+        flushes, rendered = console_render_counts()
+        last_time, last_sent, last_flushes, last_rendered = self._last_stats
+        elapsed = max(now - last_time, 1e-9)
+        sent = self.storm.sent
+        self._last_stats = (now, sent, flushes, rendered)
+
+        self.throughput_value.setText(
+            f"{(sent - last_sent) / elapsed:,.0f} msgs/s ({sent:,} total)"
+        )
+        self.dropped_value.setText(
+            f"{sum(dropped_log_records().values()) - self._dropped_at_start:,}"
+        )
+        self.render_value.setText(
+            f"{(flushes - last_flushes) / elapsed:,.1f} batches/s, "
+            f"{(rendered - last_rendered) / elapsed:,.0f} msgs/s"
+        )
+        self.frame_value.setText(
+            f"p50 {self.frame_latency.percentile(50):.1f}ms, "
+            f"p95 {self.frame_latency.percentile(95):.1f}ms, "
+            f"p99 {self.frame_latency.percentile(99):.1f}ms"
+        )
@@ -1,7 +1,7 @@
 # :Title: main.py
 # :Description: execute entire project in one spot
 # :Created: 5/30/2024
-# :Last Modified: 6/6/2024
+# :Last Modified: 10/19/2026
 # :Author: Robert Greenslade
 
 # Imports
@@ -9,11 +9,32 @@ import sys
 from argparse import ArgumentParser
 from os import system
 from pathlib import Path
+from statistics import median
+from time import perf_counter
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
+from backend.console_logging.console_logging import ConsoleLevel
 from middleware.console_output import log as print
-from middleware.console_output import set_debug_mode
+from middleware.console_output import (
+    flush_logs,
+    install_crash_handling,
+    load_log_config,
+    set_color_mode,
+    set_debug_mode,
+    stop_log_forwarding,
+)
+
+# Number of --nolaunch runs of a build whose median and best time are reported, a run exits before
+# QApplication is made so this measures process start, imports and argument parsing only
+STARTUP_SAMPLES = 5
+
+# Log output config loaded at startup when --log_config isn't given, next to main.py whatever the working folder
+DEFAULT_LOG_CONFIG = Path(__file__).resolve().parent.joinpath("log_sinks.toml")
+
+# How often the event loop hands control to python so exit signal handlers can run
+SIGNAL_POLL_MS = 250
 
 if __name__ == "__main__":
     # Command line arguments for development
@@ -21,9 +42,19 @@ if __name__ == "__main__":
     parser.add_argument(
         "--build", help="build project into an executable", action="store_true"
     )
+    parser.add_argument(
+        "--onedir",
+        help="build into a folder instead of a single self-extracting file (faster startup)",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--noclean",
+        help="reuse the cached pyinstaller analysis from the last build",
+        action="store_true",
+    )
     parser.add_argument(
         "--update_ui",
-        help="recreate compiled ui files from source ui",
+        help="recreate compiled ui files and the resource bundle from their sources",
         action="store_true",
     )
     parser.add_argument(
@@ -31,22 +62,89 @@ if __name__ == "__main__":
         help="allow debug msgs to be printed during execution",
         action="store_true",
     )
+    parser.add_argument(
+        "--color",
+        help="color the terminal output: auto only colors terminals, not files or pipes",
+        choices=["auto", "always", "never"],
+        default="auto",
+    )
+    parser.add_argument(
+        "--log_config",
+        help="json or toml file declaring the log outputs (default log_sinks.toml next to main.py if it exists)",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--watchdog",
+        help="log the gui thread stack when the event loop stalls longer than this many ms",
+        type=float,
+        metavar="THRESHOLD_MS",
+    )
+    parser.add_argument(
+        "--profile",
+        help="profile the whole gui session and write the stats to PATH on exit",
+        nargs="?",
+        const="profile.prof",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--memory",
+        help="turn on debug mode and report memory growth every SECONDS (default 30)",
+        nargs="?",
+        const=30.0,
+        type=float,
+        metavar="SECONDS",
+    )
+    parser.add_argument(
+        "--record",
+        help="record page clicks, resizes and splitter moves into PATH for benchmarks/ui_performance.py --replay",
+        metavar="PATH",
+    )
     parser.add_argument(
         "--nolaunch", help="Run main and exit before launching gui", action="store_true"
     )
     args = parser.parse_args()
 
+    # Log crashes and write out buffered logs on every way out
+    install_crash_handling()
+
+    log_config = Path(args.log_config or DEFAULT_LOG_CONFIG)
+    if args.log_config or log_config.exists():
+        load_log_config(log_config)
+    if args.color != "auto":
+        set_color_mode(args.color == "always")
+
     if args.build:
         print("Building Started")
-        system(
-            'pyinstaller --onefile main.py --specpath "build/" --distpath "build/dist" --noconfirm --clean'
-        )
+        build_command = 'pyinstaller main.py --specpath "build/" --distpath "build/dist" --noconfirm'
+        build_command += " --onedir" if args.onedir else " --onefile"
+        if not args.noclean:
+            build_command += " --clean"
+        system(build_command)
         print("Building Complete")
+
+        # Measure how long the produced executable takes to import and reach gui initialization
+        executable = Path("build", "dist")
+        if args.onedir:
+            executable = executable.joinpath("main")
+        executable = executable.joinpath("main.exe" if sys.platform == "win32" else "main")
+        if executable.exists():
+            startup_times = []
+            for _ in range(STARTUP_SAMPLES):
+                start = perf_counter()
+                system(f'"{executable}" --nolaunch')
+                startup_times.append(perf_counter() - start)
+            print(
+                f"Build time to gui initialization (--nolaunch, imports only): {median(startup_times):.3f}s median, "
+                f"{min(startup_times):.3f}s best over {STARTUP_SAMPLES} runs"
+            )
+        else:
+            print(f"Built executable not found at {executable}", ConsoleLevel.WARNING)
     if args.update_ui:
         print("Updating Started")
         system(f'python {Path("frontend").joinpath("ui", "recompile.py")}')
+        system(f'python {Path("frontend").joinpath("resources", "recompile.py")}')
         print("Updating Complete")
-    if args.debug:
+    if args.debug or args.memory:
         set_debug_mode(True)
         print("Debug Mode Active")
 
@@ -59,11 +157,75 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
 
-    # Initialize the entire frontend (import needs to be down here to avoid ui compile issues)
-    from frontend.frontend import Frontend
+    # Exit signals close the app like the window does, fatal signals dump the stacks to a crash file
+    install_crash_handling(app.quit, crash_file=True)
+    signal_timer = QTimer()
+    signal_timer.timeout.connect(lambda: None)
+    signal_timer.start(SIGNAL_POLL_MS)
+
+    # Watch for gui event loop stalls
+    if args.watchdog:
+        from backend.stall_watchdog.stall_watchdog import StallWatchdog
+
+        watchdog = StallWatchdog(args.watchdog)
+        watchdog.start()
+        app.aboutToQuit.connect(watchdog.stop)
+        print(f"Stall watchdog active, threshold {args.watchdog:g}ms")
+
+    # Trace allocations before the frontend loads
+    if args.memory:
+        from middleware.memory import start_memory_inspector, stop_memory_inspector
+
+        start_memory_inspector(args.memory)
+        app.aboutToQuit.connect(stop_memory_inspector)
+
+    # Show the splash right away, the frontend is imported in the background and swapped in
+    # (imports need to be down here to avoid ui compile issues)
+    from frontend.startup import StartupLoader
+    from frontend.widgets.splash_screen import SplashScreen
+
+    splash = SplashScreen()
+    splash.show()
+    app.processEvents()
+    loader = StartupLoader(splash)
+
+    # Record the session once the window exists
+    if args.record:
+        from frontend.performance.interaction_recorder import InteractionRecorder
 
-    frontend = Frontend()
-    frontend.show()
+        recorder = InteractionRecorder(Path(args.record))
+        loader.frontend_ready.connect(recorder.attach)
+        app.aboutToQuit.connect(recorder.save)
+
+    loader.start()
+
+    # Stop background work when the app closes
+    from middleware.async_tasks import stop_async_loop
+    from middleware.background_tasks import shutdown_tasks
+
+    app.aboutToQuit.connect(shutdown_tasks)
+    app.aboutToQuit.connect(stop_async_loop)
+    app.aboutToQuit.connect(stop_log_forwarding)
+
+    # Log the page switch latency of the session on exit
+    from frontend.performance.page_switch_metrics import log_page_switch_metrics
+
+    app.aboutToQuit.connect(log_page_switch_metrics)
+
+    # Log the result cache activity of the session on exit (debug mode)
+    from middleware.caching import log_cache_stats
+
+    app.aboutToQuit.connect(log_cache_stats)
+    app.aboutToQuit.connect(flush_logs)
+
+    # Profile the whole event loop session if requested
+    from middleware.profiling import start_profiling, stop_profiling
+
+    if args.profile:
+        start_profiling()
 
     # Start the event loop.
     app.exec()
+
+    if args.profile:
+        stop_profiling(Path(args.profile))
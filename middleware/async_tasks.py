@@ -0,0 +1,50 @@
+# :Title: async_tasks.py
+# :Description: additional middleware functions for awaiting backend coroutines from the gui
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from functools import wraps
+from typing import Callable, Coroutine
+
+from backend.async_loop.async_loop import AsyncLoop, BackendCall, GuiCoroutine
+
+
+def run_async(coro: Coroutine) -> BackendCall:
+    """
+    Wrapper method to run a backend coroutine on the asyncio loop, await the result inside an async_slot
+
+    Args:
+        coro (Coroutine): The backend coroutine to run
+
+    Returns:
+        BackendCall: Awaitable resolved with the result of the coroutine
+    """
+    return BackendCall(coro)
+
+
+def async_slot(fn: Callable) -> Callable:
+    """
+    Decorator that lets an async method be connected to Qt signals. The method runs on the
+    gui thread and can await run_async calls without blocking the ui.
+
+    Args:
+        fn (Callable): The async method or function
+
+    Returns:
+        Callable: Function that starts the coroutine and returns its GuiCoroutine
+    """
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs) -> GuiCoroutine:
+        return GuiCoroutine(fn(*args, **kwargs))
+
+    return wrapper
+
+
+def stop_async_loop() -> None:
+    """
+    Stops the asyncio loop thread
+    """
+    AsyncLoop.instance().stop()
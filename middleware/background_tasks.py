@@ -0,0 +1,51 @@
+# :Title: background_tasks.py
+# :Description: additional middleware functions for running work off the gui thread
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from typing import Any, Callable
+
+from backend.task_runner.task_runner import TaskHandle, TaskMode, TaskRunner
+
+
+def run_task(
+    fn: Callable,
+    *args,
+    mode: TaskMode = TaskMode.THREAD,
+    name: str = None,
+    on_result: Callable[[Any], None] = None,
+    on_error: Callable[[str], None] = None,
+    on_progress: Callable[[Any], None] = None,
+    **kwargs,
+) -> TaskHandle:
+    """
+    Wrapper method to run fn(context, *args, **kwargs) in the background. Every callback runs on the gui thread.
+
+    Args:
+        fn (Callable): The task, must be a module level function for TaskMode.PROCESS
+        mode (TaskMode, optional): Thread pool or process pool. Defaults to TaskMode.THREAD.
+        name (str, optional): Name used in the log msgs. Defaults to the function name.
+        on_result (Callable[[Any], None], optional): Called with the return value. Defaults to None.
+        on_error (Callable[[str], None], optional): Called with the traceback on failure. Defaults to None.
+        on_progress (Callable[[Any], None], optional): Called with each progress update. Defaults to None.
+
+    Returns:
+        TaskHandle: Handle to connect to and cancel the task with
+    """
+    handle = TaskRunner.instance().submit(fn, *args, mode=mode, name=name, **kwargs)
+    if on_result:
+        handle.finished.connect(on_result)
+    if on_error:
+        handle.failed.connect(on_error)
+    if on_progress:
+        handle.progress.connect(on_progress)
+    return handle
+
+
+def shutdown_tasks() -> None:
+    """
+    Cancels every background task and stops the worker pools
+    """
+    TaskRunner.instance().shutdown()
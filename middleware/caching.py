@@ -0,0 +1,40 @@
+# :Title: caching.py
+# :Description: additional middleware functions for the backend result caches
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from backend.console_logging.console_logging import ConsoleLevel
+from backend.result_cache.result_cache import all_caches
+from middleware.console_output import log as print
+
+
+def cache_stats() -> list[str]:
+    """
+    Gets the activity of every result cache
+
+    Returns:
+        list[str]: One line of entries, hits, misses, evictions and expirations per cache
+    """
+    return [cache.stats() for cache in all_caches()]
+
+
+def log_cache_stats() -> None:
+    """
+    Prints the activity of every result cache, only shows in debug mode
+    """
+    stats = cache_stats()
+    if stats:
+        print("Result caches:\n" + "\n".join(stats), ConsoleLevel.DEBUG)
+
+
+def clear_caches(disk: bool = False) -> None:
+    """
+    Drops the cached results of every result cache
+
+    Args:
+        disk (bool, optional): Also delete the files of the disk tiers. Defaults to False.
+    """
+    for cache in all_caches():
+        cache.clear(disk)
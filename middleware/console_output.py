@@ -1,15 +1,24 @@
 # :Title: console_output.py
 # :Description: additional middleware functions for console outputting
 # :Created: 5/31/2024
-# :Last Modified: 6/6/2024
+# :Last Modified: 10/19/2026
 # :Author: Robert Greenslade
 
 # Imports
+from pathlib import Path
 from sys import _getframe
+from typing import Callable
 
 from PySide6.QtCore import QObject
 
+from backend.console_export.console_export import export_console_history
 from backend.console_logging.console_logging import ConsoleLevel, ConsoleLogger
+from backend.crash_handling.crash_handling import CrashHandler
+from backend.log_context.log_context import bind_fields, current_fields
+from backend.log_follower.log_follower import LogFollower
+from backend.log_forwarding.log_forwarding import LogForwarder
+from backend.log_sinks.log_sinks import load_sink_configs
+from backend.task_runner.task_runner import TaskHandle, TaskRunner
 
 
 def log(msg: str, level: ConsoleLevel = ConsoleLevel.INFO) -> bool:
@@ -25,7 +34,7 @@ def log(msg: str, level: ConsoleLevel = ConsoleLevel.INFO) -> bool:
     """
     if level == ConsoleLevel.ERROR or level == ConsoleLevel.CRITICAL:
         msg = append_traceback(msg)
-    return ConsoleLogger().log(msg, level)
+    return ConsoleLogger.instance().log(msg, level)
 
 
 def append_traceback(msg: str) -> str:
@@ -46,6 +55,29 @@ def append_traceback(msg: str) -> str:
     return msg
 
 
+def install_crash_handling(quit_app: Callable[[], None] = None, crash_file: bool = False) -> None:
+    """
+    Logs unhandled exceptions at CRITICAL and flushes the logs on exit signals and crashes.
+    Calling it again only updates quit_app and opens the crash file if asked.
+
+    Args:
+        quit_app (Callable[[], None], optional): Closes the app on an exit signal. Defaults to None.
+        crash_file (bool, optional): Also dump the stacks to a file in crashes/ on fatal signals,
+            pass once the gui launches. Defaults to False.
+    """
+    handler = CrashHandler.instance()
+    handler.install(quit_app=quit_app)
+    if crash_file:
+        handler.open_crash_file()
+
+
+def flush_logs() -> None:
+    """
+    Writes out every buffered log output.
+    """
+    CrashHandler.instance().flush_logs()
+
+
 def set_debug_mode(debug_mode: bool) -> None:
     """
     Setter for the debug mode (adds debug to levels)
@@ -53,7 +85,90 @@ def set_debug_mode(debug_mode: bool) -> None:
     Args:
         debug_mode (bool): Whether debug mode is on or off
     """
-    ConsoleLogger().set_debug_mode(debug_mode)
+    ConsoleLogger.instance().set_debug_mode(debug_mode)
+
+
+def set_log_page(page: str) -> None:
+    """
+    Tags every msg logged from now on by the gui thread, and the tasks it starts, with the page
+
+    Args:
+        page (str): Name of the shown page
+    """
+    bind_fields(page=page)
+
+
+def log_page() -> str:
+    """
+    Gets the page the gui thread tags its msgs with
+
+    Returns:
+        str: Name of the page, None before the first page is shown
+    """
+    return current_fields().get("page")
+
+
+def show_log_fields(show: bool) -> None:
+    """
+    Shows or hides the contextual fields (page, task, thread and process) on the gui console
+
+    Args:
+        show (bool): Whether or not to show the fields
+    """
+    ConsoleLogger.instance().set_console_fields(show)
+
+
+def filter_console(fields: dict[str, str]) -> None:
+    """
+    Only shows msgs with matching contextual fields on the gui console from now on, saved logs keep everything
+
+    Args:
+        fields (dict[str, str]): Value by field name, empty to show every msg
+    """
+    ConsoleLogger.instance().set_console_filter(fields)
+
+
+def set_color_mode(color_mode: bool) -> None:
+    """
+    Setter for the color mode of the output streams
+
+    Args:
+        color_mode (bool): True to always color, False to never color, None to color only terminals
+    """
+    ConsoleLogger.instance().set_color_mode(color_mode)
+
+
+def load_log_config(path: Path) -> None:
+    """
+    Replaces the console outputs with the sinks declared in a json or toml config file
+
+    Args:
+        path (Path): The config file, see log_sinks.toml
+    """
+    ConsoleLogger.instance().set_sink_configs(load_sink_configs(path))
+
+
+def dropped_log_records() -> dict[str, int]:
+    """
+    Gets the number of msgs each output threw away under its drop policy
+
+    Returns:
+        dict[str, int]: Dropped msgs by sink name
+    """
+    return ConsoleLogger.instance().dropped_records()
+
+
+def console_render_counts() -> tuple[int, int]:
+    """
+    Gets how much the gui console has appended so far
+
+    Returns:
+        tuple[int, int]: (batches, msgs) appended since the console was set, (0, 0) without a console
+    """
+    bridge = ConsoleLogger.instance().bridge
+    if bridge is None:
+        return 0, 0
+    return bridge.flushes, bridge.rendered
 
 
 def set_console(console: QObject) -> None:
@@ -63,4 +178,55 @@ def set_console(console: QObject) -> None:
     Args:
         console (QObject): The console to echo the msgs to
     """
-    ConsoleLogger().set_console(console)
+    ConsoleLogger.instance().set_console(console)
+
+
+def save_log(path: Path, min_level: ConsoleLevel = ConsoleLevel.DEBUG) -> TaskHandle:
+    """
+    Saves the retained console history to a file on a background thread
+
+    Args:
+        path (Path): The file to write, gzip compressed if it ends in .gz
+        min_level (ConsoleLevel, optional): Lowest level to keep. Defaults to ConsoleLevel.DEBUG.
+
+    Returns:
+        TaskHandle: Handle of the running export
+    """
+    levels = {level for level in ConsoleLevel if level.value >= min_level.value}
+    return TaskRunner.instance().submit(
+        export_console_history, path, levels, name="Save log"
+    )
+
+
+def child_log_initializer() -> tuple:
+    """
+    Gets the initializer that makes child processes forward their msgs to this console.
+    Start the pool with the spawn context (mp_context=get_context("spawn")), the app runs too many
+    threads to fork safely.
+
+    Returns:
+        tuple: (initializer, initargs) for ProcessPoolExecutor or multiprocessing.Pool
+    """
+    return LogForwarder.instance().initializer()
+
+
+def stop_log_forwarding() -> None:
+    """
+    Logs any msgs still queued from child processes and stops receiving them
+    """
+    LogForwarder.instance().stop()
+
+
+def follow_log(path: Path) -> LogFollower:
+    """
+    Starts showing the lines other processes append to a log file on the console
+
+    Args:
+        path (Path): The log file to follow
+
+    Returns:
+        LogFollower: The running follower, call stop() on it to stop following
+    """
+    follower = LogFollower(path)
+    follower.start()
+    return follower
@@ -0,0 +1,60 @@
+# :Title: data_import.py
+# :Description: additional middleware functions for importing data files in the background
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from pathlib import Path
+from typing import Callable
+
+from backend.file_importer.file_importer import ImportProgress, import_binary, import_csv
+from backend.task_runner.task_runner import TaskHandle, TaskRunner
+from data.classes.column_store import ColumnStore
+
+STORE_SUFFIX = ".gbcol"
+""" Suffix of the column store files imports write by default """
+
+
+def import_file(
+    path: Path,
+    output: Path = None,
+    columns: list[tuple[str, str]] = None,
+    on_result: Callable[[ColumnStore], None] = None,
+    on_progress: Callable[[ImportProgress], None] = None,
+    on_error: Callable[[str], None] = None,
+    **options,
+) -> TaskHandle:
+    """
+    Imports a csv file, or a binary record file when columns are given, into a column store on a worker thread.
+    Call cancel() on the returned handle to stop the import, nothing is left behind.
+
+    Args:
+        path (Path): The file to import
+        output (Path, optional): The store file to write. Defaults to path with the .gbcol suffix.
+        columns (list[tuple[str, str]], optional): (name, typecode) of the fields of binary records. Defaults to None.
+        on_result (Callable[[ColumnStore], None], optional): Called with the mapped store. Defaults to None.
+        on_progress (Callable[[ImportProgress], None], optional): Called with each progress update. Defaults to None.
+        on_error (Callable[[str], None], optional): Called with the traceback on failure. Defaults to None.
+        options: delimiter, types and encoding for csv files, byte_order for binary files
+
+    Returns:
+        TaskHandle: Handle of the running import
+    """
+    path = Path(path)
+    output = Path(output) if output else path.with_suffix(STORE_SUFFIX)
+    if columns is None:
+        handle = TaskRunner.instance().submit(
+            import_csv, path, output, name=f"Import {path.name}", **options
+        )
+    else:
+        handle = TaskRunner.instance().submit(
+            import_binary, path, output, columns, name=f"Import {path.name}", **options
+        )
+    if on_result:
+        handle.finished.connect(lambda store_path: on_result(ColumnStore.load(store_path)))
+    if on_progress:
+        handle.progress.connect(on_progress)
+    if on_error:
+        handle.failed.connect(on_error)
+    return handle
@@ -0,0 +1,38 @@
+# :Title: memory.py
+# :Description: additional middleware functions for inspecting memory use
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from PySide6.QtCore import QObject
+
+from backend.memory_inspector.memory_inspector import MemoryInspector
+
+
+def start_memory_inspector(interval: float) -> None:
+    """
+    Starts tracing allocations and reporting memory growth through the console in debug mode
+
+    Args:
+        interval (float): Seconds between reports
+    """
+    MemoryInspector.instance().start(interval)
+
+
+def stop_memory_inspector() -> None:
+    """
+    Reports the growth since the inspector started and stops tracing
+    """
+    MemoryInspector.instance().stop()
+
+
+def track_memory(name: str, owner: QObject) -> None:
+    """
+    Includes a page widget in the per page memory accounting, does nothing until the inspector starts
+
+    Args:
+        name (str): Name shown in the report
+        owner (QObject): The page widget
+    """
+    MemoryInspector.instance().track(name, owner)
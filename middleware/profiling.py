@@ -0,0 +1,48 @@
+# :Title: profiling.py
+# :Description: additional middleware functions for profiling the running app
+# :Created: 10/19/2026
+# :Last Modified: 10/19/2026
+# :Author: Robert Greenslade
+
+# Imports
+from datetime import datetime
+from pathlib import Path
+
+from backend.profiling.profiling import SessionProfiler
+
+PROFILE_DIR = Path("profiles")
+""" Folder on demand profiling sessions are written to """
+
+
+def start_profiling() -> None:
+    """
+    Starts profiling the gui thread and worker threads
+    """
+    SessionProfiler.instance().start()
+
+
+def stop_profiling(path: Path = None) -> Path:
+    """
+    Stops profiling and writes the stats file
+
+    Args:
+        path (Path, optional): Where to write the stats. Defaults to a timestamped file in PROFILE_DIR.
+
+    Returns:
+        Path: The written stats file, None if profiling wasn't running
+    """
+    if path is None:
+        path = PROFILE_DIR.joinpath(
+            f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof"
+        )
+    return SessionProfiler.instance().stop(path)
+
+
+def is_profiling() -> bool:
+    """
+    Whether or not a profiling session is running
+
+    Returns:
+        bool: True while profiling
+    """
+    return SessionProfiler.instance().active